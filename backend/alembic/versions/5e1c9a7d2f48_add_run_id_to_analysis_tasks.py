@@ -0,0 +1,28 @@
+"""add_run_id_to_analysis_tasks
+
+Revision ID: 5e1c9a7d2f48
+Revises: bf2b3cf52963
+Create Date: 2026-10-17 10:12:44.183205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1c9a7d2f48'
+down_revision = 'bf2b3cf52963'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add run_id column (TradingAgents checkpoint thread) to analysis_tasks table
+    op.add_column('analysis_tasks', sa.Column('run_id', sa.String(64), nullable=True))
+    op.create_index('ix_analysis_tasks_run_id', 'analysis_tasks', ['run_id'])
+
+
+def downgrade() -> None:
+    # Remove run_id column
+    op.drop_index('ix_analysis_tasks_run_id', table_name='analysis_tasks')
+    op.drop_column('analysis_tasks', 'run_id')
@@ -47,6 +47,27 @@ async def get_analysis_task(
     return AnalysisTaskResponse.model_validate(task)
 
 
+@router.post("/{task_id}/retry", response_model=AnalysisTaskResponse)
+async def retry_analysis_task(
+    task_id: str,
+    background_tasks: BackgroundTasks,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: CurrentUser,
+):
+    """重试失败的分析任务（有检查点时从最后完成的节点继续）"""
+    task = await AnalysisService.get_task(db, task_id, str(current_user.id))
+
+    if not task:
+        raise HTTPException(status_code=404, detail="任务不存在")
+
+    if task.status != "failed":
+        raise HTTPException(status_code=400, detail="只能重试失败的任务")
+
+    background_tasks.add_task(run_analysis_task, str(task.id))
+
+    return AnalysisTaskResponse.model_validate(task)
+
+
 @router.get("/history", response_model=list[AnalysisTaskResponse])
 async def get_analysis_history(
     skip: int = Query(0, ge=0),
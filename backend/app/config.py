@@ -86,6 +86,21 @@ class Settings(BaseSettings):
         description="Celery Result Backend"
     )
 
+    # TradingAgents 检查点（失败任务可从最后完成的节点继续）
+    checkpoint_enabled: bool = Field(default=True, description="是否保存分析检查点")
+    checkpoint_database_url: Optional[str] = Field(
+        default=None, description="检查点 Postgres URL，默认由 database_url 推导"
+    )
+
+    # 分析引擎池
+    engine_pool_max_idle_per_key: int = Field(
+        default=2, description="每种引擎配置保留的空闲引擎数"
+    )
+    engine_pool_max_keys: int = Field(default=8, description="最多缓存的引擎配置数")
+    engine_pool_warmup: bool = Field(
+        default=False, description="启动时预先构建默认配置的分析引擎"
+    )
+
     # 日志配置
     log_level: str = Field(default="INFO", description="日志级别")
     log_file: str = Field(default="logs/app.log", description="日志文件")
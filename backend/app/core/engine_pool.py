@@ -0,0 +1,205 @@
+"""TradingAgentsGraph 引擎池
+
+构建一个 TradingAgentsGraph 需要创建两个 LLM 客户端、五个 FinancialSituationMemory
+（各自的 Chroma collection 和 OpenAI 客户端）、全部 ToolNode 并编译 StateGraph。
+引擎池按 (LLM 提供商/模型, 分析师组合, 辩论轮数) 缓存编译好的引擎，任务之间复用。
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYSTS = ["market", "social", "news", "fundamentals"]
+
+
+def engine_key(config: dict[str, Any], selected_analysts: list[str]) -> tuple:
+    """引擎复用的键：同一个键下的引擎结构完全相同"""
+    return (
+        config.get("llm_provider", "openai").lower(),
+        config.get("deep_think_llm"),
+        config.get("quick_think_llm"),
+        tuple(selected_analysts),
+        config.get("max_debate_rounds", 1),
+        config.get("max_risk_discuss_rounds", 1),
+    )
+
+
+def config_fingerprint(config: dict[str, Any]) -> str:
+    """完整配置的指纹，配置变化（如 backend_url、API Key）时旧引擎被回收"""
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class PooledEngine:
+    """池中的一个引擎及其统计信息"""
+
+    def __init__(self, graph: Any, fingerprint: str, build_seconds: float, generation: int):
+        self.graph = graph
+        self.fingerprint = fingerprint
+        self.generation = generation
+        self.build_seconds = build_seconds
+        self.created_at = time.time()
+        self.uses = 0
+        # 最近一次借出的情况
+        self.reused = False
+        self.setup_seconds = 0.0
+
+
+class EnginePool:
+    """进程级 TradingAgentsGraph 引擎池
+
+    任务通过 ``acquire`` 独占借出一个引擎，用完后归还。每次运行的状态由
+    ``propagate`` 自己保存，因此复用的引擎之间不会串数据。每个键最多保留
+    ``max_idle_per_key`` 个空闲引擎，最多保留 ``max_keys`` 个键（LRU 淘汰）。
+    """
+
+    def __init__(
+        self,
+        max_idle_per_key: int = 2,
+        max_keys: int = 8,
+        factory: Optional[Callable[[dict[str, Any], list[str]], Any]] = None,
+    ):
+        self.max_idle_per_key = max_idle_per_key
+        self.max_keys = max_keys
+        self._factory = factory or self._build_graph
+        self._idle: "OrderedDict[tuple, list[PooledEngine]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # recycle() 之后，借出中的旧引擎归还时直接丢弃
+        self._generation = 0
+        self._stats = {
+            "created": 0,
+            "reused": 0,
+            "recycled": 0,
+            "build_seconds_total": 0.0,
+            "last_setup_seconds": None,
+            "startup_seconds": None,
+        }
+
+    @staticmethod
+    def _build_graph(config: dict[str, Any], selected_analysts: list[str]) -> Any:
+        # 延迟导入，避免启动时就加载所有依赖
+        from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+        return TradingAgentsGraph(selected_analysts=selected_analysts, debug=False, config=config)
+
+    def _build(self, config: dict[str, Any], selected_analysts: list[str], fingerprint: str) -> PooledEngine:
+        start = time.perf_counter()
+        graph = self._factory(config, selected_analysts)
+        build_seconds = time.perf_counter() - start
+        with self._lock:
+            self._stats["created"] += 1
+            self._stats["build_seconds_total"] += build_seconds
+            generation = self._generation
+        logger.info(
+            "构建分析引擎 %s 用时 %.2fs", engine_key(config, selected_analysts), build_seconds
+        )
+        return PooledEngine(graph, fingerprint, build_seconds, generation)
+
+    def _checkout(self, key: tuple, fingerprint: str) -> Optional[PooledEngine]:
+        with self._lock:
+            engines = self._idle.get(key)
+            if not engines:
+                return None
+            self._idle.move_to_end(key)
+            # 配置已变化的空闲引擎直接回收
+            stale = [engine for engine in engines if engine.fingerprint != fingerprint]
+            if stale:
+                self._stats["recycled"] += len(stale)
+                engines[:] = [engine for engine in engines if engine.fingerprint == fingerprint]
+            if not engines:
+                return None
+            self._stats["reused"] += 1
+            return engines.pop()
+
+    def _checkin(self, key: tuple, engine: PooledEngine):
+        with self._lock:
+            engines = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if engine.generation != self._generation or len(engines) >= self.max_idle_per_key:
+                self._stats["recycled"] += 1
+            else:
+                engines.append(engine)
+            while len(self._idle) > self.max_keys:
+                _, dropped = self._idle.popitem(last=False)
+                self._stats["recycled"] += len(dropped)
+
+    @contextmanager
+    def acquire(
+        self, config: dict[str, Any], selected_analysts: Optional[list[str]] = None
+    ) -> Iterator[PooledEngine]:
+        """借出一个与配置匹配的引擎（没有空闲引擎时新建），退出时归还
+
+        Yields:
+            PooledEngine，``graph`` 为 TradingAgentsGraph 实例，
+            ``reused`` / ``setup_seconds`` 为本次借出是否复用及耗时
+        """
+        selected_analysts = list(selected_analysts or DEFAULT_ANALYSTS)
+        key = engine_key(config, selected_analysts)
+        fingerprint = config_fingerprint(config)
+
+        start = time.perf_counter()
+        engine = self._checkout(key, fingerprint)
+        reused = engine is not None
+        if engine is None:
+            engine = self._build(config, selected_analysts, fingerprint)
+        setup_seconds = time.perf_counter() - start
+        with self._lock:
+            self._stats["last_setup_seconds"] = setup_seconds
+        logger.info("分析引擎就绪（%s）用时 %.3fs", "复用" if reused else "新建", setup_seconds)
+
+        engine.uses += 1
+        engine.reused = reused
+        engine.setup_seconds = setup_seconds
+        try:
+            yield engine
+        finally:
+            self._checkin(key, engine)
+
+    def warm_up(self, config: dict[str, Any], selected_analysts: Optional[list[str]] = None) -> float:
+        """预先构建一个引擎放入池中，返回启动耗时（秒）"""
+        selected_analysts = list(selected_analysts or DEFAULT_ANALYSTS)
+        fingerprint = config_fingerprint(config)
+        start = time.perf_counter()
+        engine = self._build(config, selected_analysts, fingerprint)
+        self._checkin(engine_key(config, selected_analysts), engine)
+        startup_seconds = time.perf_counter() - start
+        with self._lock:
+            self._stats["startup_seconds"] = startup_seconds
+        logger.info("分析引擎池预热完成，用时 %.2fs", startup_seconds)
+        return startup_seconds
+
+    def recycle(self):
+        """回收全部空闲引擎（例如全局配置变更后）"""
+        with self._lock:
+            self._stats["recycled"] += sum(len(engines) for engines in self._idle.values())
+            self._idle.clear()
+            self._generation += 1
+
+    def stats(self) -> dict[str, Any]:
+        """引擎池统计：新建/复用/回收次数、构建耗时和空闲引擎数"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = {
+                "/".join("+".join(part) if isinstance(part, tuple) else str(part) for part in key): len(engines)
+                for key, engines in self._idle.items()
+            }
+        stats["avg_build_seconds"] = (
+            stats["build_seconds_total"] / stats["created"] if stats["created"] else None
+        )
+        return stats
+
+
+# 全局引擎池
+engine_pool = EnginePool(
+    max_idle_per_key=settings.engine_pool_max_idle_per_key,
+    max_keys=settings.engine_pool_max_keys,
+)
@@ -1,5 +1,7 @@
 """FastAPI 应用主入口"""
 
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,10 +10,13 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.config import settings
 from app.core.database import init_db, close_db
 from app.core.redis_client import init_redis, close_redis
+from app.core.engine_pool import engine_pool
 from app.middleware.error_handler import error_handler_middleware
 from app.middleware.logging_middleware import LoggingMiddleware
 from app.api.v1 import api_router
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -20,11 +25,21 @@ async def lifespan(app: FastAPI):
     await init_db()
     await init_redis()
 
+    if settings.engine_pool_warmup:
+        # 预热默认配置的分析引擎，失败不影响服务启动
+        from app.services.trading_service import TradingService
+
+        try:
+            await asyncio.to_thread(engine_pool.warm_up, TradingService._create_config({}))
+        except Exception as e:
+            logger.warning("分析引擎预热失败: %s", e)
+
     yield
 
     # 关闭时执行
     await close_db()
     await close_redis()
+    engine_pool.recycle()
 
 
 # 创建 FastAPI 应用
@@ -81,4 +96,5 @@ async def health_check():
     return {
         "status": "healthy",
         "version": settings.app_version,
+        "engine_pool": engine_pool.stats(),
     }
@@ -31,6 +31,9 @@ class AnalysisTask(Base):
     result: Mapped[dict | None] = mapped_column(JSON)
     error_message: Mapped[str | None] = mapped_column(Text)
 
+    # TradingAgents 检查点线程 ID，失败任务重试时从最后完成的节点继续
+    run_id: Mapped[str | None] = mapped_column(String(64), index=True)
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -40,6 +40,7 @@ class AnalysisTaskResponse(BaseModel):
     progress: int
     result: dict | None = None
     error_message: str | None = None
+    run_id: str | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -91,6 +91,28 @@ class AnalysisService:
 
         return task
 
+    @staticmethod
+    async def set_task_run_id(
+        db: AsyncSession,
+        task_id: str,
+        run_id: str,
+    ) -> AnalysisTask | None:
+        """记录任务的检查点线程 ID"""
+        result = await db.execute(
+            select(AnalysisTask).where(AnalysisTask.id == task_id)
+        )
+        task = result.scalar_one_or_none()
+
+        if not task:
+            return None
+
+        task.run_id = run_id
+
+        await db.commit()
+        await db.refresh(task)
+
+        return task
+
     @staticmethod
     async def update_task_result(
         db: AsyncSession,
@@ -23,18 +23,17 @@ class FinancialsService:
         try:
             import yfinance as yf
 
+            datasets = {
+                "income": "income_stmt",  # 年度利润表
+                "balance": "balance_sheet",  # 年度资产负债表
+                "cashflow": "cashflow",  # 年度现金流量表
+            }
+
             # 在线程池中运行同步代码
             def _fetch():
-                ticker = yf.Ticker(symbol)
-
-                if statement_type == "income":
-                    df = ticker.income_stmt  # 年度利润表
-                elif statement_type == "balance":
-                    df = ticker.balance_sheet  # 年度资产负债表
-                elif statement_type == "cashflow":
-                    df = ticker.cashflow  # 年度现金流量表
-                else:
+                if statement_type not in datasets:
                     return []
+                df = _load_statement(datasets[statement_type])
 
                 if df is None or df.empty:
                     return []
@@ -135,6 +134,14 @@ class FinancialsService:
 
                 return statements
 
+            def _load_statement(dataset):
+                """优先复用 tradingagents 的共享 ticker 会话，与分析工具共用同一次请求"""
+                try:
+                    from tradingagents.dataflows.yfin_session import get_ticker_dataset
+                except ImportError:
+                    return getattr(yf.Ticker(symbol), dataset)
+                return get_ticker_dataset(symbol, dataset)
+
             def _safe_decimal(value):
                 """安全转换为 Decimal"""
                 if value is None or (hasattr(value, "isna") and value.isna()):
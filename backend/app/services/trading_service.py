@@ -1,8 +1,11 @@
 """Trading analysis service - 包装 TradingAgents 核心逻辑"""
 
 import asyncio
+import importlib.util
 import json
 import os
+import re
+import time
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -11,6 +14,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.core.engine_pool import engine_pool
 from app.core.websocket_manager import websocket_manager
 from app.models.analysis import AnalysisTask
 from app.services.analysis_service import AnalysisService
@@ -47,10 +51,25 @@ class TradingService:
             "selected_analysts": parameters.get(
                 "selected_analysts", ["market", "social", "news", "fundamentals"]
             ),
+            # 辩论轮数
+            "max_debate_rounds": parameters.get("max_debate_rounds", 1),
+            "max_risk_discuss_rounds": parameters.get("max_risk_discuss_rounds", 1),
+            # 检查点配置：每个节点完成后保存状态，失败任务重试时从最后完成的节点继续
+            "checkpoint": {
+                "enabled": settings.checkpoint_enabled,
+                "backend": "postgres",
+                "postgres_url": TradingService._checkpoint_url(),
+            },
         }
 
         return config
 
+    @staticmethod
+    def _checkpoint_url() -> str:
+        """检查点使用的 Postgres URL（psycopg 格式，去掉 SQLAlchemy 驱动名）"""
+        url = settings.checkpoint_database_url or settings.database_url
+        return re.sub(r"^postgresql\+\w+://", "postgresql://", url)
+
     @staticmethod
     async def run_analysis(
         db: AsyncSession, task_id: UUID, user_id: UUID, parameters: dict[str, Any]
@@ -69,10 +88,17 @@ class TradingService:
                 - llm_provider: LLM 提供商（可选）
                 - deep_think_llm: 深度思考模型（可选）
                 - quick_think_llm: 快速思考模型（可选）
+                - run_id: 检查点线程 ID（可选，默认使用任务 ID）
+                - resume: 是否从上次失败的检查点继续（可选）
 
         Returns:
             分析结果字典
         """
+        # 记录检查点线程 ID，任务失败后可据此重试
+        parameters = dict(parameters)
+        parameters["run_id"] = parameters.get("run_id") or str(task_id)
+        await AnalysisService.set_task_run_id(db, task_id, parameters["run_id"])
+
         # 更新任务状态
         await AnalysisService.update_task_progress(
             db, task_id, progress=10, status="running"
@@ -144,12 +170,10 @@ class TradingService:
         Returns:
             分析结果
         """
-        # 延迟导入，避免启动时就加载所有依赖
-        try:
-            from tradingagents.graph.trading_graph import TradingAgentsGraph
-        except ImportError as e:
+        # 只检查包是否存在，不导入；引擎池借出引擎时才加载 TradingAgents
+        if importlib.util.find_spec("tradingagents") is None:
             return {
-                "error": f"TradingAgents 未安装或配置错误: {str(e)}",
+                "error": "TradingAgents 未安装或配置错误: 找不到 tradingagents 包",
                 "status": "failed",
             }
 
@@ -170,17 +194,26 @@ class TradingService:
         else:
             trade_date = date.today()
 
-        # 创建 TradingAgentsGraph 实例
         selected_analysts = parameters.get(
             "selected_analysts", ["market", "social", "news", "fundamentals"]
         )
 
-        graph = TradingAgentsGraph(
-            selected_analysts=selected_analysts, debug=False, config=config
-        )
-
-        # 运行分析
-        final_state, processed_signal = graph.propagate(company_name, trade_date)
+        run_id = parameters.get("run_id")
+
+        # 从引擎池借出预编译的 TradingAgentsGraph，没有匹配的空闲引擎时才新建
+        with engine_pool.acquire(config, selected_analysts) as engine:
+            graph = engine.graph
+            run_start = time.perf_counter()
+            resumed = bool(parameters.get("resume") and run_id and graph.has_checkpoint(run_id))
+            if resumed:
+                # 从最后完成的节点继续，已完成节点的 LLM 调用不再重复
+                final_state, processed_signal = graph.resume(run_id)
+            else:
+                # 运行分析
+                final_state, processed_signal = graph.propagate(
+                    company_name, trade_date, run_id=run_id
+                )
+            analysis_seconds = time.perf_counter() - run_start
 
         # 提取结果
         result = {
@@ -190,6 +223,13 @@ class TradingService:
             "processed_signal": processed_signal,
             "analyst_reports": {},
             "debate_results": {},
+            "run_id": run_id,
+            "resumed": resumed,
+            "timing": {
+                "engine_reused": engine.reused,
+                "engine_setup_seconds": round(engine.setup_seconds, 3),
+                "analysis_seconds": round(analysis_seconds, 3),
+            },
         }
 
         # 提取分析师报告
@@ -18,6 +18,9 @@ async def run_analysis_task(task_id: str | UUID):
         if not task:
             return
 
+        # 失败过的任务带着检查点重试，从最后完成的节点继续
+        resume_run_id = task.run_id if task.status == "failed" else None
+
         try:
             # 更新任务状态为运行中
             await AnalysisService.update_task_progress(db, task.id, 5, "running")
@@ -55,6 +58,10 @@ async def run_analysis_task(task_id: str | UUID):
                     "fundamentals",
                 ]
 
+            if resume_run_id:
+                parameters["run_id"] = resume_run_id
+                parameters["resume"] = True
+
             # 运行 TradingAgents 分析
             result = await TradingService.run_analysis(
                 db, task.id, task.user_id, parameters
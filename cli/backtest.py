@@ -0,0 +1,116 @@
+import json
+import os
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+backtest_app = typer.Typer(
+    name="backtest",
+    help="Walk-forward backtests of the trading graph over a ticker universe and date range",
+)
+
+
+def _print_summary(summary: dict):
+    from rich.table import Table
+
+    session = summary["session"]
+    table = Table(title="Stage timing")
+    table.add_column("Stage")
+    table.add_column("Count", justify="right")
+    table.add_column("Total s", justify="right")
+    table.add_column("Mean s", justify="right")
+    table.add_column("p50 s", justify="right")
+    table.add_column("Max s", justify="right")
+    for stage, timing in summary["stages"].items():
+        table.add_row(
+            stage,
+            str(timing["count"]),
+            f"{timing['total_seconds']:.1f}",
+            f"{timing['mean_seconds']:.1f}",
+            f"{timing['p50_seconds']:.1f}",
+            f"{timing['max_seconds']:.1f}",
+        )
+    console.print(table)
+    console.print(
+        f"{summary['runs']} run(s) logged, {summary['failed']} failed. Last session: "
+        f"{session['runs']} run(s) in {session['wall_seconds']:.0f}s at concurrency "
+        f"{session['max_concurrency']} = {session['runs_per_hour'] or 0:.1f} runs/hour"
+    )
+    strategy = summary["strategy"]
+    if strategy["realized_runs"]:
+        hit_rate = "n/a" if strategy["hit_rate"] is None else f"{strategy['hit_rate']:.0%}"
+        console.print(
+            f"{strategy['realized_runs']} realized decision(s): mean return "
+            f"{strategy['mean_return']:+.2%}, hit rate {hit_rate}"
+        )
+    console.print(f"Results: {summary['table']}")
+
+
+@backtest_app.command("run")
+def run_backtest(
+    tickers: List[str] = typer.Argument(..., help="Ticker universe"),
+    start_date: str = typer.Option(..., "--start", help="First trade date (YYYY-MM-DD)"),
+    end_date: str = typer.Option(..., "--end", help="Last trade date (YYYY-MM-DD)"),
+    output_dir: Optional[str] = typer.Option(
+        None, "--output-dir", help="Log and results directory; rerun with the same one to resume"
+    ),
+    max_concurrency: Optional[int] = typer.Option(None, "--concurrency", help="Runs in flight at once"),
+    holding_days: Optional[int] = typer.Option(
+        None, "--holding-days", help="Trading days from a decision to its realized return"
+    ),
+    step_days: Optional[int] = typer.Option(None, "--step-days", help="Business days between trade dates"),
+    walk_forward: Optional[bool] = typer.Option(
+        None, "--walk-forward/--no-walk-forward",
+        help="Hold back dates until earlier realized returns are reflected on",
+    ),
+    analysts: Optional[List[str]] = typer.Option(
+        None, "--analyst", help="Analyst to include (repeatable; default: all four)"
+    ),
+    llm_provider: Optional[str] = typer.Option(None, "--llm-provider"),
+    deep_think_llm: Optional[str] = typer.Option(None, "--deep-think-llm"),
+    quick_think_llm: Optional[str] = typer.Option(None, "--quick-think-llm"),
+):
+    """Backtest the graph on every ticker and trade date, resuming an interrupted run."""
+    from tradingagents.backtest import BacktestRunner
+    from tradingagents.default_config import DEFAULT_CONFIG
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+    config = DEFAULT_CONFIG.copy()
+    for key, value in (
+        ("llm_provider", llm_provider),
+        ("deep_think_llm", deep_think_llm),
+        ("quick_think_llm", quick_think_llm),
+    ):
+        if value:
+            config[key] = value
+
+    graph = TradingAgentsGraph(
+        selected_analysts=analysts or ["market", "social", "news", "fundamentals"],
+        config=config,
+    )
+    runner = BacktestRunner(
+        graph,
+        output_dir,
+        max_concurrency=max_concurrency,
+        holding_days=holding_days,
+        step_days=step_days,
+        walk_forward=walk_forward,
+    )
+    runner.run([ticker.upper() for ticker in tickers], start_date, end_date)
+    _print_summary(runner.summary)
+
+
+@backtest_app.command("report")
+def report_backtest(
+    output_dir: str = typer.Argument(..., help="Backtest output directory"),
+):
+    """Show the throughput, stage timing and returns of a finished backtest."""
+    path = os.path.join(output_dir, "summary.json")
+    if not os.path.exists(path):
+        console.print(f"[yellow]No backtest summary at {path}[/yellow]")
+        raise typer.Exit(1)
+    with open(path, "r") as f:
+        _print_summary(json.load(f))
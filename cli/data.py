@@ -0,0 +1,187 @@
+import os
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+
+from tradingagents.dataflows.config import set_config
+
+console = Console()
+
+data_app = typer.Typer(
+    name="data",
+    help="Build and maintain the local data stores used by the dataflows layer",
+)
+
+
+def _apply_data_dir(data_dir: Optional[str]):
+    if data_dir:
+        set_config({"data_dir": data_dir})
+
+
+@data_app.command("build-price-store")
+def build_price_store(
+    symbols: Optional[List[str]] = typer.Argument(
+        None, help="Symbols to convert (default: every CSV in the price data directory)"
+    ),
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", help="Override the TradingAgents data directory"
+    ),
+):
+    """Convert the local YFin price CSVs into the columnar, memory-mapped store."""
+    from tradingagents.dataflows.price_store import build_price_store, get_price_store_dir
+
+    _apply_data_dir(data_dir)
+    converted = build_price_store(symbols or None)
+    console.print(
+        f"[green]Converted {len(converted)} symbol(s) into {get_price_store_dir()}[/green]"
+    )
+
+
+@data_app.command("build-reddit-index")
+def build_reddit_index(
+    categories: Optional[List[str]] = typer.Argument(
+        None, help="Categories to index (default: every category folder)"
+    ),
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", help="Override the TradingAgents data directory"
+    ),
+):
+    """Index the Reddit JSONL corpus by UTC day so window queries skip the full parse."""
+    import os
+    from tradingagents.dataflows.config import get_config
+    from tradingagents.dataflows.reddit_index import build_reddit_index
+
+    _apply_data_dir(data_dir)
+    data_path = os.path.join(get_config()["data_dir"], "reddit_data")
+    indexed = build_reddit_index(data_path, categories or None)
+    console.print(f"[green]Indexed {len(indexed)} file(s) under {data_path}[/green]")
+
+
+@data_app.command("build-simfin-store")
+def build_simfin_store(
+    data_dir: Optional[str] = typer.Option(
+        None, "--data-dir", help="Override the TradingAgents data directory"
+    ),
+):
+    """Convert the SimFin statement CSVs into the pre-indexed fundamentals store."""
+    from tradingagents.dataflows.simfin_store import build_simfin_store
+
+    _apply_data_dir(data_dir)
+    converted = build_simfin_store()
+    console.print(f"[green]Converted {len(converted)} SimFin file(s)[/green]")
+
+
+cassette_app = typer.Typer(
+    name="cassette",
+    help="Merge, prune and inspect vendor record/replay cassettes",
+)
+data_app.add_typer(cassette_app, name="cassette")
+
+
+@cassette_app.command("inspect")
+def inspect_cassette(
+    path: Optional[str] = typer.Argument(None, help="Cassette directory (default: the configured one)"),
+):
+    """Show how many calls a cassette holds per method and vendor."""
+    from rich.table import Table
+    from tradingagents.dataflows.cassette import get_cassette_path, inspect_cassette
+
+    summary = inspect_cassette(path or get_cassette_path())
+    table = Table(title=summary["path"])
+    table.add_column("Method")
+    table.add_column("Vendor")
+    table.add_column("Calls", justify="right")
+    for method, vendors in sorted(summary["by_method"].items()):
+        for vendor, count in sorted(vendors.items()):
+            table.add_row(method, vendor, str(count))
+    console.print(table)
+    console.print(
+        f"{summary['calls']} call(s), {summary['errors']} recorded error(s), "
+        f"{summary['objects']} object(s), {summary['bytes'] / 1024:.1f} KiB"
+    )
+
+
+@cassette_app.command("merge")
+def merge_cassettes(
+    target: str = typer.Argument(..., help="Cassette directory to merge into"),
+    sources: List[str] = typer.Argument(..., help="Cassettes to merge; later ones win on conflicts"),
+):
+    """Merge several cassettes into one."""
+    from tradingagents.dataflows.cassette import merge_cassettes
+
+    count = merge_cassettes(sources, target)
+    console.print(f"[green]{target} now holds {count} call(s)[/green]")
+
+
+@cassette_app.command("prune")
+def prune_cassette(
+    path: Optional[str] = typer.Argument(None, help="Cassette directory (default: the configured one)"),
+    method: Optional[List[str]] = typer.Option(None, "--method", help="Drop recordings of this method"),
+    vendor: Optional[List[str]] = typer.Option(None, "--vendor", help="Drop recordings from this vendor"),
+    errors: bool = typer.Option(False, "--errors", help="Drop recorded vendor errors"),
+    older_than_days: Optional[float] = typer.Option(
+        None, "--older-than-days", help="Drop recordings older than this"
+    ),
+):
+    """Compact a cassette, dropping superseded and matching recordings and unused objects."""
+    from tradingagents.dataflows.cassette import get_cassette_path, prune_cassette
+
+    path = path or get_cassette_path()
+    result = prune_cassette(path, method or None, vendor or None, errors, older_than_days)
+    console.print(
+        f"[green]Kept {result['entries']} call(s); removed {result['removed_entries']} "
+        f"call(s) and {result['removed_objects']} object(s) from {path}[/green]"
+    )
+
+
+llm_cache_app = typer.Typer(
+    name="llm-cache",
+    help="Inspect and clear the persistent LLM response cache",
+)
+data_app.add_typer(llm_cache_app, name="llm-cache")
+
+
+def _open_llm_cache(path: Optional[str]):
+    from tradingagents.dataflows.config import get_config
+    from tradingagents.graph.llm_cache import LLMCache
+
+    config = get_config()
+    path = path or (config.get("llm_cache") or {}).get("path") or os.path.join(
+        config["data_cache_dir"], "llm_cache.sqlite"
+    )
+    if not os.path.exists(path):
+        console.print(f"[yellow]No LLM cache at {path}[/yellow]")
+        raise typer.Exit(1)
+    return LLMCache(path, max_size_mb=0)
+
+
+@llm_cache_app.command("inspect")
+def inspect_llm_cache(
+    path: Optional[str] = typer.Argument(None, help="Cache file (default: the configured one)"),
+):
+    """Show how many responses the cache holds per graph node."""
+    from rich.table import Table
+
+    cache = _open_llm_cache(path)
+    summary = cache.summary()
+    cache.close()
+    table = Table(title=summary["path"])
+    table.add_column("Node")
+    table.add_column("Responses", justify="right")
+    table.add_column("KiB", justify="right")
+    for node, counts in sorted(summary["by_node"].items()):
+        table.add_row(node or "-", str(counts["entries"]), f"{counts['bytes'] / 1024:.1f}")
+    console.print(table)
+    console.print(f"{summary['entries']} response(s), {summary['bytes'] / 1024:.1f} KiB")
+
+
+@llm_cache_app.command("clear")
+def clear_llm_cache(
+    path: Optional[str] = typer.Argument(None, help="Cache file (default: the configured one)"),
+):
+    """Delete every cached response."""
+    cache = _open_llm_cache(path)
+    cache.clear()
+    cache.close()
+    console.print(f"[green]Cleared {cache.path}[/green]")
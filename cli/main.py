@@ -28,6 +28,8 @@ from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
 from cli.utils import *
+from cli.data import data_app
+from cli.backtest import backtest_app
 
 console = Console()
 
@@ -36,6 +38,8 @@ app = typer.Typer(
     help="TradingAgents CLI: Multi-Agents LLM Financial Trading Framework",
     add_completion=True,  # Enable shell completion
 )
+app.add_typer(data_app, name="data")
+app.add_typer(backtest_app, name="backtest")
 
 
 # Create a deque to store recent messages with a maximum length
@@ -1100,6 +1104,13 @@ def run_analysis():
         update_display(layout)
 
 
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    # Keep `python -m cli.main` launching the interactive analysis
+    if ctx.invoked_subcommand is None:
+        run_analysis()
+
+
 @app.command()
 def analyze():
     run_analysis()
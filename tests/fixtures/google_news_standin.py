@@ -0,0 +1,130 @@
+"""Local HTTP stand-in for Google News search, serving recorded result pages.
+
+Point ``google_news.base_url`` (or a ``GoogleNewsScraper``'s settings) at a
+running ``RecordedNewsServer`` to exercise the scraper's pacing, caching,
+pagination and 429 retries without touching Google::
+
+    with RecordedNewsServer() as server:
+        scraper = GoogleNewsScraper({**DEFAULT_SETTINGS, "base_url": server.base_url, ...})
+        results = scraper.search("AAPL", "2024-11-01", "2024-11-08")
+    print(server.requests)  # (monotonic time, query, offset) per request served
+
+Pages are stored as ``<query>_<offset>.html``. The ones in
+``fixtures/google_news`` keep only the result markup the parser reads, with
+made-up headlines; ``record_pages`` saves real pages in the same layout. A
+missing page is served as an empty result page, which ends pagination.
+"""
+
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from tradingagents.dataflows.googlenews_utils import DEFAULT_SETTINGS, HEADERS, _to_query_date, make_request
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "google_news")
+
+EMPTY_PAGE = b"<html><body></body></html>"
+
+
+def page_filename(query: str, offset: int) -> str:
+    return f"{re.sub(r'[^A-Za-z0-9._-]+', '_', query)}_{offset}.html"
+
+
+def record_pages(
+    query: str, start_date: str, end_date: str, directory: str = PAGES_DIR, max_pages: int = 3
+) -> List[str]:
+    """Fetch result pages from Google and save them for the stand-in to serve."""
+    os.makedirs(directory, exist_ok=True)
+    start_date, end_date = _to_query_date(start_date), _to_query_date(end_date)
+    paths = []
+    for page in range(max_pages):
+        offset = page * 10
+        url = (
+            f"{DEFAULT_SETTINGS['base_url']}/search?q={query}"
+            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+            f"&tbm=nws&start={offset}"
+        )
+        response = make_request(url, HEADERS)
+        path = os.path.join(directory, page_filename(query, offset))
+        with open(path, "wb") as f:
+            f.write(response.content)
+        paths.append(path)
+        if b'id="pnnext"' not in response.content:
+            break
+    return paths
+
+
+class RecordedNewsServer:
+    """Serves recorded pages on ``127.0.0.1`` from a background thread.
+
+    Args:
+        directory: Folder of pages saved by ``record_pages`` (the recorded fixtures by default)
+        rate_limit_every: Answer every Nth request with a 429 (0: never)
+    """
+
+    def __init__(self, directory: str = PAGES_DIR, rate_limit_every: int = 0):
+        self.directory = directory
+        self.rate_limit_every = rate_limit_every
+        self.requests: List[Tuple[float, str, int]] = []
+        self.status_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _respond(self, path: str) -> Tuple[int, bytes]:
+        params = parse_qs(urlsplit(path).query)
+        query = params.get("q", [""])[0]
+        offset = int(params.get("start", ["0"])[0])
+        with self._lock:
+            self.requests.append((time.monotonic(), query, offset))
+            count = len(self.requests)
+        if self.rate_limit_every and count % self.rate_limit_every == 0:
+            return 429, b""
+        try:
+            with open(os.path.join(self.directory, page_filename(query, offset)), "rb") as f:
+                return 200, f.read()
+        except OSError:
+            return 200, EMPTY_PAGE
+
+    def start(self) -> "RecordedNewsServer":
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, body = stand_in._respond(self.path)
+                with stand_in._lock:
+                    stand_in.status_counts[status] = stand_in.status_counts.get(status, 0) + 1
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "RecordedNewsServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
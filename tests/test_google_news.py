@@ -0,0 +1,40 @@
+from fixtures.google_news_standin import RecordedNewsServer
+
+from tradingagents.dataflows.googlenews_utils import DEFAULT_SETTINGS, GoogleNewsScraper
+
+
+def make_scraper(server, tmp_path, **settings):
+    return GoogleNewsScraper({
+        **DEFAULT_SETTINGS,
+        "base_url": server.base_url,
+        "min_interval_seconds": 0.2,
+        "jitter_seconds": 0.0,
+        "max_results": None,
+        "cache_dir": str(tmp_path),
+        **settings,
+    })
+
+
+def test_scraper_paces_caches_and_stops_early(tmp_path):
+    with RecordedNewsServer() as server:
+        scraper = make_scraper(server, tmp_path)
+
+        # Every recorded page is fetched, one scheduled slot apart
+        results = scraper.search("AAPL", "2024-11-01", "2024-11-08")
+        assert [result["title"] for result in results] == [f"Apple headline {i}" for i in range(1, 31)]
+        assert [offset for _, _, offset in server.requests] == [0, 10, 20]
+        times = [at for at, _, _ in server.requests]
+        assert all(later - earlier >= 0.19 for earlier, later in zip(times, times[1:]))
+
+        # Parsed pages are served from the cache, in memory and on disk
+        assert scraper.search("AAPL", "2024-11-01", "2024-11-08") == results
+        assert make_scraper(server, tmp_path).search("AAPL", "2024-11-01", "2024-11-08") == results
+        assert len(server.requests) == 3
+
+        # Pagination stops once max_results are collected
+        server.requests.clear()
+        uncached = make_scraper(server, tmp_path, cache_ttl_seconds=0)
+        assert len(uncached.search("AAPL", "2024-11-01", "2024-11-08", max_results=15)) == 15
+        assert [offset for _, _, offset in server.requests] == [0, 10]
+
+    assert server.status_counts == {200: 5}
@@ -1,17 +1,18 @@
+import asyncio
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_research_manager(llm, memory):
-    def research_manager_node(state) -> dict:
+    def research_manager_prompt(state) -> str:
         history = state["investment_debate_state"].get("history", "")
         market_research_report = state["market_report"]
         sentiment_report = state["sentiment_report"]
         news_report = state["news_report"]
         fundamentals_report = state["fundamentals_report"]
 
-        investment_debate_state = state["investment_debate_state"]
-
         curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
         past_memories = memory.get_memories(curr_situation, n_matches=2)
 
@@ -36,7 +37,10 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        return prompt
+
+    def research_manager_update(state, response) -> dict:
+        investment_debate_state = state["investment_debate_state"]
 
         new_investment_debate_state = {
             "judge_decision": response.content,
@@ -52,4 +56,12 @@ Debate History:
             "investment_plan": response.content,
         }
 
-    return research_manager_node
+    def research_manager_node(state) -> dict:
+        return research_manager_update(state, llm.invoke(research_manager_prompt(state)))
+
+    async def aresearch_manager_node(state) -> dict:
+        # The memory lookup embeds the situation over a blocking client
+        prompt = await asyncio.to_thread(research_manager_prompt, state)
+        return research_manager_update(state, await llm.ainvoke(prompt))
+
+    return RunnableLambda(research_manager_node, afunc=aresearch_manager_node)
@@ -1,14 +1,16 @@
+import asyncio
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_risk_manager(llm, memory):
-    def risk_manager_node(state) -> dict:
+    def risk_manager_prompt(state) -> str:
 
         company_name = state["company_of_interest"]
 
         history = state["risk_debate_state"]["history"]
-        risk_debate_state = state["risk_debate_state"]
         market_research_report = state["market_report"]
         news_report = state["news_report"]
         fundamentals_report = state["news_report"]
@@ -42,8 +44,10 @@ Deliverables:
 ---
 
 Focus on actionable insights and continuous improvement. Build on past lessons, critically evaluate all perspectives, and ensure each decision advances better outcomes."""
+        return prompt
 
-        response = llm.invoke(prompt)
+    def risk_manager_update(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
 
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -63,4 +67,12 @@ Focus on actionable insights and continuous improvement. Build on past lessons,
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
+    def risk_manager_node(state) -> dict:
+        return risk_manager_update(state, llm.invoke(risk_manager_prompt(state)))
+
+    async def arisk_manager_node(state) -> dict:
+        # The memory lookup embeds the situation over a blocking client
+        prompt = await asyncio.to_thread(risk_manager_prompt, state)
+        return risk_manager_update(state, await llm.ainvoke(prompt))
+
+    return RunnableLambda(risk_manager_node, afunc=arisk_manager_node)
@@ -1,13 +1,14 @@
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+import asyncio
 import time
 import json
 
 
 def create_bear_researcher(llm, memory):
-    def bear_node(state) -> dict:
+    def bear_prompt(state) -> str:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
-        bear_history = investment_debate_state.get("bear_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -43,8 +44,12 @@ Last bull argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bear argument, refute the bull's claims, and engage in a dynamic debate that demonstrates the risks and weaknesses of investing in the stock. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
+        return prompt
 
-        response = llm.invoke(prompt)
+    def bear_update(state, response) -> dict:
+        investment_debate_state = state["investment_debate_state"]
+        history = investment_debate_state.get("history", "")
+        bear_history = investment_debate_state.get("bear_history", "")
 
         argument = f"Bear Analyst: {response.content}"
 
@@ -58,4 +63,12 @@ Use this information to deliver a compelling bear argument, refute the bull's cl
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bear_node
+    def bear_node(state) -> dict:
+        return bear_update(state, llm.invoke(bear_prompt(state)))
+
+    async def abear_node(state) -> dict:
+        # The memory lookup embeds the situation over a blocking client
+        prompt = await asyncio.to_thread(bear_prompt, state)
+        return bear_update(state, await llm.ainvoke(prompt))
+
+    return RunnableLambda(bear_node, afunc=abear_node)
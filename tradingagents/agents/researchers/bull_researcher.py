@@ -1,13 +1,14 @@
 from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+import asyncio
 import time
 import json
 
 
 def create_bull_researcher(llm, memory):
-    def bull_node(state) -> dict:
+    def bull_prompt(state) -> str:
         investment_debate_state = state["investment_debate_state"]
         history = investment_debate_state.get("history", "")
-        bull_history = investment_debate_state.get("bull_history", "")
 
         current_response = investment_debate_state.get("current_response", "")
         market_research_report = state["market_report"]
@@ -41,8 +42,12 @@ Last bear argument: {current_response}
 Reflections from similar situations and lessons learned: {past_memory_str}
 Use this information to deliver a compelling bull argument, refute the bear's concerns, and engage in a dynamic debate that demonstrates the strengths of the bull position. You must also address reflections and learn from lessons and mistakes you made in the past.
 """
+        return prompt
 
-        response = llm.invoke(prompt)
+    def bull_update(state, response) -> dict:
+        investment_debate_state = state["investment_debate_state"]
+        history = investment_debate_state.get("history", "")
+        bull_history = investment_debate_state.get("bull_history", "")
 
         argument = f"Bull Analyst: {response.content}"
 
@@ -56,4 +61,12 @@ Use this information to deliver a compelling bull argument, refute the bear's co
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
+    def bull_node(state) -> dict:
+        return bull_update(state, llm.invoke(bull_prompt(state)))
+
+    async def abull_node(state) -> dict:
+        # The memory lookup embeds the situation over a blocking client
+        prompt = await asyncio.to_thread(bull_prompt, state)
+        return bull_update(state, await llm.ainvoke(prompt))
+
+    return RunnableLambda(bull_node, afunc=abull_node)
@@ -1,10 +1,13 @@
+import asyncio
 import functools
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_trader(llm, memory):
-    def trader_node(state, name):
+    def trader_messages(state) -> list:
         company_name = state["company_of_interest"]
         investment_plan = state["investment_plan"]
         market_research_report = state["market_report"]
@@ -34,13 +37,24 @@ def create_trader(llm, memory):
             },
             context,
         ]
+        return messages
 
-        result = llm.invoke(messages)
-
+    def trader_update(result, name) -> dict:
         return {
             "messages": [result],
             "trader_investment_plan": result.content,
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
+    def trader_node(state, name):
+        return trader_update(llm.invoke(trader_messages(state)), name)
+
+    async def atrader_node(state, name):
+        # The memory lookup embeds the situation over a blocking client
+        messages = await asyncio.to_thread(trader_messages, state)
+        return trader_update(await llm.ainvoke(messages), name)
+
+    return RunnableLambda(
+        functools.partial(trader_node, name="Trader"),
+        afunc=functools.partial(atrader_node, name="Trader"),
+    )
@@ -61,6 +61,12 @@ class AgentState(MessagesState):
     ]
     fundamentals_report: Annotated[str, "Report from the Fundamentals Researcher"]
 
+    # per-analyst message channels, used when the analysts run as parallel branches
+    market_messages: Annotated[list, "Message history of the Market Analyst branch"]
+    social_messages: Annotated[list, "Message history of the Social Media Analyst branch"]
+    news_messages: Annotated[list, "Message history of the News Researcher branch"]
+    fundamentals_messages: Annotated[list, "Message history of the Fundamentals Researcher branch"]
+
     # researcher team discussion step
     investment_debate_state: Annotated[
         InvestDebateState, "Current state of the debate on if to invest or not"
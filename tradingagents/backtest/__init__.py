@@ -0,0 +1,14 @@
+# TradingAgents/backtest/__init__.py
+
+from .runner import BacktestRunner, get_backtest_settings
+from .store import BacktestStore
+from .returns import forward_return, load_closes, trade_dates
+
+__all__ = [
+    "BacktestRunner",
+    "BacktestStore",
+    "get_backtest_settings",
+    "forward_return",
+    "load_closes",
+    "trade_dates",
+]
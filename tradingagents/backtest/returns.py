@@ -0,0 +1,72 @@
+# TradingAgents/backtest/returns.py
+
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+# Position taken for each processed signal
+POSITIONS = {"BUY": 1, "SELL": -1, "HOLD": 0}
+
+
+def trade_dates(start_date: str, end_date: str, step_days: int = 1) -> List[str]:
+    """Business days from ``start_date`` to ``end_date`` inclusive, every ``step_days``."""
+    days = pd.bdate_range(start_date, end_date)[:: max(1, step_days)]
+    return [day.strftime("%Y-%m-%d") for day in days]
+
+
+def load_closes(symbol: str, config: Dict[str, Any]) -> pd.Series:
+    """Daily closes for ``symbol`` indexed by date, from the configured price vendor.
+
+    The ``local`` vendor reads the columnar price store; every other vendor
+    uses the yfinance OHLCV cache the indicators are computed from.
+    """
+    vendor = (config.get("data_vendors") or {}).get("core_stock_apis", "yfinance")
+    if vendor == "local":
+        from tradingagents.dataflows.price_store import get_price_table
+
+        frame = get_price_table(symbol).to_frame()
+    else:
+        from tradingagents.dataflows.ohlcv_cache import load_ohlcv
+
+        frame = load_ohlcv(symbol)
+
+    if frame.empty:
+        return pd.Series(dtype=float)
+    column = "Adj Close" if "Adj Close" in frame.columns else "Close"
+    closes = pd.Series(
+        frame[column].to_numpy(dtype=float),
+        index=pd.to_datetime(frame["Date"]).dt.normalize(),
+    )
+    return closes[~closes.index.duplicated(keep="last")].sort_index().dropna()
+
+
+def forward_return(closes: pd.Series, trade_date: str, holding_days: int) -> Dict[str, Optional[Any]]:
+    """Return from the close on ``trade_date`` (or the next session) to ``holding_days`` sessions later.
+
+    Fields are None when the price history does not reach the exit session yet.
+    """
+    outcome = {
+        "entry_date": None,
+        "entry_price": None,
+        "exit_date": None,
+        "exit_price": None,
+        "forward_return": None,
+    }
+    entry = int(closes.index.searchsorted(pd.Timestamp(trade_date)))
+    if entry >= len(closes):
+        return outcome
+    outcome["entry_date"] = closes.index[entry].strftime("%Y-%m-%d")
+    outcome["entry_price"] = float(closes.iloc[entry])
+
+    exit_ = entry + holding_days
+    if exit_ >= len(closes):
+        return outcome
+    outcome["exit_date"] = closes.index[exit_].strftime("%Y-%m-%d")
+    outcome["exit_price"] = float(closes.iloc[exit_])
+    outcome["forward_return"] = outcome["exit_price"] / outcome["entry_price"] - 1
+    return outcome
+
+
+def position_for(decision: Optional[str]) -> int:
+    """1 for BUY, -1 for SELL, 0 for HOLD or an unparsed decision."""
+    return POSITIONS.get((decision or "").strip().upper(), 0)
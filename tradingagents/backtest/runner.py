@@ -0,0 +1,346 @@
+# TradingAgents/backtest/runner.py
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .returns import forward_return, load_closes, position_for, trade_dates
+from .store import BacktestStore, reflection_state
+
+DEFAULT_SETTINGS = {
+    "max_concurrency": 4,
+    "holding_days": 5,
+    "step_days": 1,
+    "walk_forward": True,
+    "output_dir": None,
+}
+
+
+def get_backtest_settings(config: Dict[str, Any]) -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(config.get("backtest") or {})
+    return settings
+
+
+def default_output_dir(config: Dict[str, Any], tickers: Sequence[str], start_date: str, end_date: str) -> str:
+    return os.path.join(
+        config["results_dir"], "backtests", f"{'-'.join(tickers)}_{start_date}_{end_date}"
+    )
+
+
+def _describe(seconds: List[float]) -> Dict[str, float]:
+    values = pd.Series(seconds, dtype=float)
+    return {
+        "count": int(values.size),
+        "total_seconds": float(values.sum()),
+        "mean_seconds": float(values.mean()),
+        "p50_seconds": float(values.median()),
+        "max_seconds": float(values.max()),
+    }
+
+
+class BacktestRunner:
+    """Walk-forward backtest of a ``TradingAgentsGraph`` over a ticker universe and date range.
+
+    Each ``(ticker, trade_date)`` is one ``apropagate`` call; up to
+    ``max_concurrency`` of them share the graph on one event loop. A run's
+    decision earns the return from the trade date's close to ``holding_days``
+    sessions later (long for BUY, short for SELL, flat for HOLD), and the graph
+    reflects on that return in date order per ticker.
+
+    In walk-forward mode a date only starts once every earlier run whose
+    return was realized by then has finished and been reflected on, so
+    memories hold every return known on the date being decided and none
+    from after it. Runs whose holding windows overlap have no such
+    dependency and run concurrently, up to ``max_concurrency``. With
+    ``walk_forward=False`` every run is scheduled at once and the
+    reflections follow at the end.
+
+    Every decision and the state needed to reflect on it are appended to
+    ``runs.jsonl`` in the output directory as soon as the run finishes.
+    Running the same backtest again skips finished runs, retries failed
+    ones (resuming from their checkpoint when the graph keeps checkpoints),
+    and first replays the earlier reflections, since memories live only as
+    long as the process.
+    """
+
+    def __init__(self, graph, output_dir: Optional[str] = None, **settings):
+        """
+        Args:
+            graph: TradingAgentsGraph to run
+            output_dir: Where the log, results table and summary go
+            **settings: Overrides for ``config["backtest"]`` (max_concurrency,
+                holding_days, step_days, walk_forward)
+        """
+        self.graph = graph
+        self.settings = get_backtest_settings(graph.config)
+        self.settings.update({key: value for key, value in settings.items() if value is not None})
+        self.settings["holding_days"] = max(1, int(self.settings["holding_days"]))
+        self.output_dir = output_dir or self.settings["output_dir"]
+        self.store = None
+        self.summary = None
+        # Reflections already in this graph's memories
+        self._remembered = set()
+
+    @contextlib.contextmanager
+    def _timed(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage].append(time.perf_counter() - start)
+
+    def run(self, tickers: Sequence[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """Blocking ``arun``; must not be called from a running event loop."""
+        return asyncio.run(self.arun(tickers, start_date, end_date))
+
+    async def arun(self, tickers: Sequence[str], start_date: str, end_date: str) -> pd.DataFrame:
+        """Backtest every ticker on every trade date from ``start_date`` to ``end_date``.
+
+        Returns the results table, one row per ``(ticker, trade_date)`` with
+        the decision and its realized forward return. The table is also
+        written to the output directory, next to ``summary.json``.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        self.store = BacktestStore(
+            self.output_dir or default_output_dir(self.graph.config, tickers, start_date, end_date)
+        )
+        loaded = self.store.load()
+        self._check_sessions(loaded["sessions"])
+        self.store.append({
+            "type": "session",
+            "tickers": tickers,
+            "start_date": start_date,
+            "end_date": end_date,
+            "holding_days": self.settings["holding_days"],
+            "step_days": self.settings["step_days"],
+            "walk_forward": self.settings["walk_forward"],
+            "max_concurrency": self.settings["max_concurrency"],
+            "started_at": time.time(),
+        })
+
+        self.timings = defaultdict(list)
+        self.session = {"runs": 0, "failed": 0, "reflections": 0}
+        session_start = time.perf_counter()
+
+        dates = trade_dates(start_date, end_date, self.settings["step_days"])
+        with self._timed("prices"):
+            series = await asyncio.gather(
+                *(asyncio.to_thread(load_closes, ticker, self.graph.config) for ticker in tickers)
+            )
+        closes = dict(zip(tickers, series))
+        outcomes = {
+            (ticker, trade_date): forward_return(closes[ticker], trade_date, self.settings["holding_days"])
+            for ticker in tickers
+            for trade_date in dates
+        }
+
+        await self._replay_reflections(loaded, outcomes)
+
+        total = len(outcomes)
+        semaphore = asyncio.Semaphore(max(1, self.settings["max_concurrency"]))
+        started = {}
+        for trade_date in dates:
+            # Wait only for the earlier dates with a return realized by this one
+            await asyncio.gather(*(started[earlier] for earlier in self._dependencies(trade_date, outcomes)))
+            await self._reflect_due(loaded, outcomes, pd.Timestamp(trade_date))
+            todo = [(ticker, trade_date) for ticker in tickers if (ticker, trade_date) not in loaded["runs"]]
+            started[trade_date] = asyncio.ensure_future(self._run_batch(todo, loaded, total, semaphore))
+        await asyncio.gather(*started.values())
+        await self._reflect_due(loaded, outcomes, None)
+
+        results = self._results(loaded, outcomes)
+        table_path = self.store.write_table(results)
+        self.summary = self._summarize(results, table_path, time.perf_counter() - session_start)
+        with open(os.path.join(self.store.output_dir, "summary.json"), "w") as f:
+            json.dump(self.summary, f, indent=4)
+        print(
+            f"Backtest finished: {self.session['runs']} run(s) in "
+            f"{self.summary['session']['wall_seconds']:.0f}s "
+            f"({self.summary['session']['runs_per_hour'] or 0:.1f} runs/hour), "
+            f"{self.session['failed']} failed; results in {table_path}"
+        )
+        return results
+
+    def _check_sessions(self, sessions: List[Dict[str, Any]]):
+        """Refuse to extend a log written with a different holding period."""
+        for session in sessions:
+            if session.get("holding_days") != self.settings["holding_days"]:
+                raise ValueError(
+                    f"{self.store.path} was written with holding_days={session.get('holding_days')}; "
+                    f"use another output directory for holding_days={self.settings['holding_days']}"
+                )
+
+    def _dependencies(self, trade_date: str, outcomes: Dict[Tuple[str, str], Any]) -> List[str]:
+        """Earlier dates with a run whose return is realized by ``trade_date``.
+
+        Their runs have to finish, and be reflected on, before ``trade_date``
+        starts. The set only grows with the date, so scheduling dates in order
+        never holds back one that could already run.
+        """
+        if not self.settings["walk_forward"]:
+            return []
+        day = pd.Timestamp(trade_date)
+        return sorted({
+            earlier
+            for (_, earlier), outcome in outcomes.items()
+            if earlier < trade_date
+            and outcome["exit_date"] is not None
+            and pd.Timestamp(outcome["exit_date"]) <= day
+        })
+
+    async def _run_batch(
+        self, todo: List[Tuple[str, str]], loaded: Dict[str, Any], total: int, semaphore: asyncio.Semaphore
+    ):
+        async def run_one(ticker, trade_date):
+            queued = time.perf_counter()
+            async with semaphore:
+                self.timings["queued"].append(time.perf_counter() - queued)
+                await self._run_one(ticker, trade_date, loaded, total)
+
+        await asyncio.gather(*(run_one(ticker, trade_date) for ticker, trade_date in todo))
+
+    async def _run_one(self, ticker: str, trade_date: str, loaded: Dict[str, Any], total: int):
+        run_id = f"backtest-{ticker}-{trade_date}" if self.graph.checkpointer is not None else None
+        start = time.perf_counter()
+        resumed = False
+        try:
+            if run_id is not None and await asyncio.to_thread(self.graph.has_checkpoint, run_id):
+                resumed = True
+                final_state, decision = await self.graph.aresume(run_id)
+            else:
+                final_state, decision = await self.graph.apropagate(ticker, trade_date, run_id=run_id)
+        except Exception as e:
+            seconds = time.perf_counter() - start
+            record = {
+                "type": "error",
+                "ticker": ticker,
+                "trade_date": trade_date,
+                "error": f"{type(e).__name__}: {e}",
+                "run_seconds": seconds,
+            }
+            self.store.append(record)
+            loaded["errors"][(ticker, trade_date)] = record
+            self.session["failed"] += 1
+            print(f"Backtest run {ticker} {trade_date} failed after {seconds:.0f}s: {record['error']}")
+            return
+
+        seconds = time.perf_counter() - start
+        self.timings["propagate"].append(seconds)
+        record = {
+            "type": "run",
+            "ticker": ticker,
+            "trade_date": trade_date,
+            "decision": decision,
+            "run_seconds": seconds,
+            "resumed": resumed,
+            "finished_at": time.time(),
+            "state": reflection_state(final_state),
+            "metrics": final_state.get("metrics"),
+        }
+        self.store.append(record)
+        loaded["runs"][(ticker, trade_date)] = record
+        loaded["errors"].pop((ticker, trade_date), None)
+        self.session["runs"] += 1
+        print(f"[{len(loaded['runs'])}/{total}] {ticker} {trade_date}: {decision} ({seconds:.0f}s)")
+
+    def _position_return(self, record: Dict[str, Any], outcome: Dict[str, Any]) -> float:
+        return position_for(record["decision"]) * outcome["forward_return"]
+
+    async def _reflect_due(self, loaded: Dict[str, Any], outcomes: Dict[Tuple[str, str], Any], cutoff):
+        """Reflect, in date order, on finished runs whose return is realized by ``cutoff`` (all if None)."""
+        due = [
+            key
+            for key, record in loaded["runs"].items()
+            if key in outcomes
+            and key not in loaded["reflections"]
+            and outcomes[key]["exit_date"] is not None
+            and (cutoff is None or pd.Timestamp(outcomes[key]["exit_date"]) <= cutoff)
+        ]
+        for ticker, trade_date in sorted(due, key=lambda key: (key[1], key[0])):
+            record = loaded["runs"][(ticker, trade_date)]
+            returns = self._position_return(record, outcomes[(ticker, trade_date)])
+            with self._timed("reflect"):
+                await asyncio.to_thread(self.graph.reflect_and_remember, returns, record["state"])
+            reflection = {"type": "reflection", "ticker": ticker, "trade_date": trade_date, "returns": returns}
+            self.store.append(reflection)
+            loaded["reflections"][(ticker, trade_date)] = reflection
+            self._remembered.add((ticker, trade_date))
+            self.session["reflections"] += 1
+
+    async def _replay_reflections(self, loaded: Dict[str, Any], outcomes: Dict[Tuple[str, str], Any]):
+        """Rebuild the memories of an interrupted backtest from its logged reflections."""
+        replay = [
+            key
+            for key in loaded["reflections"]
+            if key in loaded["runs"] and key not in self._remembered
+        ]
+        if not replay:
+            return
+        print(f"Replaying {len(replay)} reflection(s) from {self.store.path}")
+        for key in sorted(replay, key=lambda key: (key[1], key[0])):
+            with self._timed("replay"):
+                await asyncio.to_thread(
+                    self.graph.reflect_and_remember,
+                    loaded["reflections"][key]["returns"],
+                    loaded["runs"][key]["state"],
+                )
+            self._remembered.add(key)
+
+    def _results(self, loaded: Dict[str, Any], outcomes: Dict[Tuple[str, str], Any]) -> pd.DataFrame:
+        rows = []
+        for (ticker, trade_date), outcome in outcomes.items():
+            record = loaded["runs"].get((ticker, trade_date))
+            error = loaded["errors"].get((ticker, trade_date))
+            if record is None and error is None:
+                continue
+            row = {"ticker": ticker, "trade_date": trade_date}
+            row["decision"] = record["decision"] if record else None
+            row["position"] = position_for(row["decision"]) if record else None
+            row.update(outcome)
+            row["strategy_return"] = (
+                self._position_return(record, outcome)
+                if record and outcome["forward_return"] is not None
+                else None
+            )
+            row["run_seconds"] = (record or error)["run_seconds"]
+            row["resumed"] = bool(record and record.get("resumed"))
+            row["reflected"] = (ticker, trade_date) in loaded["reflections"]
+            row["error"] = error["error"] if error and not record else None
+            rows.append(row)
+        return pd.DataFrame(rows, columns=[
+            "ticker", "trade_date", "decision", "position",
+            "entry_date", "entry_price", "exit_date", "exit_price",
+            "forward_return", "strategy_return",
+            "run_seconds", "resumed", "reflected", "error",
+        ])
+
+    def _summarize(self, results: pd.DataFrame, table_path: str, wall_seconds: float) -> Dict[str, Any]:
+        realized = results.dropna(subset=["strategy_return"])
+        traded = realized[realized["position"] != 0]
+        return {
+            "output_dir": self.store.output_dir,
+            "table": table_path,
+            "runs": int(results["decision"].notna().sum()),
+            "failed": int(results["error"].notna().sum()),
+            "session": {
+                "runs": self.session["runs"],
+                "failed": self.session["failed"],
+                "reflections": self.session["reflections"],
+                "wall_seconds": wall_seconds,
+                "runs_per_hour": self.session["runs"] * 3600 / wall_seconds if wall_seconds else None,
+                "max_concurrency": self.settings["max_concurrency"],
+            },
+            "stages": {stage: _describe(seconds) for stage, seconds in self.timings.items() if seconds},
+            "strategy": {
+                "realized_runs": int(len(realized)),
+                "mean_return": float(realized["strategy_return"].mean()) if len(realized) else None,
+                "hit_rate": float((traded["strategy_return"] > 0).mean()) if len(traded) else None,
+            },
+        }
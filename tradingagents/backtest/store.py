@@ -0,0 +1,98 @@
+# TradingAgents/backtest/store.py
+
+import json
+import os
+import threading
+from typing import Any, Dict
+
+import pandas as pd
+
+# State fields the Reflector reads; enough to replay a reflection after a restart
+REFLECTION_FIELDS = (
+    "company_of_interest",
+    "trade_date",
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "trader_investment_plan",
+    "investment_plan",
+    "final_trade_decision",
+)
+
+
+def reflection_state(final_state: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of a run's final state that ``reflect_and_remember`` needs."""
+    state = {field: final_state.get(field, "") for field in REFLECTION_FIELDS}
+    debate = final_state.get("investment_debate_state") or {}
+    risk = final_state.get("risk_debate_state") or {}
+    state["investment_debate_state"] = {
+        "bull_history": debate.get("bull_history", ""),
+        "bear_history": debate.get("bear_history", ""),
+        "judge_decision": debate.get("judge_decision", ""),
+    }
+    state["risk_debate_state"] = {"judge_decision": risk.get("judge_decision", "")}
+    return state
+
+
+class BacktestStore:
+    """Append-only JSONL log of one backtest in ``output_dir/runs.jsonl``.
+
+    Every finished run, failed run, reflection and session is one line,
+    written as soon as it happens, so an interrupted backtest resumes from
+    the log. A line cut short by the interruption is skipped on load.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, "runs.jsonl")
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def append(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def records(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def load(self) -> Dict[str, Any]:
+        """Latest run, reflection and failure per ``(ticker, trade_date)``, plus the sessions."""
+        loaded = {"runs": {}, "reflections": {}, "errors": {}, "sessions": []}
+        for record in self.records():
+            kind = record.get("type")
+            if kind == "session":
+                loaded["sessions"].append(record)
+                continue
+            key = (record.get("ticker"), record.get("trade_date"))
+            if kind == "run":
+                loaded["runs"][key] = record
+                loaded["errors"].pop(key, None)
+            elif kind == "error":
+                loaded["errors"][key] = record
+            elif kind == "reflection":
+                loaded["reflections"][key] = record
+        return loaded
+
+    def write_table(self, frame: pd.DataFrame, name: str = "results") -> str:
+        """Write ``frame`` as Parquet, or CSV when the optional pyarrow is not installed."""
+        path = os.path.join(self.output_dir, f"{name}.parquet")
+        try:
+            frame.to_parquet(path, index=False)
+            return path
+        except ImportError:
+            path = os.path.join(self.output_dir, f"{name}.csv")
+            print(f"No Parquet engine installed (see the parquet extra); writing {path} instead")
+        frame.to_csv(path, index=False)
+        return path
@@ -1,12 +1,33 @@
 import os
+import threading
 import requests
 import pandas as pd
 import json
 from datetime import datetime
 from io import StringIO
+from requests.adapters import HTTPAdapter
+
+from .rate_limiter import RateLimitTimeout, acquire, key_fingerprint
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """Process-wide keep-alive session used for every Alpha Vantage request."""
+    global _session, _session_pid
+    with _session_lock:
+        # Forked workers must not share the parent's sockets
+        if _session is None or _session_pid != os.getpid():
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session, _session_pid = session, os.getpid()
+        return _session
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -63,7 +84,15 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
     
-    response = requests.get(API_BASE_URL, params=api_params)
+    # Wait for a slot in this key's request budget rather than burning a throttled call
+    try:
+        acquire("alpha_vantage", api_params["apikey"])
+    except RateLimitTimeout as e:
+        raise AlphaVantageRateLimitError(
+            f"Alpha Vantage client-side rate limit for key {key_fingerprint(api_params['apikey'])}: {e}"
+        ) from e
+
+    response = get_session().get(API_BASE_URL, params=api_params, timeout=30)
     response.raise_for_status()
 
     response_text = response.text
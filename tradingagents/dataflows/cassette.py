@@ -0,0 +1,269 @@
+"""Record/replay of vendor responses for network-free runs.
+
+With ``cassette.mode`` set to ``record``, every vendor implementation called by
+``route_to_vendor`` runs as usual. Its return value, or the exception it
+raised, is then written to a cassette directory. In ``replay`` mode the same
+calls are answered from the cassette without touching the network, and a call
+that was never recorded raises ``CassetteMissError`` instead of going live.
+
+A cassette is a directory holding:
+
+- ``objects/ab/<sha256>.z``: zlib-compressed pickled responses, named by the
+  hash of their content so identical responses are stored once.
+- ``index.jsonl``: one line per recorded call. Each line carries the call key
+  (method, vendor, implementation and normalized arguments) and the object it
+  resolves to. Later lines win, so re-recording a call supersedes it.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .config import get_config
+from .result_cache import normalize_args
+from .utils import atomic_write, file_lock
+
+MODES = ("off", "record", "replay")
+INDEX_FILE = "index.jsonl"
+OBJECTS_DIR = "objects"
+
+
+class CassetteMissError(Exception):
+    """A replayed call has no recording. Never treated as a vendor failure."""
+
+
+def get_cassette_path() -> str:
+    settings = get_config().get("cassette") or {}
+    return settings.get("path") or os.path.join(get_config()["data_cache_dir"], "cassettes", "default")
+
+
+def get_cassette_mode() -> str:
+    mode = (get_config().get("cassette") or {}).get("mode") or "off"
+    if mode not in MODES:
+        raise ValueError(f"Unknown cassette mode '{mode}'. Choose from: {list(MODES)}")
+    return mode
+
+
+def call_key(method: str, vendor: str, impl_func: Callable, args: tuple, kwargs: dict) -> str:
+    normalized = normalize_args(impl_func, args, kwargs)
+    payload = json.dumps(
+        [method, vendor, getattr(impl_func, "__name__", str(impl_func)), normalized],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _encode_error(error: BaseException):
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
+
+
+class Cassette:
+    """One cassette directory: a content-addressed object store plus its index."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = os.path.join(path, INDEX_FILE)
+        self._entries = None
+        self._index_mtime = None
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.path, OBJECTS_DIR, digest[:2], f"{digest}.z")
+
+    def entries(self) -> Dict[str, dict]:
+        """Latest index entry per call key, reloaded when the index file changes."""
+        with self._lock:
+            mtime = os.path.getmtime(self.index_path) if os.path.exists(self.index_path) else None
+            if self._entries is None or mtime != self._index_mtime:
+                self._entries = {entry["key"]: entry for entry in read_index(self.index_path)}
+                self._index_mtime = mtime
+            return self._entries
+
+    def write_object(self, response) -> str:
+        data = zlib.compress(pickle.dumps(response, protocol=4), 6)
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            with atomic_write(path, mode="wb") as f:
+                f.write(data)
+        return digest
+
+    def read_object(self, digest: str):
+        with open(self._object_path(digest), "rb") as f:
+            return pickle.loads(zlib.decompress(f.read()))
+
+    def record(self, key: str, method: str, vendor: str, impl_name: str, normalized: dict, response):
+        entry = {
+            "key": key,
+            "method": method,
+            "vendor": vendor,
+            "impl": impl_name,
+            "args": json.loads(json.dumps(normalized, default=str)),
+            "object": self.write_object(response),
+            "error": response[0] == "error",
+            "recorded_at": time.time(),
+        }
+        os.makedirs(self.path, exist_ok=True)
+        with file_lock(f"{self.index_path}.lock"):
+            with open(self.index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        with self._lock:
+            if self._entries is not None:
+                self._entries[key] = entry
+                self._index_mtime = os.path.getmtime(self.index_path)
+
+    def lookup(self, key: str):
+        entry = self.entries().get(key)
+        return None if entry is None else self.read_object(entry["object"])
+
+
+def read_index(index_path: str) -> List[dict]:
+    if not os.path.exists(index_path):
+        return []
+    entries = []
+    with open(index_path, "r") as f:
+        for line in f:
+            if line.strip():
+                entries.append(json.loads(line))
+    return entries
+
+
+_cassettes = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: Optional[str] = None) -> Cassette:
+    path = os.path.abspath(path or get_cassette_path())
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+def call_with_cassette(method: str, vendor: str, impl_func: Callable, args: tuple, kwargs: dict):
+    """Call ``impl_func`` according to the cassette mode.
+
+    Raises:
+        CassetteMissError: In replay mode, when the call was never recorded
+    """
+    mode = get_cassette_mode()
+    if mode == "off":
+        return impl_func(*args, **kwargs)
+
+    cassette = get_cassette()
+    key = call_key(method, vendor, impl_func, args, kwargs)
+    impl_name = getattr(impl_func, "__name__", str(impl_func))
+
+    if mode == "replay":
+        response = cassette.lookup(key)
+        if response is None:
+            raise CassetteMissError(
+                f"No recording of {impl_name} ({vendor}) for {method} with "
+                f"{normalize_args(impl_func, args, kwargs)} in cassette {cassette.path}"
+            )
+        status, value = response
+        if status == "error":
+            raise value
+        return value
+
+    normalized = normalize_args(impl_func, args, kwargs)
+    try:
+        result = impl_func(*args, **kwargs)
+    except Exception as e:
+        cassette.record(key, method, vendor, impl_name, normalized, ("error", _encode_error(e)))
+        raise
+    cassette.record(key, method, vendor, impl_name, normalized, ("ok", result))
+    return result
+
+
+def merge_cassettes(sources: Iterable[str], target: str) -> int:
+    """Copy every entry of ``sources`` into ``target``; later sources win. Returns entries written."""
+    target_cassette = Cassette(target)
+    merged = {entry["key"]: (target_cassette.path, entry) for entry in read_index(target_cassette.index_path)}
+    for source in sources:
+        for entry in read_index(os.path.join(source, INDEX_FILE)):
+            merged[entry["key"]] = (source, entry)
+
+    for source, entry in merged.values():
+        if source != target_cassette.path:
+            target_cassette.write_object(Cassette(source).read_object(entry["object"]))
+    _rewrite_index(target_cassette, [entry for _, entry in merged.values()])
+    return len(merged)
+
+
+def prune_cassette(
+    path: str,
+    methods: Optional[List[str]] = None,
+    vendors: Optional[List[str]] = None,
+    drop_errors: bool = False,
+    older_than_days: Optional[float] = None,
+) -> dict:
+    """Compact the index to one entry per key, drop matching entries and unreferenced objects."""
+    cassette = Cassette(path)
+    entries = {entry["key"]: entry for entry in read_index(cassette.index_path)}
+    cutoff = time.time() - older_than_days * 86400 if older_than_days is not None else None
+
+    def dropped(entry):
+        return (
+            (methods and entry["method"] in methods)
+            or (vendors and entry["vendor"] in vendors)
+            or (drop_errors and entry["error"])
+            or (cutoff is not None and entry["recorded_at"] < cutoff)
+        )
+
+    kept = [entry for entry in entries.values() if not dropped(entry)]
+    _rewrite_index(cassette, kept)
+
+    referenced = {entry["object"] for entry in kept}
+    removed_objects = 0
+    objects_dir = os.path.join(path, OBJECTS_DIR)
+    for root, _, files in os.walk(objects_dir):
+        for name in files:
+            if name.endswith(".z") and name[:-2] not in referenced:
+                os.remove(os.path.join(root, name))
+                removed_objects += 1
+    return {"entries": len(kept), "removed_entries": len(entries) - len(kept), "removed_objects": removed_objects}
+
+
+def inspect_cassette(path: str) -> dict:
+    """Summary of a cassette: calls per method and vendor, errors and stored size."""
+    cassette = Cassette(path)
+    entries = list(cassette.entries().values())
+    by_method: Dict[str, Dict[str, int]] = {}
+    for entry in entries:
+        counts = by_method.setdefault(entry["method"], {})
+        counts[entry["vendor"]] = counts.get(entry["vendor"], 0) + 1
+
+    objects = set(entry["object"] for entry in entries)
+    size = sum(
+        os.path.getsize(cassette._object_path(digest))
+        for digest in objects
+        if os.path.exists(cassette._object_path(digest))
+    )
+    return {
+        "path": cassette.path,
+        "calls": len(entries),
+        "errors": sum(1 for entry in entries if entry["error"]),
+        "objects": len(objects),
+        "bytes": size,
+        "by_method": by_method,
+    }
+
+
+def _rewrite_index(cassette: Cassette, entries: List[dict]):
+    os.makedirs(cassette.path, exist_ok=True)
+    entries = sorted(entries, key=lambda entry: entry["recorded_at"])
+    with file_lock(f"{cassette.index_path}.lock"):
+        with atomic_write(cassette.index_path) as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
@@ -0,0 +1,170 @@
+"""Compiled company-mention matching for the Reddit company-news filter.
+
+Every ticker's search terms (the company names from ``ticker_to_company`` plus
+the ticker itself) are folded into one case-insensitive alternation that is
+compiled once and cached, so a post is checked with a single search per field
+instead of one ``re.search`` per term. The terms are regular expressions, as in
+the original loop, so an alternation keeps the exact matching semantics.
+
+``CompanyMatcher`` matches many tickers against the same text, letting a batch
+run over a ticker list parse and scan the corpus once.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Set
+
+ticker_to_company = {
+    "AAPL": "Apple",
+    "MSFT": "Microsoft",
+    "GOOGL": "Google",
+    "AMZN": "Amazon",
+    "TSLA": "Tesla",
+    "NVDA": "Nvidia",
+    "TSM": "Taiwan Semiconductor Manufacturing Company OR TSMC",
+    "JPM": "JPMorgan Chase OR JP Morgan",
+    "JNJ": "Johnson & Johnson OR JNJ",
+    "V": "Visa",
+    "WMT": "Walmart",
+    "META": "Meta OR Facebook",
+    "AMD": "AMD",
+    "INTC": "Intel",
+    "QCOM": "Qualcomm",
+    "BABA": "Alibaba",
+    "ADBE": "Adobe",
+    "NFLX": "Netflix",
+    "CRM": "Salesforce",
+    "PYPL": "PayPal",
+    "PLTR": "Palantir",
+    "MU": "Micron",
+    "SQ": "Block OR Square",
+    "ZM": "Zoom",
+    "CSCO": "Cisco",
+    "SHOP": "Shopify",
+    "ORCL": "Oracle",
+    "X": "Twitter OR X",
+    "SPOT": "Spotify",
+    "AVGO": "Broadcom",
+    "ASML": "ASML ",
+    "TWLO": "Twilio",
+    "SNAP": "Snap Inc.",
+    "TEAM": "Atlassian",
+    "SQSP": "Squarespace",
+    "UBER": "Uber",
+    "ROKU": "Roku",
+    "PINS": "Pinterest",
+}
+
+
+def search_terms(ticker: str) -> List[str]:
+    """Company names for ``ticker`` followed by the ticker itself."""
+    if "OR" in ticker_to_company[ticker]:
+        terms = ticker_to_company[ticker].split(" OR ")
+    else:
+        terms = [ticker_to_company[ticker]]
+    terms.append(ticker)
+    return terms
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    return "|".join(f"(?:{term})" for term in terms)
+
+
+@lru_cache(maxsize=None)
+def company_pattern(ticker: str) -> re.Pattern:
+    """Compiled, cached pattern matching any search term of ``ticker``."""
+    return re.compile(_alternation(search_terms(ticker)), re.IGNORECASE)
+
+
+def mentions_company(ticker: str, *texts: str) -> bool:
+    """True if any of ``texts`` mentions ``ticker``'s company."""
+    pattern = company_pattern(ticker)
+    return any(pattern.search(text) for text in texts)
+
+
+class CompanyMatcher:
+    """Matches several tickers against the same text.
+
+    A combined alternation of every ticker's terms rejects texts without any
+    mention in one search; texts that pass are checked with each ticker's own
+    cached pattern. Overlapping mentions (``TSM`` inside ``TSMC``) are why the
+    combined pattern is only a filter: a single left-to-right scan reports one
+    of them and would hide the other.
+    """
+
+    def __init__(self, tickers: Iterable[str]):
+        self.tickers = list(dict.fromkeys(tickers))
+        self._patterns = [(ticker, company_pattern(ticker)) for ticker in self.tickers]
+        self._any = re.compile(
+            _alternation(term for ticker in self.tickers for term in search_terms(ticker)),
+            re.IGNORECASE,
+        )
+
+    def match(self, *texts: str, tickers: Iterable[str] = None) -> Set[str]:
+        """Tickers (optionally restricted to ``tickers``) mentioned in any of ``texts``."""
+        if not any(self._any.search(text) for text in texts):
+            return set()
+        wanted = None if tickers is None else set(tickers)
+        return {
+            ticker
+            for ticker, pattern in self._patterns
+            if (wanted is None or ticker in wanted)
+            and any(pattern.search(text) for text in texts)
+        }
+
+
+@lru_cache(maxsize=64)
+def get_company_matcher(tickers: tuple) -> CompanyMatcher:
+    """Cached matcher for a tuple of tickers."""
+    return CompanyMatcher(tickers)
+
+
+def _legacy_match(ticker: str, title: str, selftext: str) -> bool:
+    for term in search_terms(ticker):
+        if re.search(term, title, re.IGNORECASE) or re.search(term, selftext, re.IGNORECASE):
+            return True
+    return False
+
+
+if __name__ == "__main__":
+    # Micro-benchmark against the per-term re.search loop
+    import random
+    import time
+
+    rng = random.Random(7)
+    vocabulary = (
+        "market rally earnings guidance shares stock fund rates inflation chip cloud "
+        "revenue growth outlook dividend buyback lawsuit launch product analyst"
+    ).split()
+    names = [term for ticker in ticker_to_company for term in search_terms(ticker)]
+    posts = []
+    for _ in range(20000):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(8, 60))]
+        if rng.random() < 0.2:
+            words.insert(rng.randrange(len(words)), rng.choice(names))
+        posts.append((" ".join(words[:8]), " ".join(words)))
+
+    tickers = list(ticker_to_company)
+    print(f"{len(posts)} posts, {len(tickers)} tickers")
+
+    start = time.perf_counter()
+    legacy = [[_legacy_match("AAPL", t, s) for t, s in posts]]
+    legacy_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [[mentions_company("AAPL", t, s) for t, s in posts]]
+    compiled_single = time.perf_counter() - start
+    assert legacy == compiled
+
+    start = time.perf_counter()
+    legacy_all = [{ticker for ticker in tickers if _legacy_match(ticker, t, s)} for t, s in posts]
+    legacy_batch = time.perf_counter() - start
+
+    matcher = CompanyMatcher(tickers)
+    start = time.perf_counter()
+    batch_all = [matcher.match(t, s) for t, s in posts]
+    batch_time = time.perf_counter() - start
+    assert legacy_all == batch_all
+
+    print(f"one ticker:  loop {legacy_single * 1000:.1f} ms, compiled {compiled_single * 1000:.1f} ms")
+    print(f"all tickers: loop {legacy_batch * 1000:.1f} ms, matcher {batch_time * 1000:.1f} ms")
@@ -0,0 +1,86 @@
+"""Indexed, cached access to the Finnhub ``*_data_formatted.json`` datasets.
+
+Each file maps a date key to a list of entries. It is parsed once per process
+into a sorted key array so a date-range query is two ``bisect`` calls instead of
+a full ``json.load`` and key scan. Files are kept in a bounded LRU and reloaded
+when their mtime changes.
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List
+
+from .config import get_config
+from .utils import LRUCache
+
+# data path -> (mtime_ns, FinnhubDataset)
+_DATASETS = LRUCache(maxsize=get_config().get("finnhub_cache_size", 128))
+
+
+class FinnhubDataset:
+    """Date keys of one Finnhub file, sorted for range queries."""
+
+    def __init__(self, data: Dict[str, list]):
+        # Remember file order so range results come back exactly as before
+        items = sorted(enumerate(data.items()), key=lambda item: item[1][0])
+        self.keys = [key for _, (key, _) in items]
+        self.positions = [position for position, _ in items]
+        self.values = [value for _, (_, value) in items]
+
+    @classmethod
+    def load(cls, path: str) -> "FinnhubDataset":
+        with open(path, "r") as f:
+            return cls(json.load(f))
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, list]:
+        """Non-empty entries with ``start_date <= key <= end_date``, in file order."""
+        lo = bisect_left(self.keys, start_date)
+        hi = bisect_right(self.keys, end_date)
+        rows = sorted(range(lo, max(lo, hi)), key=lambda i: self.positions[i])
+        return {self.keys[i]: self.values[i] for i in rows if len(self.values[i]) > 0}
+
+
+def get_data_path(ticker, data_type, data_dir, period=None) -> str:
+    if period:
+        return os.path.join(
+            data_dir,
+            "finnhub_data",
+            data_type,
+            f"{ticker}_{period}_data_formatted.json",
+        )
+    return os.path.join(
+        data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+    )
+
+
+def get_dataset(path: str) -> FinnhubDataset:
+    """Return the cached dataset for ``path``, reloading it if the file changed."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _DATASETS.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    dataset = FinnhubDataset.load(path)
+    _DATASETS.put(path, (mtime_ns, dataset))
+    return dataset
+
+
+def _freeze(value):
+    """Hashable form of a JSON value that compares equal exactly when the values do."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def unique_entries(entries: Iterable[dict]) -> List[dict]:
+    """Drop repeated entries, keeping the first occurrence and the original order."""
+    seen = set()
+    unique = []
+    for entry in entries:
+        key = _freeze(entry)
+        if key not in seen:
+            seen.add(key)
+            unique.append(entry)
+    return unique
@@ -1,7 +1,11 @@
+import hashlib
 import json
+import os
 import requests
+import threading
 from bs4 import BeautifulSoup
 from datetime import datetime
+from urllib.parse import urlsplit
 import time
 import random
 from tenacity import (
@@ -12,97 +16,239 @@ from tenacity import (
     retry_if_result,
 )
 
+from .config import get_config
+from .utils import LRUCache, atomic_write
+
+DEFAULT_SETTINGS = {
+    "base_url": "https://www.google.com",  # point at a local stand-in for testing
+    "min_interval_seconds": 3.0,  # spacing between requests to one host
+    "jitter_seconds": 2.0,  # random extra spacing added to each slot
+    "max_results": 50,  # stop paginating once this many results are collected (None: all)
+    "max_pages": 10,
+    "cache_ttl_seconds": 6 * 3600,  # parsed pages; 0 disables the cache
+    "cache_dir": None,  # defaults to <data_cache_dir>/google_news
+}
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/101.0.4951.54 Safari/537.36"
+    )
+}
+
+
+def get_news_settings() -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("google_news") or {})
+    return settings
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
     return response.status_code == 429
 
 
-@retry(
-    retry=(retry_if_result(is_rate_limited)),
-    wait=wait_exponential(multiplier=1, min=4, max=60),
-    stop=stop_after_attempt(5),
-)
-def make_request(url, headers):
-    """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
-    return response
+class HostScheduler:
+    """Hands out request slots per host, spaced by a minimum interval plus jitter.
+
+    Every query and thread sharing a scheduler shares its schedule, so adding
+    concurrent queries never raises the request rate against a host.
+    """
+
+    def __init__(self, min_interval: float, jitter: float = 0.0):
+        self.min_interval = min_interval
+        self.jitter = jitter
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """Sleep until this caller's slot for ``url``'s host; return the time slept."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval + random.uniform(0, self.jitter)
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(min_interval: float, jitter: float) -> HostScheduler:
+    """Process-wide scheduler for the given spacing."""
+    with _schedulers_lock:
+        key = (min_interval, jitter)
+        if key not in _schedulers:
+            _schedulers[key] = HostScheduler(min_interval, jitter)
+        return _schedulers[key]
+
+
+def make_request(url, headers, scheduler: HostScheduler = None):
+    """Make a request at the host's next free slot, retrying when rate limited"""
+    if scheduler is None:
+        settings = get_news_settings()
+        scheduler = get_scheduler(settings["min_interval_seconds"], settings["jitter_seconds"])
+
+    @retry(
+        retry=(retry_if_result(is_rate_limited)),
+        wait=wait_exponential(multiplier=1, min=4, max=60),
+        stop=stop_after_attempt(5),
+    )
+    def scheduled_get():
+        scheduler.wait(url)
+        return requests.get(url, headers=headers, timeout=30)
+
+    return scheduled_get()
+
+
+def parse_results_page(content) -> tuple:
+    """Parse one result page into ``(results, has_next_page)``."""
+    soup = BeautifulSoup(content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    news_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            news_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    has_next = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+    return news_results, has_next
 
 
-def getNewsData(query, start_date, end_date):
+class PageCache:
+    """Parsed result pages keyed by (base URL, query, date range, offset).
+
+    Pages live in memory and as small JSON files, so reruns and other processes
+    skip the request entirely while the entry is fresh.
     """
-    Scrape Google News search results for a given query and date range.
-    query: str - search query
-    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
-    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+
+    def __init__(self, ttl: float, directory: str = None, maxsize: int = 512):
+        self.ttl = ttl
+        self.directory = directory
+        self._memory = LRUCache(maxsize=maxsize)
+
+    def _key(self, *parts) -> str:
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def get(self, *parts):
+        if not self.ttl:
+            return None
+        key = self._key(*parts)
+        page = self._memory.get(key)
+        if page is not None or not self.directory:
+            return page
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            with open(path, "r") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return None
+        remaining = stored["fetched_at"] + self.ttl - time.time()
+        if remaining <= 0:
+            return None
+        page = (stored["results"], stored["has_next"])
+        self._memory.put(key, page, ttl=remaining)
+        return page
+
+    def put(self, page, *parts):
+        if not self.ttl:
+            return
+        key = self._key(*parts)
+        self._memory.put(key, page, ttl=self.ttl)
+        if self.directory:
+            with atomic_write(os.path.join(self.directory, f"{key}.json")) as f:
+                json.dump({"fetched_at": time.time(), "results": page[0], "has_next": page[1]}, f)
+
+
+class GoogleNewsScraper:
+    """Google News search with shared per-host pacing, page caching and early stop.
+
+    One scheduler per spacing is shared process-wide, so concurrent searches
+    from different threads never raise the request rate against the host.
     """
-    if "-" in start_date:
-        start_date = datetime.strptime(start_date, "%Y-%m-%d")
-        start_date = start_date.strftime("%m/%d/%Y")
-    if "-" in end_date:
-        end_date = datetime.strptime(end_date, "%Y-%m-%d")
-        end_date = end_date.strftime("%m/%d/%Y")
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/101.0.4951.54 Safari/537.36"
-        )
-    }
 
-    news_results = []
-    page = 0
-    while True:
-        offset = page * 10
+    def __init__(self, settings: dict = None):
+        self.settings = settings or get_news_settings()
+        self.base_url = self.settings["base_url"].rstrip("/")
+        self.scheduler = get_scheduler(self.settings["min_interval_seconds"], self.settings["jitter_seconds"])
+        cache_dir = self.settings["cache_dir"] or os.path.join(get_config()["data_cache_dir"], "google_news")
+        self.cache = PageCache(self.settings["cache_ttl_seconds"], cache_dir)
+
+    def fetch_page(self, query: str, start_date: str, end_date: str, offset: int) -> tuple:
+        """One parsed result page, from the cache when fresh."""
+        cache_key = (self.base_url, query, start_date, end_date, offset)
+        page = self.cache.get(*cache_key)
+        if page is not None:
+            return page
+
         url = (
-            f"https://www.google.com/search?q={query}"
+            f"{self.base_url}/search?q={query}"
             f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
             f"&tbm=nws&start={offset}"
         )
+        response = make_request(url, HEADERS, self.scheduler)
+        page = parse_results_page(response.content)
+        if response.status_code == 200:
+            self.cache.put(page, *cache_key)
+        return page
+
+    def search(self, query: str, start_date: str, end_date: str, max_results: int = None) -> list:
+        """Collect results page by page until none are left or ``max_results`` is reached."""
+        start_date, end_date = _to_query_date(start_date), _to_query_date(end_date)
+        if max_results is None:
+            max_results = self.settings["max_results"]
+
+        news_results = []
+        for page in range(self.settings["max_pages"]):
+            try:
+                results, has_next = self.fetch_page(query, start_date, end_date, page * 10)
+            except Exception as e:
+                print(f"Failed after multiple retries: {e}")
+                break
 
-        try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            news_results.extend(results)
+            if max_results and len(news_results) >= max_results:
+                return news_results[:max_results]
+            if not has_next:
                 break
 
-            page += 1
+        return news_results
+
+
+def _to_query_date(value: str) -> str:
+    if "-" in value:
+        return datetime.strptime(value, "%Y-%m-%d").strftime("%m/%d/%Y")
+    return value
 
-        except Exception as e:
-            print(f"Failed after multiple retries: {e}")
-            break
 
-    return news_results
+def getNewsData(query, start_date, end_date, max_results=None):
+    """
+    Scrape Google News search results for a given query and date range.
+    query: str - search query
+    start_date: str - start date in the format yyyy-mm-dd or mm/dd/yyyy
+    end_date: str - end date in the format yyyy-mm-dd or mm/dd/yyyy
+    max_results: int - stop once this many results are collected (defaults to config)
+    """
+    return GoogleNewsScraper().search(query, start_date, end_date, max_results)
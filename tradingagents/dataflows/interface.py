@@ -1,13 +1,18 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Annotated
 
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
-from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
+from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_stock_stats_indicators_table, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
 from .google import get_google_news
 from .openai import get_stock_news_openai, get_global_news_openai, get_fundamentals_openai
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
     get_indicator as get_alpha_vantage_indicator,
+    get_indicators_batch as get_alpha_vantage_indicators_batch,
     get_fundamentals as get_alpha_vantage_fundamentals,
     get_balance_sheet as get_alpha_vantage_balance_sheet,
     get_cashflow as get_alpha_vantage_cashflow,
@@ -16,10 +21,39 @@ from .alpha_vantage import (
     get_news as get_alpha_vantage_news
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .vendor_health import get_vendor_health
+from .result_cache import get_result_cache, make_key, normalize_args
+from .cassette import CassetteMissError, call_with_cassette, get_cassette_mode
 
 # Configuration and routing logic
 from .config import get_config
 
+# Called with (method, vendor, seconds, status) after every vendor call and
+# result-cache hit; graph/instrumentation.py attributes them to graph nodes
+_vendor_call_observers = []
+
+
+def add_vendor_call_observer(observer):
+    """Register ``observer(method, vendor, seconds, status)``; status is ok, rate_limit, error, timeout or hit."""
+    if observer not in _vendor_call_observers:
+        _vendor_call_observers.append(observer)
+
+
+def _notify_vendor_call(method, vendor, seconds, status):
+    for observer in _vendor_call_observers:
+        observer(method, vendor, seconds, status)
+
+
+# Called with (method, key) when route_to_vendor answers from the result cache;
+# graph/prefetch.py matches them against the keys it warmed
+_cache_hit_observers = []
+
+
+def add_cache_hit_observer(observer):
+    """Register ``observer(method, key)`` for result-cache hits."""
+    if observer not in _cache_hit_observers:
+        _cache_hit_observers.append(observer)
+
 # Tools organized by category
 TOOLS_CATEGORIES = {
     "core_stock_apis": {
@@ -31,7 +65,8 @@ TOOLS_CATEGORIES = {
     "technical_indicators": {
         "description": "Technical analysis indicators",
         "tools": [
-            "get_indicators"
+            "get_indicators",
+            "get_indicators_batch"
         ]
     },
     "fundamental_data": {
@@ -75,6 +110,11 @@ VENDOR_METHODS = {
         "yfinance": get_stock_stats_indicators_window,
         "local": get_stock_stats_indicators_window
     },
+    "get_indicators_batch": {
+        "alpha_vantage": get_alpha_vantage_indicators_batch,
+        "yfinance": get_stock_stats_indicators_table,
+        "local": get_stock_stats_indicators_table
+    },
     # fundamental_data
     "get_fundamentals": {
         "alpha_vantage": get_alpha_vantage_fundamentals,
@@ -138,8 +178,175 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+_executor = None
+_executor_lock = threading.Lock()
+# Calls that missed the deadline but are still running on the pool
+_abandoned = 0
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared, bounded pool used to fan out multi-source vendor calls.
+
+    ``vendor_max_abandoned`` extra threads are reserved for calls that missed
+    ``vendor_call_timeout`` and are still running, so they do not starve new fan-outs.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            config = get_config()
+            max_workers = config.get("vendor_max_workers", 8) + config.get("vendor_max_abandoned", 8)
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vendor")
+        return _executor
+
+
+def _release_abandoned(_future):
+    global _abandoned
+    with _executor_lock:
+        _abandoned -= 1
+
+
+class _Outcome:
+    """Lets exactly one of the worker and the deadline record a call's outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._claimed = False
+
+    def claim(self) -> bool:
+        with self._lock:
+            claimed, self._claimed = self._claimed, True
+            return not claimed
+
+
+def _call_impl(impl_func, vendor_name, method, args, kwargs, outcome=None):
+    """Run one implementation, returning ``(status, value)`` instead of raising.
+
+    When ``outcome`` is given, health and observers are only updated if the
+    call claims it before its deadline does.
+    """
+    health = get_vendor_health()
+    start = time.perf_counter()
+    try:
+        print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
+        result = call_with_cassette(method, vendor_name, impl_func, args, kwargs)
+        if outcome is None or outcome.claim():
+            health.record_success(vendor_name, method, time.perf_counter() - start)
+            _notify_vendor_call(method, vendor_name, time.perf_counter() - start, "ok")
+        print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
+        return "ok", result
+    except CassetteMissError:
+        # Replay must fail loudly rather than fall back to another vendor
+        if outcome is not None:
+            outcome.claim()
+        raise
+    except AlphaVantageRateLimitError as e:
+        if outcome is None or outcome.claim():
+            health.record_failure(vendor_name, method, time.perf_counter() - start, e, rate_limited=True)
+            _notify_vendor_call(method, vendor_name, time.perf_counter() - start, "rate_limit")
+        if vendor_name == "alpha_vantage":
+            print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
+            print(f"DEBUG: Rate limit details: {e}")
+        return "rate_limit", e
+    except Exception as e:
+        if outcome is None or outcome.claim():
+            health.record_failure(vendor_name, method, time.perf_counter() - start, e)
+            _notify_vendor_call(method, vendor_name, time.perf_counter() - start, "error")
+        # Log error but continue with other implementations
+        print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
+        return "error", e
+
+
+def _run_impls(method, calls, args, kwargs):
+    """Run ``(impl_func, vendor_name)`` calls and return their outcomes in call order.
+
+    A single call runs inline. Several calls run concurrently on the shared pool
+    under the ``vendor_call_timeout`` deadline; calls still running when it
+    expires are reported as ``("timeout", None)`` and their results dropped.
+    Each call is recorded once, as a timeout or as its own outcome. While the
+    pool's reserve is used up by abandoned calls, the calls run inline instead.
+    """
+    global _abandoned
+    if len(calls) == 1:
+        impl_func, vendor_name = calls[0]
+        return [_call_impl(impl_func, vendor_name, method, args, kwargs)]
+
+    executor = _get_executor()
+    with _executor_lock:
+        abandoned = _abandoned
+    if abandoned >= get_config().get("vendor_max_abandoned", 8):
+        print(f"DEBUG: {abandoned} timed-out vendor calls still running, calling {method} sources in turn")
+        return [_call_impl(impl_func, vendor_name, method, args, kwargs) for impl_func, vendor_name in calls]
+
+    claims = [_Outcome() for _ in calls]
+    futures = [
+        executor.submit(
+            contextvars.copy_context().run, _call_impl, impl_func, vendor_name, method, args, kwargs, outcome
+        )
+        for (impl_func, vendor_name), outcome in zip(calls, claims)
+    ]
+    # Cassette runs wait for every source, so a slow recording is not dropped
+    # while recording and then used on replay
+    timeout = get_config().get("vendor_call_timeout") if get_cassette_mode() == "off" else None
+    wait(futures, timeout=timeout)
+
+    outcomes = []
+    for future, outcome, (impl_func, vendor_name) in zip(futures, claims, calls):
+        if outcome.claim():
+            print(f"TIMEOUT: {impl_func.__name__} from vendor '{vendor_name}' exceeded the {timeout}s deadline, returning partial results")
+            get_vendor_health().record_failure(vendor_name, method, timeout, TimeoutError(f"exceeded {timeout}s"))
+            _notify_vendor_call(method, vendor_name, timeout, "timeout")
+            with _executor_lock:
+                _abandoned += 1
+            future.add_done_callback(_release_abandoned)
+            outcomes.append(("timeout", None))
+        else:
+            # Already recorded by the worker, which has returned or is about to
+            outcomes.append(future.result())
+    return outcomes
+
+
+def result_cache_key(method: str, *args, **kwargs):
+    """Result-cache key of this call, or None when ``route_to_vendor`` bypasses the cache."""
+    # Cassette runs must see every vendor call so recordings are complete
+    if get_result_cache() is None or method not in VENDOR_METHODS or get_cassette_mode() != "off":
+        return None
+    vendor_config = get_vendor(get_category_for_method(method), method)
+    # Bind against one implementation so positional and keyword calls share a key
+    first_impl = next(iter(VENDOR_METHODS[method].values()))
+    if isinstance(first_impl, list):
+        first_impl = first_impl[0]
+    return make_key(method, vendor_config, normalize_args(first_impl, args, kwargs))
+
+
 def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+    """Route method calls to the configured vendors, serving repeats from the result cache."""
+    cache = get_result_cache()
+    key = result_cache_key(method, *args, **kwargs)
+    if key is None:
+        return _route_to_vendor(method, *args, **kwargs)
+
+    category = get_category_for_method(method)
+    fetched = []
+
+    def fetch():
+        fetched.append(True)
+        return _route_to_vendor(method, *args, **kwargs)
+
+    start = time.perf_counter()
+    value = cache.get_or_fetch(method, category, key, fetch)
+    if not fetched:
+        _notify_vendor_call(method, "result_cache", time.perf_counter() - start, "hit")
+        for observer in _cache_hit_observers:
+            observer(method, key)
+    return value
+
+
+def _route_to_vendor(method: str, *args, **kwargs):
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Vendors with several implementations, and comma-separated multi-vendor
+    configs, are fanned out concurrently; results keep the configured order.
+    """
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
@@ -158,17 +365,24 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
+    # Optionally move the fastest healthy fallbacks forward. Cassette runs skip
+    # this and the circuit checks below in both record and replay mode: both
+    # depend on live timings, and a replay must take the route that was recorded
+    health = get_vendor_health()
+    use_health = get_cassette_mode() == "off"
+    if use_health:
+        fallback_vendors = health.order_fallbacks(method, fallback_vendors, primary_vendors)
+
+    def check(vendor):
+        return health.check(vendor, method) if use_health else None
+
     # Debug: Print fallback ordering
     primary_str = " → ".join(primary_vendors)
     fallback_str = " → ".join(fallback_vendors)
     print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
 
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
-
+    # Expand each supported vendor into its list of implementations
+    vendor_calls = []
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             if vendor in primary_vendors:
@@ -176,6 +390,57 @@ def route_to_vendor(method: str, *args, **kwargs):
             continue
 
         vendor_impl = VENDOR_METHODS[method][vendor]
+        if isinstance(vendor_impl, list):
+            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_impl)} functions")
+            vendor_calls.append((vendor, [(impl, vendor) for impl in vendor_impl]))
+        else:
+            vendor_calls.append((vendor, [(vendor_impl, vendor)]))
+
+    # Multiple vendor configs (comma-separated) collect from every vendor, so all
+    # of them are started together; single-vendor configs fall back one at a time
+    prefetched = {}
+    skipped = []
+    if len(primary_vendors) > 1 and vendor_calls:
+        healthy_calls = []
+        for vendor, calls in vendor_calls:
+            reason = check(vendor)
+            if reason is None:
+                healthy_calls.append((vendor, calls))
+            else:
+                print(f"SKIPPED: Vendor '{vendor}' for {method}: {reason}")
+                skipped.append((vendor, calls))
+        flat_calls = [call for _, calls in healthy_calls for call in calls]
+        if flat_calls:
+            print(f"DEBUG: Fanning out {len(flat_calls)} implementation(s) across {len(healthy_calls)} vendor(s)")
+            outcomes = iter(_run_impls(method, flat_calls, args, kwargs))
+            for vendor, calls in healthy_calls:
+                prefetched[vendor] = [next(outcomes) for _ in calls]
+
+    # Track results and execution state
+    results = []
+    vendor_attempt_count = 0
+    any_primary_vendor_attempted = False
+    successful_vendor = None
+
+    def attempts():
+        """Vendors to run in order; ones with an open circuit only as a last resort."""
+        already_skipped = [vendor for vendor, _ in skipped]
+        for vendor, calls in vendor_calls:
+            if vendor in already_skipped:
+                continue
+            if vendor not in prefetched:
+                # Checked lazily so a half-open trial is only claimed when actually called
+                reason = check(vendor)
+                if reason is not None:
+                    print(f"SKIPPED: Vendor '{vendor}' for {method}: {reason}")
+                    skipped.append((vendor, calls))
+                    continue
+            yield vendor, calls
+        if not results and skipped:
+            print(f"INFO: No healthy vendor succeeded for {method}, trying skipped vendors anyway")
+            yield from skipped
+
+    for vendor, calls in attempts():
         is_primary_vendor = vendor in primary_vendors
         vendor_attempt_count += 1
 
@@ -187,32 +452,9 @@ def route_to_vendor(method: str, *args, **kwargs):
         vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
         print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
 
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
-
         # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
+        outcomes = prefetched[vendor] if vendor in prefetched else _run_impls(method, calls, args, kwargs)
+        vendor_results = [value for status, value in outcomes if status == "ok"]
 
         # Add this vendor's results
         if vendor_results:
@@ -241,4 +483,4 @@ def route_to_vendor(method: str, *args, **kwargs):
         return results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results)
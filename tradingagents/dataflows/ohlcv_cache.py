@@ -0,0 +1,159 @@
+"""Per-symbol, append-only OHLCV cache for the yfinance-backed indicators.
+
+The cache file is keyed only by symbol (``{symbol}-YFin-data.csv``) with a JSON
+sidecar recording the high-water mark (last cached bar) and the day of the last
+refresh. A refresh downloads only the bars after the high-water mark, and all
+writes happen under a file lock with temp-file + rename so parallel workers
+never corrupt the cache or download the same history twice.
+"""
+
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .utils import LRUCache, atomic_write, file_lock
+
+CACHE_YEARS = 15
+
+# Date-stamped files written by the previous cache layout
+_LEGACY_FILE_PATTERN = re.compile(
+    r"^(?P<symbol>.+)-YFin-data-(?P<start>\d{4}-\d{2}-\d{2})-(?P<end>\d{4}-\d{2}-\d{2})\.csv$"
+)
+
+# (cache_dir, symbol) -> (refresh day, frame)
+_FRAMES = LRUCache(maxsize=64)
+_collected_dirs = set()
+
+
+def _cache_paths(cache_dir: str, symbol: str):
+    base = os.path.join(cache_dir, f"{symbol}-YFin-data")
+    return f"{base}.csv", f"{base}.meta.json", f"{base}.lock"
+
+
+def _download(symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+    data = yf.download(
+        symbol,
+        start=start_date,
+        end=end_date,
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+    )
+    data = data.reset_index()
+    if "Date" in data.columns:
+        data["Date"] = pd.to_datetime(data["Date"]).dt.tz_localize(None).dt.normalize()
+    return data
+
+
+def _read_meta(meta_path: str) -> dict:
+    if not os.path.exists(meta_path):
+        return {}
+    with open(meta_path, "r") as f:
+        return json.load(f)
+
+
+def _refresh(symbol: str, data, meta: dict, today: pd.Timestamp) -> pd.DataFrame:
+    """Append the bars missing after the high-water mark to ``data``."""
+    end_date = (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+    full_start = (today - pd.DateOffset(years=CACHE_YEARS)).strftime("%Y-%m-%d")
+
+    if data is None or data.empty or not meta.get("high_water_mark"):
+        return _download(symbol, full_start, end_date)
+
+    # Re-fetch from the last bar that was certainly complete at the previous
+    # refresh, so a partial intraday bar at the high-water mark gets replaced
+    anchor = data["Date"].iloc[-2] if len(data) > 1 else data["Date"].iloc[-1]
+    tail = _download(symbol, anchor.strftime("%Y-%m-%d"), end_date)
+    if tail.empty:
+        return data
+
+    # Auto-adjusted history shifts after a split or dividend; start over then
+    stored_close = data.loc[data["Date"] == anchor, "Close"]
+    fetched_close = tail.loc[tail["Date"] == anchor, "Close"]
+    if len(stored_close) and len(fetched_close) and not np.isclose(
+        stored_close.iloc[0], fetched_close.iloc[0], rtol=1e-6
+    ):
+        print(f"Adjusted history changed for {symbol}, re-downloading the full cache")
+        return _download(symbol, full_start, end_date)
+
+    merged = pd.concat([data[data["Date"] < anchor], tail], ignore_index=True)
+    merged = merged.drop_duplicates(subset="Date", keep="last")
+    return merged.sort_values("Date").reset_index(drop=True)
+
+
+def collect_legacy_cache_files(cache_dir: str = None) -> list:
+    """Delete the date-stamped ``{symbol}-YFin-data-{start}-{end}.csv`` files.
+
+    Only files spanning exactly the old ``CACHE_YEARS`` window are removed, which
+    leaves the local vendor's fixed-range CSVs untouched.
+    """
+    cache_dir = cache_dir or get_config()["data_cache_dir"]
+    if not os.path.isdir(cache_dir):
+        return []
+
+    removed = []
+    for file_name in os.listdir(cache_dir):
+        match = _LEGACY_FILE_PATTERN.match(file_name)
+        if not match:
+            continue
+        start = pd.Timestamp(match.group("start"))
+        end = pd.Timestamp(match.group("end"))
+        if end - pd.DateOffset(years=CACHE_YEARS) != start:
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, file_name))
+            removed.append(file_name)
+        except OSError:
+            pass
+    return removed
+
+
+def load_ohlcv(symbol: str) -> pd.DataFrame:
+    """Return up to ``CACHE_YEARS`` of daily bars for ``symbol`` with a datetime ``Date`` column.
+
+    The first call of the day per process takes the file lock and fetches only the
+    bars newer than the cached high-water mark; later calls are served from memory.
+    """
+    cache_dir = get_config()["data_cache_dir"]
+    os.makedirs(cache_dir, exist_ok=True)
+
+    today = pd.Timestamp.today().normalize()
+    today_str = today.strftime("%Y-%m-%d")
+    key = (cache_dir, symbol)
+
+    cached = _FRAMES.get(key)
+    if cached is not None and cached[0] == today_str:
+        return cached[1].copy()
+
+    data_path, meta_path, lock_path = _cache_paths(cache_dir, symbol)
+    with file_lock(lock_path):
+        meta = _read_meta(meta_path)
+        data = None
+        if meta and os.path.exists(data_path):
+            data = pd.read_csv(data_path, parse_dates=["Date"])
+
+        if meta.get("last_refresh") != today_str or data is None:
+            data = _refresh(symbol, data, meta, today)
+            if not data.empty:
+                with atomic_write(data_path) as f:
+                    data.to_csv(f, index=False, date_format="%Y-%m-%d")
+                meta = {
+                    "symbol": symbol,
+                    "high_water_mark": data["Date"].iloc[-1].strftime("%Y-%m-%d"),
+                    "last_refresh": today_str,
+                    "rows": int(len(data)),
+                }
+                with atomic_write(meta_path) as f:
+                    json.dump(meta, f, indent=2)
+
+        if cache_dir not in _collected_dirs:
+            collect_legacy_cache_files(cache_dir)
+            _collected_dirs.add(cache_dir)
+
+    _FRAMES.put(key, (today_str, data))
+    return data.copy()
@@ -0,0 +1,233 @@
+"""Compact serialization of tool results for LLM prompts.
+
+Tool outputs are read by an LLM, so every character costs prompt tokens and
+latency. The helpers here shrink tables and dated series before they are
+returned:
+
+- non-trading-day placeholder rows are dropped;
+- numbers are rounded to a fixed number of significant digits;
+- empty columns, and columns holding one constant value, are removed and
+  named in a note line (tables whose columns the caller chose keep them all);
+- windows longer than the tool's token budget are downsampled. The most recent
+  half of the budget keeps every row, and older rows are sampled evenly.
+  Financial statements are not time series and are never downsampled.
+
+Budgets are set per tool name in the nested ``output_format`` config dict. The
+characters saved per call are tracked and exposed through ``get_format_stats()``.
+"""
+
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .indicator_engine import NON_TRADING_DAY
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "significant_digits": 6,
+    "drop_non_trading_days": True,
+    "drop_constant_columns": True,
+    "chars_per_token": 4,  # rough conversion used for the budgets below
+    "token_budgets": {},  # tool name -> max tokens of its formatted output
+    "default_token_budget": None,  # None: no budget
+}
+
+_stats = defaultdict(lambda: {"calls": 0, "raw_chars": 0, "formatted_chars": 0, "downsampled": 0})
+_stats_lock = threading.Lock()
+
+
+def get_format_settings() -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("output_format") or {})
+    return settings
+
+
+def char_budget(tool: str, settings: dict = None) -> Optional[int]:
+    settings = settings or get_format_settings()
+    tokens = (settings["token_budgets"] or {}).get(tool, settings["default_token_budget"])
+    return int(tokens * settings["chars_per_token"]) if tokens else None
+
+
+def format_number(value, digits: int) -> str:
+    """``value`` rounded to ``digits`` significant digits, without a trailing ``.0``."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, float, np.number)):
+        return str(value)
+    rounded = float(f"{float(value):.{digits}g}")
+    if rounded.is_integer() and abs(rounded) < 1e16:
+        return str(int(rounded))
+    return f"{rounded:.{digits}g}"
+
+
+def _parse_number(value):
+    """``value`` as a float when it is a numeric string, otherwise unchanged."""
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return value
+    return value
+
+
+def pruned_columns(df: pd.DataFrame, settings: dict = None) -> Dict[str, str]:
+    """Columns ``compact_frame`` removes, each with the reason."""
+    settings = settings or get_format_settings()
+    pruned = {}
+    for col in df.columns:
+        if df[col].isna().all():
+            pruned[col] = "all N/A"
+        elif settings["drop_constant_columns"] and len(df) > 1 and df[col].nunique(dropna=False) <= 1:
+            value = df[col].iloc[0]
+            pruned[col] = f"constant = {format_number(value, settings['significant_digits'])}"
+    return pruned
+
+
+def compact_frame(
+    df: pd.DataFrame,
+    settings: dict = None,
+    drop_empty_rows: bool = False,
+    prune_columns: bool = True,
+) -> pd.DataFrame:
+    """Drop empty/constant columns (and optionally empty rows); render numbers compactly."""
+    settings = settings or get_format_settings()
+    if prune_columns:
+        df = df.drop(columns=list(pruned_columns(df, settings)))
+    if drop_empty_rows:
+        df = df.dropna(axis=0, how="all")
+
+    digits = settings["significant_digits"]
+    df = df.copy()
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+            df[col] = [format_number(value, digits) for value in df[col].to_numpy()]
+    return df
+
+
+def downsample_positions(count: int, max_rows: int) -> List[int]:
+    """Row positions to keep out of ``count`` rows ordered oldest to newest.
+
+    The newest half of ``max_rows`` is kept contiguous; the rest is spread
+    evenly over the older rows, always including the oldest one.
+    """
+    if count <= max_rows:
+        return list(range(count))
+    max_rows = max(max_rows, 2)
+    recent = max_rows // 2
+    older = max_rows - recent
+    sampled = np.linspace(0, count - recent - 1, older).round().astype(int)
+    return sorted(set(sampled.tolist())) + list(range(count - recent, count))
+
+
+def _record(tool: str, raw_chars: int, formatted_chars: int, downsampled: bool):
+    with _stats_lock:
+        stats = _stats[tool]
+        stats["calls"] += 1
+        stats["raw_chars"] += raw_chars
+        stats["formatted_chars"] += formatted_chars
+        stats["downsampled"] += int(downsampled)
+
+
+def format_table(
+    tool: str,
+    df: pd.DataFrame,
+    index: bool = True,
+    drop_empty_rows: bool = False,
+    newest_first: bool = False,
+    downsample: bool = True,
+    prune_columns: bool = True,
+) -> str:
+    """CSV text of ``df`` compacted and fitted to ``tool``'s budget.
+
+    Args:
+        tool: Tool name, used for the budget and the metrics
+        df: Table to serialize
+        index: Whether to write the index column
+        drop_empty_rows: Also drop rows with no values (statement line items)
+        newest_first: Rows are ordered newest to oldest, as in a look-back window
+        downsample: Sample rows down to the budget. Only meaningful for time
+            series; statement line items are not ordered by date
+        prune_columns: Drop empty and constant columns, naming them in a note
+            line. Off for tables whose columns the caller asked for
+    """
+    raw = df.to_csv(index=index)
+    settings = get_format_settings()
+    if not settings["enabled"]:
+        return raw
+
+    pruned = pruned_columns(df, settings) if prune_columns else {}
+    compact = compact_frame(df, settings, drop_empty_rows, prune_columns)
+    text = compact.to_csv(index=index)
+    budget = char_budget(tool, settings)
+    downsampled = False
+    if downsample and budget and len(text) > budget and len(compact) > 2:
+        ordered = compact.iloc[::-1] if newest_first else compact
+        # Size the sample from the average row length, then shrink until it fits
+        row_chars = max(1, (len(text) - len(text.split("\n", 1)[0])) / len(compact))
+        max_rows = max(2, int(budget / row_chars))
+        while True:
+            sampled = ordered.iloc[downsample_positions(len(ordered), max_rows)]
+            sampled = sampled.iloc[::-1] if newest_first else sampled
+            text = sampled.to_csv(index=index)
+            if len(text) <= budget or max_rows <= 2:
+                break
+            max_rows = max(2, int(max_rows * 0.8))
+        text = f"# Showing {len(sampled)} of {len(compact)} rows (older rows sampled)\n" + text
+        downsampled = True
+    if pruned:
+        dropped = ", ".join(f"{col} ({reason})" for col, reason in pruned.items())
+        text = f"# Columns omitted: {dropped}\n" + text
+
+    _record(tool, len(raw), len(text), downsampled)
+    return text
+
+
+def format_dated_lines(tool: str, rows: Sequence[Tuple[str, str]]) -> str:
+    """``date: value`` lines (newest first) without non-trading days, fitted to the budget."""
+    raw = "".join(f"{date}: {value}\n" for date, value in rows)
+    settings = get_format_settings()
+    if not settings["enabled"]:
+        return raw
+
+    if settings["drop_non_trading_days"]:
+        rows = [(date, value) for date, value in rows if value != NON_TRADING_DAY]
+    digits = settings["significant_digits"]
+    rows = [(date, format_number(_parse_number(value), digits)) for date, value in rows]
+    text = "".join(f"{date}: {value}\n" for date, value in rows)
+
+    budget = char_budget(tool, settings)
+    downsampled = False
+    if budget and len(text) > budget and len(rows) > 2:
+        oldest_first = rows[::-1]
+        max_rows = max(2, int(budget / (len(text) / len(rows))))
+        while True:
+            kept = [oldest_first[i] for i in downsample_positions(len(rows), max_rows)][::-1]
+            text = "".join(f"{date}: {value}\n" for date, value in kept)
+            if len(text) <= budget or max_rows <= 2:
+                break
+            max_rows = max(2, int(max_rows * 0.8))
+        text = f"(showing {len(kept)} of {len(rows)} trading days, older days sampled)\n" + text
+        downsampled = True
+
+    _record(tool, len(raw), len(text), downsampled)
+    return text
+
+
+def get_format_stats(tool: str = None) -> Dict[str, dict]:
+    """Characters before/after formatting per tool, with the total saved."""
+    with _stats_lock:
+        snapshot = {name: dict(stats) for name, stats in _stats.items() if tool in (None, name)}
+    for stats in snapshot.values():
+        stats["chars_saved"] = stats["raw_chars"] - stats["formatted_chars"]
+        stats["saved_ratio"] = stats["chars_saved"] / stats["raw_chars"] if stats["raw_chars"] else 0.0
+    return snapshot
+
+
+def reset_format_stats():
+    with _stats_lock:
+        _stats.clear()
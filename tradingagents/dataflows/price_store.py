@@ -0,0 +1,195 @@
+"""Columnar, memory-mapped OHLCV store for the local price data.
+
+Each symbol's ``{symbol}-YFin-data-2015-01-01-2025-03-25.csv`` is converted once
+into a directory of ``.npy`` column files plus a sorted ``datetime64[D]`` date
+column. Reads memory-map the columns, so a date-window query is two binary
+searches and a zero-copy slice instead of a full CSV parse.
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .utils import LRUCache
+
+LOCAL_PRICE_FILE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+META_FILE = "meta.json"
+
+# Open tables shared by every local price function in this process
+_TABLES = LRUCache(maxsize=get_config().get("price_store_cache_size", 64))
+
+
+def get_price_data_dir() -> str:
+    """Directory holding the raw local price CSVs."""
+    return os.path.join(get_config()["data_dir"], "market_data", "price_data")
+
+
+def get_price_store_dir() -> str:
+    """Directory holding the converted columnar store."""
+    config = get_config()
+    return config.get("price_store_dir") or os.path.join(
+        config["data_dir"], "market_data", "price_store"
+    )
+
+
+class PriceTable:
+    """Sorted date index plus one array per OHLCV column for a single symbol."""
+
+    def __init__(self, symbol: str, dates: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.symbol = symbol
+        self.dates = dates
+        self.columns = columns
+
+    @classmethod
+    def from_frame(cls, symbol: str, data: pd.DataFrame) -> "PriceTable":
+        """Build a table from a raw price CSV frame with a ``Date`` column."""
+        dates = pd.to_datetime(data["Date"].astype(str).str[:10])
+        order = np.argsort(dates.values, kind="stable")
+        columns = {
+            name: np.ascontiguousarray(data[name].to_numpy()[order])
+            for name in data.columns
+            if name != "Date" and pd.api.types.is_numeric_dtype(data[name])
+        }
+        return cls(symbol, dates.values.astype("datetime64[D]")[order], columns)
+
+    @classmethod
+    def load(cls, symbol: str, path: str) -> "PriceTable":
+        """Memory-map a converted table from ``path``."""
+        with open(os.path.join(path, META_FILE), "r") as f:
+            meta = json.load(f)
+        dates = np.load(os.path.join(path, "dates.npy"), mmap_mode="r")
+        columns = {
+            name: np.load(os.path.join(path, f"col{i}.npy"), mmap_mode="r")
+            for i, name in enumerate(meta["columns"])
+        }
+        return cls(symbol, dates, columns)
+
+    def save(self, path: str):
+        """Write the table as ``.npy`` columns, replacing ``path`` atomically."""
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        np.save(os.path.join(tmp_path, "dates.npy"), np.asarray(self.dates))
+        for i, values in enumerate(self.columns.values()):
+            np.save(os.path.join(tmp_path, f"col{i}.npy"), np.asarray(values))
+
+        meta = {
+            "symbol": self.symbol,
+            "columns": list(self.columns.keys()),
+            "rows": int(len(self.dates)),
+            "first_date": str(self.dates[0]) if len(self.dates) else None,
+            "last_date": str(self.dates[-1]) if len(self.dates) else None,
+        }
+        with open(os.path.join(tmp_path, META_FILE), "w") as f:
+            json.dump(meta, f, indent=2)
+
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(tmp_path, path)
+
+    def locate(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> slice:
+        """Row slice covering ``start_date`` to ``end_date`` inclusive."""
+        lo = 0
+        hi = len(self.dates)
+        if start_date is not None:
+            lo = int(np.searchsorted(self.dates, np.datetime64(start_date[:10], "D"), side="left"))
+        if end_date is not None:
+            hi = int(np.searchsorted(self.dates, np.datetime64(end_date[:10], "D"), side="right"))
+        return slice(lo, max(lo, hi))
+
+    def window(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """Zero-copy views of the date index and every column within the window."""
+        rows = self.locate(start_date, end_date)
+        view = {"Date": self.dates[rows]}
+        view.update({name: values[rows] for name, values in self.columns.items()})
+        return view
+
+    def to_frame(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """Materialize the window as a DataFrame shaped like the raw CSV."""
+        rows = self.locate(start_date, end_date)
+        frame = pd.DataFrame(
+            {name: np.array(values[rows]) for name, values in self.columns.items()},
+            index=pd.RangeIndex(rows.start, rows.stop),
+        )
+        frame.insert(0, "Date", np.datetime_as_string(self.dates[rows], unit="D"))
+        return frame
+
+
+def _find_local_csv(symbol: str) -> str:
+    """Locate the raw CSV for ``symbol``, including the legacy stockstats locations."""
+    config = get_config()
+    file_name = LOCAL_PRICE_FILE.format(symbol=symbol)
+    candidates = [
+        os.path.join(get_price_data_dir(), file_name),
+        os.path.join(config.get("data_cache_dir", "data"), file_name),
+        os.path.join(config["data_dir"], file_name),
+    ]
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(
+        f"No local price data for {symbol}; looked in: {', '.join(candidates)}"
+    )
+
+
+def get_price_table(symbol: str) -> PriceTable:
+    """Return the (cached) price table for ``symbol``.
+
+    Uses the converted store when present and falls back to parsing the raw CSV
+    once per process otherwise.
+    """
+    store_dir = get_price_store_dir()
+    key = (store_dir, symbol)
+    table = _TABLES.get(key)
+    if table is None:
+        symbol_dir = os.path.join(store_dir, symbol)
+        if os.path.exists(os.path.join(symbol_dir, META_FILE)):
+            table = PriceTable.load(symbol, symbol_dir)
+        else:
+            table = PriceTable.from_frame(symbol, pd.read_csv(_find_local_csv(symbol)))
+        _TABLES.put(key, table)
+    return table
+
+
+def convert_symbol(symbol: str, store_dir: Optional[str] = None) -> str:
+    """Convert one symbol's raw CSV into the columnar store and return its path."""
+    store_dir = store_dir or get_price_store_dir()
+    os.makedirs(store_dir, exist_ok=True)
+    table = PriceTable.from_frame(symbol, pd.read_csv(_find_local_csv(symbol)))
+    symbol_dir = os.path.join(store_dir, symbol)
+    table.save(symbol_dir)
+    _TABLES.pop((store_dir, symbol))
+    return symbol_dir
+
+
+def build_price_store(symbols: Optional[List[str]] = None, store_dir: Optional[str] = None) -> List[str]:
+    """One-time conversion of the local price CSVs into the columnar store.
+
+    Args:
+        symbols: Symbols to convert. Defaults to every CSV in the price data directory.
+        store_dir: Destination directory. Defaults to ``get_price_store_dir()``.
+
+    Returns:
+        The list of converted symbols.
+    """
+    if not symbols:
+        suffix = LOCAL_PRICE_FILE.format(symbol="")
+        symbols = sorted(
+            file_name[: -len(suffix)]
+            for file_name in os.listdir(get_price_data_dir())
+            if file_name.endswith(suffix)
+        )
+
+    converted = []
+    for symbol in symbols:
+        try:
+            convert_symbol(symbol, store_dir)
+            converted.append(symbol)
+        except Exception as e:
+            print(f"Failed to convert price data for {symbol}: {e}")
+    return converted
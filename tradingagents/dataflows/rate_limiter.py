@@ -0,0 +1,201 @@
+"""Client-side token-bucket rate limiting for the Alpha Vantage API.
+
+Every request takes one token from a bucket that refills at the configured
+requests-per-minute. When the bucket is empty the caller waits for the next
+token (up to ``max_wait_seconds``) instead of spending a call only to be told
+about the throttling by Alpha Vantage. Buckets are kept per API key and can be
+shared between threads only (``local``), between the processes of one machine
+through a lock file (``file``), or between machines through Redis (``redis``).
+
+Settings come from the nested ``alpha_vantage_rate_limit`` config dict; the
+``keys`` entry overrides them per API key, matched by the key itself or by its
+fingerprint as printed in rate-limit messages.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+from .config import get_config
+from .utils import file_lock
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "backend": "file",  # local | file | redis
+    "requests_per_minute": 5,
+    "burst": None,  # bucket capacity, defaults to requests_per_minute
+    "max_wait_seconds": 60,  # queue at most this long before giving up
+    "redis_url": None,  # defaults to $TRADINGAGENTS_REDIS_URL, then localhost
+    "state_dir": None,  # file backend, defaults to <data_cache_dir>/rate_limits
+    "keys": {},  # per-key overrides of the settings above
+}
+
+
+class RateLimitTimeout(Exception):
+    """Raised when no token became available within ``max_wait_seconds``."""
+
+    def __init__(self, bucket: str, waited: float):
+        super().__init__(f"no request slot for '{bucket}' after waiting {waited:.1f}s")
+        self.bucket = bucket
+        self.waited = waited
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short stable identifier for an API key that is safe to log and store."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+def get_limit_settings(api_key: Optional[str] = None) -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("alpha_vantage_rate_limit") or {})
+    if api_key:
+        overrides = settings.get("keys") or {}
+        settings.update(overrides.get(api_key) or overrides.get(key_fingerprint(api_key)) or {})
+    return settings
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, capacity: float) -> Tuple[float, float]:
+    """Take one token if possible; return ``(tokens_left, seconds_to_wait)``."""
+    tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    if tokens >= 1.0:
+        return tokens - 1.0, 0.0
+    return tokens, (1.0 - tokens) / rate
+
+
+class _LocalBackend:
+    """Buckets shared by the threads of this process."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def try_take(self, bucket: str, rate: float, capacity: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(bucket, (capacity, now))
+            tokens, wait = _refill(tokens, updated, now, rate, capacity)
+            self._buckets[bucket] = (tokens, now)
+            return wait
+
+
+class _FileBackend:
+    """Buckets stored as small JSON files, updated under an exclusive file lock."""
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+
+    def try_take(self, bucket: str, rate: float, capacity: float) -> float:
+        path = os.path.join(self.state_dir, f"{bucket}.json")
+        with file_lock(f"{path}.lock"):
+            now = time.time()
+            tokens, updated = capacity, now
+            if os.path.exists(path):
+                try:
+                    with open(path, "r") as f:
+                        state = json.load(f)
+                    tokens, updated = state["tokens"], state["updated"]
+                except (ValueError, KeyError, OSError):
+                    pass
+            tokens, wait = _refill(tokens, updated, now, rate, capacity)
+            with open(path, "w") as f:
+                json.dump({"tokens": tokens, "updated": now}, f)
+            return wait
+
+
+# Same refill rule as _refill, evaluated atomically inside Redis
+_REDIS_TAKE = """
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""
+
+
+class _RedisBackend:
+    """Buckets kept in Redis (or any server speaking its protocol with Lua support)."""
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._take = self._client.register_script(_REDIS_TAKE)
+
+    def try_take(self, bucket: str, rate: float, capacity: float) -> float:
+        return float(self._take(keys=[f"tradingagents:ratelimit:{bucket}"], args=[rate, capacity]))
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def _get_backend(settings: dict):
+    name = settings["backend"]
+    if name == "redis":
+        url = settings["redis_url"] or os.getenv("TRADINGAGENTS_REDIS_URL", "redis://localhost:6379/0")
+        key = ("redis", url)
+    elif name == "file":
+        state_dir = settings["state_dir"] or os.path.join(get_config()["data_cache_dir"], "rate_limits")
+        key = ("file", state_dir)
+    else:
+        key = ("local",)
+
+    with _backends_lock:
+        if key not in _backends:
+            if key[0] == "redis":
+                try:
+                    backend = _RedisBackend(key[1])
+                    backend._client.ping()
+                except Exception as e:
+                    print(f"WARNING: Redis rate limiter unavailable ({e}), using a lock file instead")
+                    backend = _FileBackend(os.path.join(get_config()["data_cache_dir"], "rate_limits"))
+            elif key[0] == "file":
+                os.makedirs(key[1], exist_ok=True)
+                backend = _FileBackend(key[1])
+            else:
+                backend = _LocalBackend()
+            _backends[key] = backend
+        return _backends[key]
+
+
+def acquire(name: str, api_key: Optional[str] = None) -> float:
+    """Block until one request to ``name`` may be sent with ``api_key``.
+
+    Returns the number of seconds spent waiting.
+
+    Raises:
+        RateLimitTimeout: When no token became available within ``max_wait_seconds``
+    """
+    settings = get_limit_settings(api_key)
+    if not settings["enabled"] or not settings["requests_per_minute"]:
+        return 0.0
+
+    rate = settings["requests_per_minute"] / 60.0
+    capacity = float(settings["burst"] or settings["requests_per_minute"])
+    bucket = f"{name}-{key_fingerprint(api_key)}" if api_key else name
+    backend = _get_backend(settings)
+
+    start = time.monotonic()
+    while True:
+        wait = backend.try_take(bucket, rate, capacity)
+        waited = time.monotonic() - start
+        if wait <= 0:
+            return waited
+        if waited + wait > settings["max_wait_seconds"]:
+            raise RateLimitTimeout(bucket, waited)
+        time.sleep(wait)
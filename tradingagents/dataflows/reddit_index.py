@@ -0,0 +1,212 @@
+"""Per-day byte-offset index over the Reddit JSONL corpus.
+
+For every ``{data_path}/{category}/{subreddit}.jsonl`` file the indexer records,
+per UTC date, the byte offset, length and upvotes of each post, pre-sorted by
+upvotes. Indexes live under ``{data_path}/_index/{category}/`` so the category
+directories (whose file count sets the per-subreddit limit) stay untouched.
+A window query then seeks straight to the posts of the requested days instead
+of parsing the whole corpus once per day.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from .utils import LRUCache, atomic_write, file_lock
+
+INDEX_DIR = "_index"
+INDEX_VERSION = 1
+
+# index path -> (size, mtime_ns, days)
+_INDEXES = LRUCache(maxsize=256)
+
+
+def _index_path(data_path: str, category: str, data_file: str) -> str:
+    return os.path.join(data_path, INDEX_DIR, category, f"{data_file}.idx.json")
+
+
+def _file_signature(path: str):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _build_file_index(path: str) -> Dict[str, list]:
+    """Scan one JSONL file into ``{date: [[offset, length, upvotes], ...]}``."""
+    days: Dict[str, list] = {}
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            length = len(line)
+            if line.strip():
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                days.setdefault(post_date, []).append([offset, length, parsed_line["ups"]])
+            offset += length
+
+    # Stable sort keeps file order among equal upvotes, matching a full scan + sort
+    for entries in days.values():
+        entries.sort(key=lambda entry: entry[2], reverse=True)
+    return days
+
+
+def load_file_index(data_path: str, category: str, data_file: str) -> Dict[str, list]:
+    """Return the day index for one subreddit file, (re)building it when stale."""
+    path = os.path.join(data_path, category, data_file)
+    index_path = _index_path(data_path, category, data_file)
+    size, mtime_ns = _file_signature(path)
+
+    cached = _INDEXES.get(index_path)
+    if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+        return cached[2]
+
+    days = None
+    if os.path.exists(index_path):
+        with open(index_path, "r") as f:
+            stored = json.load(f)
+        if (
+            stored.get("version") == INDEX_VERSION
+            and stored.get("size") == size
+            and stored.get("mtime_ns") == mtime_ns
+        ):
+            days = stored["days"]
+
+    if days is None:
+        os.makedirs(os.path.dirname(index_path), exist_ok=True)
+        with file_lock(f"{index_path}.lock"):
+            days = _build_file_index(path)
+            with atomic_write(index_path) as f:
+                json.dump(
+                    {"version": INDEX_VERSION, "size": size, "mtime_ns": mtime_ns, "days": days},
+                    f,
+                )
+
+    _INDEXES.put(index_path, (size, mtime_ns, days))
+    return days
+
+
+def build_reddit_index(data_path: str, categories: Optional[List[str]] = None) -> List[str]:
+    """One-time indexing of every ``.jsonl`` file under ``data_path``.
+
+    Returns the list of indexed ``category/file`` entries.
+    """
+    if not categories:
+        categories = sorted(
+            name
+            for name in os.listdir(data_path)
+            if name != INDEX_DIR and os.path.isdir(os.path.join(data_path, name))
+        )
+
+    indexed = []
+    for category in categories:
+        for data_file in sorted(os.listdir(os.path.join(data_path, category))):
+            if not data_file.endswith(".jsonl"):
+                continue
+            load_file_index(data_path, category, data_file)
+            indexed.append(f"{category}/{data_file}")
+    return indexed
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    curr = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    dates = []
+    while curr <= end:
+        dates.append(curr.strftime("%Y-%m-%d"))
+        curr += timedelta(days=1)
+    return dates
+
+
+def fetch_top_window(
+    category: str,
+    start_date: str,
+    end_date: str,
+    max_limit: int,
+    matcher=None,
+    data_path: str = "reddit_data",
+) -> Dict[str, List[dict]]:
+    """Top posts per day for every day from ``start_date`` to ``end_date``.
+
+    Args:
+        category: Category folder (collection of subreddits)
+        start_date: First day, yyyy-mm-dd
+        end_date: Last day, yyyy-mm-dd
+        max_limit: Maximum posts per day, split evenly across the subreddit files
+        matcher: Optional predicate on the parsed post; non-matching posts are skipped
+        data_path: Path to the reddit data folder
+
+    Returns:
+        Mapping of each day to its posts, subreddit by subreddit in directory order.
+    """
+    if matcher is None:
+        match_keys = lambda parsed_line, keys: keys
+    else:
+        match_keys = lambda parsed_line, keys: keys if matcher(parsed_line) else ()
+    return fetch_top_window_batch(
+        category, start_date, end_date, max_limit, [None], match_keys, data_path
+    )[None]
+
+
+def fetch_top_window_batch(
+    category: str,
+    start_date: str,
+    end_date: str,
+    max_limit: int,
+    keys: List,
+    match_keys,
+    data_path: str = "reddit_data",
+) -> Dict[object, Dict[str, List[dict]]]:
+    """``fetch_top_window`` for several filters at once, parsing each post at most once.
+
+    Args:
+        keys: Filter keys, e.g. tickers
+        match_keys: ``match_keys(parsed_line, pending_keys)`` returning the keys the post matches
+
+    Returns:
+        Mapping of each key to its ``{day: posts}`` result.
+    """
+    category_dir = os.path.join(data_path, category)
+    listing = os.listdir(category_dir)
+
+    if max_limit < len(listing):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
+
+    limit_per_subreddit = max_limit // len(listing)
+    dates = _date_range(start_date, end_date)
+    results = {key: {date: [] for date in dates} for key in keys}
+
+    for data_file in listing:
+        if not data_file.endswith(".jsonl"):
+            continue
+
+        days = load_file_index(data_path, category, data_file)
+        with open(os.path.join(category_dir, data_file), "rb") as f:
+            for date in dates:
+                selected = {key: [] for key in keys}
+                pending = [key for key in keys if limit_per_subreddit > 0]
+                for offset, length, _ in days.get(date, []):
+                    if not pending:
+                        break
+                    f.seek(offset)
+                    parsed_line = json.loads(f.read(length))
+                    matched = match_keys(parsed_line, pending)
+                    if not matched:
+                        continue
+                    post = {
+                        "title": parsed_line["title"],
+                        "content": parsed_line["selftext"],
+                        "url": parsed_line["url"],
+                        "upvotes": parsed_line["ups"],
+                        "posted_date": date,
+                    }
+                    for key in matched:
+                        selected[key].append(dict(post))
+                    pending = [key for key in pending if len(selected[key]) < limit_per_subreddit]
+                for key in keys:
+                    results[key][date].extend(selected[key])
+
+    return results
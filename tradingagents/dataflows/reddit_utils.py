@@ -1,52 +1,20 @@
-import requests
-import time
-import json
-from datetime import datetime, timedelta
-from contextlib import contextmanager
 from typing import Annotated
-import os
-import re
+from .reddit_index import fetch_top_window, fetch_top_window_batch
+from .company_matcher import ticker_to_company, mentions_company, get_company_matcher
 
-ticker_to_company = {
-    "AAPL": "Apple",
-    "MSFT": "Microsoft",
-    "GOOGL": "Google",
-    "AMZN": "Amazon",
-    "TSLA": "Tesla",
-    "NVDA": "Nvidia",
-    "TSM": "Taiwan Semiconductor Manufacturing Company OR TSMC",
-    "JPM": "JPMorgan Chase OR JP Morgan",
-    "JNJ": "Johnson & Johnson OR JNJ",
-    "V": "Visa",
-    "WMT": "Walmart",
-    "META": "Meta OR Facebook",
-    "AMD": "AMD",
-    "INTC": "Intel",
-    "QCOM": "Qualcomm",
-    "BABA": "Alibaba",
-    "ADBE": "Adobe",
-    "NFLX": "Netflix",
-    "CRM": "Salesforce",
-    "PYPL": "PayPal",
-    "PLTR": "Palantir",
-    "MU": "Micron",
-    "SQ": "Block OR Square",
-    "ZM": "Zoom",
-    "CSCO": "Cisco",
-    "SHOP": "Shopify",
-    "ORCL": "Oracle",
-    "X": "Twitter OR X",
-    "SPOT": "Spotify",
-    "AVGO": "Broadcom",
-    "ASML": "ASML ",
-    "TWLO": "Twilio",
-    "SNAP": "Snap Inc.",
-    "TEAM": "Atlassian",
-    "SQSP": "Squarespace",
-    "UBER": "Uber",
-    "ROKU": "Roku",
-    "PINS": "Pinterest",
-}
+
+def make_query_matcher(category: str, query: str = None):
+    """Predicate selecting posts whose title or content mentions the company (company news only)."""
+    if "company" not in category or not query:
+        return None
+
+    # Raises KeyError for unknown tickers, like the original per-term loop
+    ticker_to_company[query]
+
+    def matches(parsed_line):
+        return mentions_company(query, parsed_line["title"], parsed_line["selftext"])
+
+    return matches
 
 
 def fetch_top_from_category(
@@ -61,75 +29,71 @@ def fetch_top_from_category(
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
-    base_path = data_path
-
-    all_content = []
-
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
-        raise ValueError(
-            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
-        )
-
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    return fetch_top_window(
+        category,
+        date,
+        date,
+        max_limit,
+        matcher=make_query_matcher(category, query),
+        data_path=data_path,
+    )[date]
+
+
+def fetch_top_from_category_window(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from."],
+    end_date: Annotated[str, "Last date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """Top posts for each day in the window, in date order, read through the day index."""
+    per_day = fetch_top_window(
+        category,
+        start_date,
+        end_date,
+        max_limit,
+        matcher=make_query_matcher(category, query),
+        data_path=data_path,
     )
+    return [post for date in sorted(per_day) for post in per_day[date]]
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
-
-        all_content_curr_subreddit = []
 
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
-
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
-
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
-
-                    search_terms.append(query)
-
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
-
-                    if not found:
-                        continue
-
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
-
-                all_content_curr_subreddit.append(post)
+def fetch_company_news_window_batch(
+    queries: Annotated[list, "Ticker symbols to collect company news for."],
+    start_date: Annotated[str, "First date to fetch top posts from."],
+    end_date: Annotated[str, "Last date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ] = "company_news",
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    """``fetch_top_from_category_window`` for many tickers with a single scan of the corpus.
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    Returns a mapping of each ticker to the posts a per-ticker call would return.
+    """
+    queries = list(dict.fromkeys(queries))
+    for query in queries:
+        ticker_to_company[query]
+    matcher = get_company_matcher(tuple(queries))
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+    def match_keys(parsed_line, pending):
+        return matcher.match(parsed_line["title"], parsed_line["selftext"], tickers=pending)
 
-    return all_content
+    per_query = fetch_top_window_batch(
+        category, start_date, end_date, max_limit, queries, match_keys, data_path
+    )
+    return {
+        query: [post for date in sorted(per_day) for post in per_day[date]]
+        for query, per_day in per_query.items()
+    }
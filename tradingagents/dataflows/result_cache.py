@@ -0,0 +1,342 @@
+"""Tiered cache for ``route_to_vendor`` results.
+
+Results are keyed on (method, configured vendor, normalized arguments) and kept
+for a per-category TTL, with per-method overrides. Lookups go through the
+configured tiers in order. The tiers are an in-process LRU, pickles under the
+data cache directory, and Redis. A hit in a slower tier is copied into the
+faster ones for the rest of its lifetime. Concurrent misses on one key share a
+single upstream fetch.
+
+Only successful results are stored. Vendor failures always reach the caller,
+whether raised or returned as an error or no-data message (several vendors
+report failures that way), so a brief outage is not served from the cache.
+The disk tier is kept under ``disk_max_mb`` by evicting the least recently
+used entries. Settings come from the nested ``result_cache`` config dict.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional
+
+from .config import get_config
+from .utils import LRUCache, SingleFlight, atomic_write
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "tiers": ["memory", "disk"],  # any of memory, disk, redis, fastest first
+    "memory_size": 512,
+    "disk_dir": None,  # defaults to <data_cache_dir>/result_cache
+    "disk_max_mb": 512,
+    "redis_url": None,  # defaults to $TRADINGAGENTS_REDIS_URL, then localhost
+    "ttl_seconds": {
+        # by category, or by method name to override its category
+        "core_stock_apis": 6 * 3600,
+        "technical_indicators": 6 * 3600,
+        "fundamental_data": 24 * 3600,
+        "news_data": 3600,
+    },
+    "default_ttl_seconds": 3600,
+}
+
+# Arguments that name a security are case-insensitive for every vendor
+_SYMBOL_PARAMS = {"symbol", "ticker"}
+
+# Messages vendors return instead of raising, e.g. "Error retrieving balance
+# sheet for X: ..." or "No data found for symbol 'X' between ..."
+_FAILURE_MESSAGE = re.compile(r"^\s*(error\b|failed\b|no\b[^\n]*\b(data|found|available)\b)", re.IGNORECASE)
+
+
+def is_cacheable(value) -> bool:
+    """False for empty results and for error/no-data messages returned in place of data."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip()) and not _FAILURE_MESSAGE.match(value)
+    empty = getattr(value, "empty", None)
+    if isinstance(empty, bool):
+        return not empty
+    if isinstance(value, (list, tuple, dict, set)):
+        return len(value) > 0
+    return True
+
+
+def get_cache_settings() -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("result_cache") or {})
+    return settings
+
+
+def normalize_args(func: Optional[Callable], args: tuple, kwargs: dict) -> dict:
+    """Name every argument after ``func``'s parameters so positional and keyword calls match."""
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        named = dict(bound.arguments)
+    except (TypeError, ValueError):
+        named = {f"_{i}": arg for i, arg in enumerate(args)}
+        named.update(kwargs)
+
+    normalized = {}
+    for name, value in named.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if name in _SYMBOL_PARAMS:
+                value = value.upper()
+        normalized[name] = value
+    return normalized
+
+
+def make_key(method: str, vendor: str, normalized: dict) -> str:
+    payload = json.dumps([method, vendor, normalized], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _MemoryTier:
+    name = "memory"
+
+    def __init__(self, maxsize: int):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, key):
+        # (expires_at, value) so promotions keep the original expiry
+        return self._cache.get(key)
+
+    def put(self, key, entry):
+        self._cache.put(key, entry, ttl=max(0.0, entry[0] - time.time()))
+
+    def clear(self):
+        self._cache.clear()
+
+
+class _DiskTier:
+    name = "disk"
+
+    def __init__(self, directory: str, max_mb: Optional[float] = None):
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024) if max_mb else None
+        # Bytes written since the directory was last measured; None until then
+        self._bytes = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pkl")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Unreadable or truncated entry: treat as a miss and drop it
+            entry = None
+        if entry is None or entry[0] <= time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        try:
+            # The modification time doubles as the last use for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        path = self._path(key)
+        with atomic_write(path, mode="wb") as f:
+            pickle.dump(entry, f)
+        if self.max_bytes:
+            with self._lock:
+                if self._bytes is None:
+                    self._bytes = sum(size for _, _, size in self._entries())
+                else:
+                    self._bytes += os.path.getsize(path)
+                if self._bytes > self.max_bytes:
+                    self._evict()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".pkl"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_mtime, stat.st_size
+
+    def _evict(self):
+        """Delete least recently used entries until the tier is under 90% of its limit.
+
+        Other processes may share the directory, so it is measured again here.
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * 0.9)
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+        self._bytes = total
+
+    def clear(self):
+        import shutil
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class _RedisTier:
+    name = "redis"
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._client.ping()
+
+    def get(self, key):
+        data = self._client.get(f"tradingagents:result:{key}")
+        return pickle.loads(data) if data is not None else None
+
+    def put(self, key, entry):
+        ttl = int(entry[0] - time.time())
+        if ttl > 0:
+            self._client.set(f"tradingagents:result:{key}", pickle.dumps(entry), ex=ttl)
+
+    def clear(self):
+        for key in self._client.scan_iter("tradingagents:result:*"):
+            self._client.delete(key)
+
+
+class ResultCache:
+    """Read-through cache over the configured tiers, with per-method counters."""
+
+    def __init__(self, settings: dict):
+        self.settings = settings
+        self.tiers = []
+        for name in settings["tiers"]:
+            try:
+                if name == "memory":
+                    self.tiers.append(_MemoryTier(settings["memory_size"]))
+                elif name == "disk":
+                    directory = settings["disk_dir"] or os.path.join(get_config()["data_cache_dir"], "result_cache")
+                    self.tiers.append(_DiskTier(directory, settings.get("disk_max_mb")))
+                elif name == "redis":
+                    url = settings["redis_url"] or os.getenv("TRADINGAGENTS_REDIS_URL", "redis://localhost:6379/0")
+                    self.tiers.append(_RedisTier(url))
+                else:
+                    print(f"WARNING: Unknown result cache tier '{name}', ignoring it")
+            except Exception as e:
+                print(f"WARNING: Result cache tier '{name}' unavailable: {e}")
+        self._flight = SingleFlight()
+        self._stats = defaultdict(lambda: defaultdict(int))
+        self._stats_lock = threading.Lock()
+
+    def ttl_for(self, method: str, category: str) -> float:
+        ttls = self.settings["ttl_seconds"] or {}
+        return ttls.get(method, ttls.get(category, self.settings["default_ttl_seconds"]))
+
+    def _count(self, method: str, event: str):
+        with self._stats_lock:
+            self._stats[method][event] += 1
+
+    def _lookup(self, key: str):
+        for i, tier in enumerate(self.tiers):
+            try:
+                entry = tier.get(key)
+            except Exception as e:
+                print(f"WARNING: Result cache {tier.name} read failed: {e}")
+                continue
+            if entry is not None and entry[0] > time.time():
+                for faster in self.tiers[:i]:
+                    self._store(faster, key, entry)
+                return tier.name, entry[1]
+        return None, None
+
+    def _store(self, tier, key: str, entry):
+        try:
+            tier.put(key, entry)
+        except Exception as e:
+            print(f"WARNING: Result cache {tier.name} write failed: {e}")
+
+    def get_or_fetch(self, method: str, category: str, key: str, fetch: Callable):
+        """Return the cached result for ``key`` or call ``fetch`` once and cache it."""
+        ttl = self.ttl_for(method, category)
+        if not self.tiers or not ttl or ttl <= 0:
+            return fetch()
+
+        tier_name, value = self._lookup(key)
+        if tier_name is not None:
+            self._count(method, f"{tier_name}_hits")
+            return value
+
+        def load():
+            # Another caller may have filled the cache while we waited for the flight
+            tier_name, value = self._lookup(key)
+            if tier_name is not None:
+                self._count(method, f"{tier_name}_hits")
+                return value
+            self._count(method, "misses")
+            value = fetch()
+            if not is_cacheable(value):
+                self._count(method, "uncached")
+                return value
+            entry = (time.time() + ttl, value)
+            for tier in self.tiers:
+                self._store(tier, key, entry)
+            return value
+
+        value, shared = self._flight.do(key, load)
+        if shared:
+            self._count(method, "shared")
+        return value
+
+    def stats(self, method: str = None) -> Dict[str, dict]:
+        """Hit/miss counters per method; ``hits`` sums every tier."""
+        with self._stats_lock:
+            snapshot = {m: dict(counts) for m, counts in self._stats.items() if method in (None, m)}
+        for counts in snapshot.values():
+            hits = sum(v for k, v in counts.items() if k.endswith("_hits")) + counts.get("shared", 0)
+            lookups = hits + counts.get("misses", 0)
+            counts["hits"] = hits
+            counts["hit_rate"] = hits / lookups if lookups else 0.0
+        return snapshot
+
+    def clear(self):
+        for tier in self.tiers:
+            tier.clear()
+        with self._stats_lock:
+            self._stats.clear()
+
+
+_cache = None
+_cache_settings = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Process-wide cache for the current settings, or None when disabled."""
+    global _cache, _cache_settings
+    settings = get_cache_settings()
+    if not settings["enabled"]:
+        return None
+    with _cache_lock:
+        if _cache is None or _cache_settings != settings:
+            _cache = ResultCache(settings)
+            _cache_settings = settings
+        return _cache
@@ -0,0 +1,218 @@
+"""Pre-indexed store for the SimFin fundamentals CSVs.
+
+The market-wide ``us-*-{freq}.csv`` files are parsed once (dates normalized to
+UTC days), sorted stably by (Ticker, Publish Date) and saved next to the source
+data as a directory of ``.npy`` columns plus a ``meta.json``, like the price
+store. Nothing is pickled, so the files load on any pandas version and cannot
+run code. Loaded tables keep a ticker -> row-range index, so "latest statement
+published on or before X" is a dictionary lookup plus a binary search over that
+ticker's publish dates.
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .utils import LRUCache, file_lock
+
+# statement -> (folder, file prefix)
+STATEMENTS = {
+    "balance_sheet": ("balance_sheet", "us-balance"),
+    "cashflow": ("cash_flow", "us-cashflow"),
+    "income": ("income_statements", "us-income"),
+}
+FREQUENCIES = ("annual", "quarterly")
+META_FILE = "meta.json"
+
+_TABLES = LRUCache(maxsize=12)
+
+
+def get_source_path(statement: str, freq: str, data_dir: str) -> str:
+    folder, prefix = STATEMENTS[statement]
+    return os.path.join(
+        data_dir,
+        "fundamental_data",
+        "simfin_data_all",
+        folder,
+        "companies",
+        "us",
+        f"{prefix}-{freq}.csv",
+    )
+
+
+def get_store_path(statement: str, freq: str, data_dir: str) -> str:
+    _, prefix = STATEMENTS[statement]
+    return os.path.join(data_dir, "fundamental_data", "simfin_store", f"{prefix}-{freq}")
+
+
+def _meta_path(store_path: str) -> str:
+    return os.path.join(store_path, META_FILE)
+
+
+def save_frame(frame: pd.DataFrame, store_path: str):
+    """Write ``frame`` as one ``.npy`` file per column, replacing ``store_path`` atomically.
+
+    Numeric columns keep their dtype, dates are stored as UTC ``datetime64[ns]``
+    and everything else as fixed-width unicode with a missing-value mask.
+    """
+    tmp_path = f"{store_path}.tmp-{os.getpid()}"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    columns = []
+    for i, name in enumerate(frame.columns):
+        values = frame[name]
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            kind = "date"
+            data = values.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+        elif pd.api.types.is_numeric_dtype(values):
+            kind = "number"
+            data = values.to_numpy()
+        else:
+            kind = "string"
+            missing = values.isna().to_numpy()
+            data = np.where(missing, "", values.astype(str)).astype(str)
+            np.save(os.path.join(tmp_path, f"col{i}_missing.npy"), missing)
+        np.save(os.path.join(tmp_path, f"col{i}.npy"), data)
+        columns.append({"name": name, "kind": kind})
+    np.save(os.path.join(tmp_path, "index.npy"), frame.index.to_numpy(dtype=np.int64))
+
+    with open(os.path.join(tmp_path, META_FILE), "w") as f:
+        json.dump({"columns": columns, "rows": int(len(frame))}, f, indent=2)
+
+    shutil.rmtree(store_path, ignore_errors=True)
+    os.rename(tmp_path, store_path)
+
+
+def load_frame(store_path: str) -> pd.DataFrame:
+    """Rebuild the frame written by ``save_frame``."""
+    with open(_meta_path(store_path), "r") as f:
+        meta = json.load(f)
+    data = {}
+    for i, column in enumerate(meta["columns"]):
+        values = np.load(os.path.join(store_path, f"col{i}.npy"), allow_pickle=False)
+        if column["kind"] == "date":
+            values = pd.DatetimeIndex(values).tz_localize("UTC")
+        elif column["kind"] == "string":
+            missing = np.load(os.path.join(store_path, f"col{i}_missing.npy"), allow_pickle=False)
+            values = values.astype(object)
+            values[missing] = np.nan
+        data[column["name"]] = values
+    index = np.load(os.path.join(store_path, "index.npy"), allow_pickle=False)
+    return pd.DataFrame(data, index=index)
+
+
+class FundamentalsTable:
+    """One statement file sorted by (Ticker, Publish Date) with a per-ticker row index."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.publish_dates = frame["Publish Date"].values
+        tickers = frame["Ticker"].to_numpy()
+        starts = np.flatnonzero(np.r_[True, tickers[1:] != tickers[:-1]]) if len(tickers) else []
+        ends = list(starts[1:]) + [len(tickers)]
+        self.ticker_rows = {tickers[start]: (start, end) for start, end in zip(starts, ends)}
+
+    @staticmethod
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize the date columns and sort, keeping the original row labels."""
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+        # Stable sort so tied publish dates keep file order, as idxmax would pick
+        return df.sort_values(["Ticker", "Publish Date"], kind="stable", na_position="last")
+
+    def latest(self, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """Most recent statement for ``ticker`` published on or before ``curr_date``."""
+        rows = self.ticker_rows.get(ticker)
+        if rows is None:
+            return None
+        start, end = rows
+        dates = self.publish_dates[start:end]
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize().to_datetime64()
+
+        pos = int(np.searchsorted(dates, curr_date_dt, side="right"))
+        if pos == 0:
+            return None
+        # First row among those sharing the latest publish date
+        first = int(np.searchsorted(dates, dates[pos - 1], side="left"))
+        return self.frame.iloc[start + first]
+
+    def latest_many(self, tickers: Iterable[str], curr_date: str) -> Dict[str, Optional[pd.Series]]:
+        return {ticker: self.latest(ticker, curr_date) for ticker in tickers}
+
+
+def _is_fresh(store_path: str, source_path: str) -> bool:
+    meta_path = _meta_path(store_path)
+    return os.path.exists(meta_path) and (
+        not os.path.exists(source_path)
+        or os.path.getmtime(meta_path) >= os.path.getmtime(source_path)
+    )
+
+
+def convert_statement(statement: str, freq: str, data_dir: Optional[str] = None) -> str:
+    """Convert one SimFin CSV into the store and return the stored table's directory."""
+    data_dir = data_dir or get_config()["data_dir"]
+    source_path = get_source_path(statement, freq, data_dir)
+    store_path = get_store_path(statement, freq, data_dir)
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+
+    frame = FundamentalsTable.prepare(pd.read_csv(source_path, sep=";"))
+    save_frame(frame, store_path)
+    _TABLES.pop(store_path)
+    return store_path
+
+
+def get_fundamentals_table(statement: str, freq: str, data_dir: Optional[str] = None) -> FundamentalsTable:
+    """Return the cached table, converting the source CSV on first use or when it changed."""
+    data_dir = data_dir or get_config()["data_dir"]
+    source_path = get_source_path(statement, freq, data_dir)
+    store_path = get_store_path(statement, freq, data_dir)
+
+    if not _is_fresh(store_path, source_path):
+        os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        with file_lock(f"{store_path}.lock"):
+            if not _is_fresh(store_path, source_path):
+                convert_statement(statement, freq, data_dir)
+
+    mtime = os.path.getmtime(_meta_path(store_path))
+    cached = _TABLES.get(store_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    table = FundamentalsTable(load_frame(store_path))
+    _TABLES.put(store_path, (mtime, table))
+    return table
+
+
+def get_latest_statement(
+    statement: str, ticker: str, freq: str, curr_date: str, data_dir: Optional[str] = None
+) -> Optional[pd.Series]:
+    """Latest ``statement`` row for ``ticker`` published on or before ``curr_date``, or None."""
+    return get_fundamentals_table(statement, freq, data_dir).latest(ticker, curr_date)
+
+
+def get_latest_statements(
+    statement: str, tickers: Iterable[str], freq: str, curr_date: str, data_dir: Optional[str] = None
+) -> Dict[str, Optional[pd.Series]]:
+    """Batch form of ``get_latest_statement`` for many tickers against one loaded table."""
+    return get_fundamentals_table(statement, freq, data_dir).latest_many(tickers, curr_date)
+
+
+def build_simfin_store(data_dir: Optional[str] = None) -> List[str]:
+    """One-time conversion of every available SimFin statement file."""
+    data_dir = data_dir or get_config()["data_dir"]
+    converted = []
+    for statement in STATEMENTS:
+        for freq in FREQUENCIES:
+            if not os.path.exists(get_source_path(statement, freq, data_dir)):
+                continue
+            try:
+                converted.append(convert_statement(statement, freq, data_dir))
+            except Exception as e:
+                print(f"Failed to convert SimFin {statement} ({freq}): {e}")
+    return converted
@@ -1,6 +1,11 @@
 import os
 import json
+import tempfile
+import threading
+import time
 import pandas as pd
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import date, timedelta, datetime
 from typing import Annotated
 
@@ -37,3 +42,141 @@ def get_next_weekday(date):
         return next_weekday
     else:
         return date
+
+
+class LRUCache:
+    """Thread-safe bounded mapping that evicts the least recently used entry.
+
+    Entries may carry a time-to-live in seconds; expired entries read as missing.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # key -> (expires_at or None, value)
+        self._lock = threading.Lock()
+
+    def _live(self, key) -> bool:
+        expires_at = self._data[key][0]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return False
+        return True
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data or not self._live(key):
+                return default
+            self._data.move_to_end(key)
+            return self._data[key][1]
+
+    def put(self, key, value, ttl: float = None):
+        with self._lock:
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._data or not self._live(key):
+                return default
+            return self._data.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data and self._live(key)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it runs wait
+    and receive the same result (or exception) instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        """Return ``(result, shared)``; ``shared`` is True for callers that waited."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "result": None, "error": None}
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"], True
+
+        try:
+            call["result"] = fn()
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+        return call["result"], False
+
+
+@contextmanager
+def file_lock(path: str):
+    """Hold an exclusive advisory lock on ``path`` across threads and processes."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "w"):
+    """Write to a temporary sibling of ``path`` and rename it into place on success."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,207 @@
+"""Per-(vendor, method) health tracking for ``route_to_vendor``.
+
+Every vendor call reports its outcome and latency here. A vendor whose recent
+calls keep failing has its circuit opened for a cool-down period, during which
+routing skips it instead of paying for the failure again; a rate-limit error
+opens the circuit for every method of that vendor at once. After the cool-down
+one trial call is let through (half-open) and its outcome closes or re-opens
+the circuit. Rolling error rates and latency percentiles are kept per
+(vendor, method) and exposed through ``get_vendor_health().stats()``.
+
+Settings come from the nested ``vendor_health`` config dict.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import get_config
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "window": 50,  # calls kept per (vendor, method) for rates and percentiles
+    "failure_threshold": 3,  # consecutive failures that open the circuit
+    "cooldown_seconds": 60,
+    "rate_limit_cooldown_seconds": 60,
+    "reorder_by_latency": False,  # sort fallback vendors by observed p50 latency
+}
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Key used for vendor-wide circuits (rate limits apply to the API key, not a method)
+ALL_METHODS = "*"
+
+
+def get_health_settings() -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("vendor_health") or {})
+    return settings
+
+
+class _Circuit:
+    def __init__(self, window: int):
+        self.calls = deque(maxlen=window)  # (ok, latency)
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.open_until = 0.0
+        self.trial_in_flight = False
+        self.last_error = None
+        self.open_reason = None
+        self.skipped = 0
+
+
+class VendorHealthRegistry:
+    """Thread-safe circuit breakers and rolling stats keyed by (vendor, method)."""
+
+    def __init__(self):
+        self._circuits: Dict[Tuple[str, str], _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, vendor: str, method: str) -> _Circuit:
+        key = (vendor, method)
+        if key not in self._circuits:
+            self._circuits[key] = _Circuit(get_health_settings()["window"])
+        return self._circuits[key]
+
+    def _open(self, circuit: _Circuit, cooldown: float, reason: str):
+        circuit.state = OPEN
+        circuit.open_until = time.time() + cooldown
+        circuit.trial_in_flight = False
+        circuit.open_reason = reason
+
+    def record_success(self, vendor: str, method: str, latency: float):
+        with self._lock:
+            circuit = self._circuit(vendor, method)
+            circuit.calls.append((True, latency))
+            circuit.consecutive_failures = 0
+            circuit.state = CLOSED
+            circuit.trial_in_flight = False
+            vendor_circuit = self._circuits.get((vendor, ALL_METHODS))
+            if vendor_circuit is not None and vendor_circuit.state == HALF_OPEN:
+                vendor_circuit.state = CLOSED
+                vendor_circuit.trial_in_flight = False
+
+    def record_failure(self, vendor: str, method: str, latency: float, error: Exception = None, rate_limited: bool = False):
+        settings = get_health_settings()
+        with self._lock:
+            circuit = self._circuit(vendor, method)
+            circuit.calls.append((False, latency))
+            circuit.consecutive_failures += 1
+            circuit.last_error = f"{type(error).__name__}: {error}" if error is not None else None
+
+            vendor_circuit = self._circuits.get((vendor, ALL_METHODS))
+            if not rate_limited and vendor_circuit is not None and vendor_circuit.state == HALF_OPEN:
+                # The trial call got through without being throttled
+                vendor_circuit.state = CLOSED
+                vendor_circuit.trial_in_flight = False
+
+            if rate_limited:
+                vendor_circuit = self._circuit(vendor, ALL_METHODS)
+                vendor_circuit.last_error = circuit.last_error
+                self._open(vendor_circuit, settings["rate_limit_cooldown_seconds"], "rate limited")
+            elif circuit.state == HALF_OPEN:
+                self._open(circuit, settings["cooldown_seconds"], "trial call failed")
+            elif circuit.consecutive_failures >= settings["failure_threshold"]:
+                self._open(
+                    circuit,
+                    settings["cooldown_seconds"],
+                    f"{circuit.consecutive_failures} consecutive failures",
+                )
+
+    def _check(self, circuit: Optional[_Circuit], now: float) -> Tuple[Optional[str], bool]:
+        """``(reason to skip, whether this check claimed the half-open trial)``."""
+        if circuit is None or circuit.state == CLOSED:
+            return None, False
+        if circuit.state == OPEN and now >= circuit.open_until:
+            circuit.state = HALF_OPEN
+        if circuit.state == HALF_OPEN:
+            if circuit.trial_in_flight:
+                return "circuit half-open, trial call in flight", False
+            circuit.trial_in_flight = True
+            return None, True
+        return f"circuit open ({circuit.open_reason}) for another {circuit.open_until - now:.0f}s", False
+
+    def check(self, vendor: str, method: str) -> Optional[str]:
+        """Reason to skip ``vendor`` for ``method`` right now, or None if it may be called.
+
+        The per-method circuit is checked first. The vendor-wide trial is only
+        claimed when the call goes ahead, and a per-method trial claimed by a
+        call the vendor-wide circuit then blocks is released again.
+        """
+        if not get_health_settings()["enabled"]:
+            return None
+        now = time.time()
+        with self._lock:
+            method_circuit = self._circuits.get((vendor, method))
+            reason, claimed = self._check(method_circuit, now)
+            if reason is None:
+                reason, _ = self._check(self._circuits.get((vendor, ALL_METHODS)), now)
+                if reason is not None and claimed:
+                    method_circuit.trial_in_flight = False
+            if reason is not None:
+                self._circuit(vendor, method).skipped += 1
+        return reason
+
+    def latency_percentile(self, vendor: str, method: str, q: float) -> Optional[float]:
+        with self._lock:
+            circuit = self._circuits.get((vendor, method))
+            latencies = [latency for ok, latency in circuit.calls if ok] if circuit else []
+        return float(np.percentile(latencies, q)) if latencies else None
+
+    def order_fallbacks(self, method: str, vendors: List[str], primary_vendors: List[str]) -> List[str]:
+        """Primary vendors in config order, then fallbacks by p50 latency when enabled."""
+        settings = get_health_settings()
+        if not (settings["enabled"] and settings["reorder_by_latency"]):
+            return vendors
+        primaries = [vendor for vendor in vendors if vendor in primary_vendors]
+        fallbacks = [vendor for vendor in vendors if vendor not in primary_vendors]
+
+        def latency_key(vendor):
+            p50 = self.latency_percentile(vendor, method, 50)
+            # Vendors without observations keep their relative order after the measured ones
+            return (p50 is None, p50 or 0.0)
+
+        return primaries + sorted(fallbacks, key=latency_key)
+
+    def stats(self, vendor: str = None, method: str = None) -> Dict[str, dict]:
+        """Snapshot of every tracked (vendor, method), keyed as ``"vendor:method"``."""
+        now = time.time()
+        snapshot = {}
+        with self._lock:
+            for (v, m), circuit in self._circuits.items():
+                if (vendor and v != vendor) or (method and m not in (method, ALL_METHODS)):
+                    continue
+                outcomes = list(circuit.calls)
+                latencies = [latency for ok, latency in outcomes if ok]
+                snapshot[f"{v}:{m}"] = {
+                    "vendor": v,
+                    "method": m,
+                    "state": circuit.state,
+                    "open_reason": circuit.open_reason if circuit.state != CLOSED else None,
+                    "open_for_seconds": max(0.0, circuit.open_until - now) if circuit.state == OPEN else 0.0,
+                    "calls": len(outcomes),
+                    "error_rate": (sum(1 for ok, _ in outcomes if not ok) / len(outcomes)) if outcomes else 0.0,
+                    "consecutive_failures": circuit.consecutive_failures,
+                    "latency_p50": float(np.percentile(latencies, 50)) if latencies else None,
+                    "latency_p95": float(np.percentile(latencies, 95)) if latencies else None,
+                    "skipped": circuit.skipped,
+                    "last_error": circuit.last_error,
+                }
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._circuits.clear()
+
+
+_registry = VendorHealthRegistry()
+
+
+def get_vendor_health() -> VendorHealthRegistry:
+    """Process-wide health registry used by ``route_to_vendor``."""
+    return _registry
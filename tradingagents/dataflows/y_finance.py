@@ -4,6 +4,11 @@ from dateutil.relativedelta import relativedelta
 import yfinance as yf
 import os
 from .stockstats_utils import StockstatsUtils
+from .price_store import get_price_table
+from .ohlcv_cache import load_ohlcv
+from .indicator_engine import NON_TRADING_DAY, compute_indicator_window
+from .output_formatter import format_dated_lines, format_table
+from .yfin_session import get_ticker_dataset, get_ticker_session
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -36,8 +41,8 @@ def get_YFin_data_online(
         if col in data.columns:
             data[col] = data[col].round(2)
 
-    # Convert DataFrame to CSV string
-    csv_string = data.to_csv()
+    # Compact CSV: constant columns (e.g. all-zero Dividends) dropped, long windows sampled
+    csv_string = format_table("get_stock_data", data)
 
     # Add header information
     header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
@@ -46,6 +51,81 @@ def get_YFin_data_online(
 
     return header + csv_string
 
+# Indicators supported by the stockstats-based vendors and their descriptions
+BEST_IND_PARAMS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -55,130 +135,110 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in BEST_IND_PARAMS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
         )
 
     end_date = curr_date
     curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
     before = curr_date_dt - relativedelta(days=look_back_days)
 
-    # Optimized: Get stock data once and calculate indicators for all dates
+    # Vectorized engine: all values are computed in one pass and memoized per as-of date
     try:
-        indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
-        # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+        dates, values = compute_indicator_window(symbol, [indicator], curr_date, look_back_days)
+        rows = list(zip(dates, values[indicator]))
+
     except Exception as e:
-        print(f"Error getting bulk stockstats data: {e}")
-        # Fallback to original implementation if bulk method fails
-        ind_string = ""
-        curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
-        while curr_date_dt >= before:
-            indicator_value = get_stockstats_indicator(
-                symbol, indicator, curr_date_dt.strftime("%Y-%m-%d")
-            )
-            ind_string += f"{curr_date_dt.strftime('%Y-%m-%d')}: {indicator_value}\n"
-            curr_date_dt = curr_date_dt - relativedelta(days=1)
+        print(f"Error computing {indicator} with the indicator engine: {e}")
+        # Fallback to the stockstats implementation if the engine fails
+        rows = []
+        try:
+            indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
+            current_dt = curr_date_dt
+            while current_dt >= before:
+                date_str = current_dt.strftime('%Y-%m-%d')
+                rows.append((date_str, indicator_data.get(date_str, NON_TRADING_DAY)))
+                current_dt = current_dt - relativedelta(days=1)
+        except Exception as e:
+            print(f"Error getting bulk stockstats data: {e}")
+            rows = []
+            while curr_date_dt >= before:
+                indicator_value = get_stockstats_indicator(
+                    symbol, indicator, curr_date_dt.strftime("%Y-%m-%d")
+                )
+                rows.append((curr_date_dt.strftime('%Y-%m-%d'), indicator_value))
+                curr_date_dt = curr_date_dt - relativedelta(days=1)
+
+    # Trading days only, sampled down if the window exceeds the tool's budget
+    ind_string = format_dated_lines("get_indicators", rows)
 
     result_str = (
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + BEST_IND_PARAMS.get(indicator, "No description available.")
+    )
+
+    return result_str
+
+
+def get_stock_stats_indicators_table(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list, "technical indicators to get the analysis and report of"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    look_back_days: Annotated[int, "how many days to look back"],
+) -> str:
+    """Date-aligned table of several indicators, computed from a single price load."""
+    import pandas as pd
+
+    indicators = list(dict.fromkeys(indicators))
+    unsupported = [name for name in indicators if name not in BEST_IND_PARAMS]
+    if not indicators:
+        raise ValueError("No indicators requested.")
+    if unsupported:
+        raise ValueError(
+            f"Indicators {unsupported} are not supported. Please choose from: {list(BEST_IND_PARAMS.keys())}"
+        )
+
+    curr_date_dt = datetime.strptime(curr_date, "%Y-%m-%d")
+    before = curr_date_dt - relativedelta(days=look_back_days)
+
+    try:
+        dates, values = compute_indicator_window(symbol, indicators, curr_date, look_back_days)
+    except Exception as e:
+        print(f"Error computing {indicators} with the indicator engine: {e}")
+        # Fallback to the stockstats implementation, one indicator at a time
+        dates = []
+        current_dt = curr_date_dt
+        while current_dt >= before:
+            dates.append(current_dt.strftime("%Y-%m-%d"))
+            current_dt = current_dt - relativedelta(days=1)
+        values = {}
+        for name in indicators:
+            indicator_data = _get_stock_stats_bulk(symbol, name, curr_date)
+            values[name] = [
+                indicator_data.get(date_str, NON_TRADING_DAY) for date_str in dates
+            ]
+
+    # Only trading days carry values, so weekends and holidays are left out
+    trading = [i for i, value in enumerate(values[indicators[0]]) if value != NON_TRADING_DAY]
+    if trading:
+        table = pd.DataFrame(
+            {name: pd.to_numeric([values[name][i] for i in trading], errors="coerce") for name in indicators},
+            index=pd.Index([dates[i] for i in trading], name="Date"),
+        )
+        table_str = format_table("get_indicators_batch", table, newest_first=True, prune_columns=False)
+    else:
+        table_str = "No trading days in the specified date range.\n"
+
+    result_str = (
+        f"## Indicators for {symbol.upper()} from {before.strftime('%Y-%m-%d')} to {curr_date} (trading days only):\n\n"
+        + table_str
+        + "\n"
+        + "\n".join(f"- {name}: {BEST_IND_PARAMS[name]}" for name in indicators)
     )
 
     return result_str
@@ -205,46 +265,13 @@ def _get_stock_stats_bulk(
     if not online:
         # Local data path
         try:
-            data = pd.read_csv(
-                os.path.join(
-                    config.get("data_cache_dir", "data"),
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                )
-            )
+            data = get_price_table(symbol).to_frame()
             df = wrap(data)
         except FileNotFoundError:
             raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
     else:
-        # Online data fetching with caching
-        today_date = pd.Timestamp.today()
-        curr_date_dt = pd.to_datetime(curr_date)
-        
-        end_date = today_date
-        start_date = today_date - pd.DateOffset(years=15)
-        start_date_str = start_date.strftime("%Y-%m-%d")
-        end_date_str = end_date.strftime("%Y-%m-%d")
-        
-        os.makedirs(config["data_cache_dir"], exist_ok=True)
-        
-        data_file = os.path.join(
-            config["data_cache_dir"],
-            f"{symbol}-YFin-data-{start_date_str}-{end_date_str}.csv",
-        )
-        
-        if os.path.exists(data_file):
-            data = pd.read_csv(data_file)
-            data["Date"] = pd.to_datetime(data["Date"])
-        else:
-            data = yf.download(
-                symbol,
-                start=start_date_str,
-                end=end_date_str,
-                multi_level_index=False,
-                progress=False,
-                auto_adjust=True,
-            )
-            data = data.reset_index()
-            data.to_csv(data_file, index=False)
+        # Online data from the per-symbol incremental cache
+        data = load_ohlcv(symbol)
         
         df = wrap(data)
         df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
@@ -300,18 +327,14 @@ def get_balance_sheet(
 ):
     """Get balance sheet data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
-        else:
-            data = ticker_obj.balance_sheet
+        # Shared per-ticker session: repeated calls reuse the fetched statement
+        data = get_ticker_session(ticker).statement("balance_sheet", freq)
             
         if data.empty:
             return f"No balance sheet data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Compact CSV without empty line items or periods
+        csv_string = format_table("get_balance_sheet", data, drop_empty_rows=True, downsample=False)
         
         # Add header information
         header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
@@ -330,18 +353,14 @@ def get_cashflow(
 ):
     """Get cash flow data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
-        else:
-            data = ticker_obj.cashflow
+        # Shared per-ticker session: repeated calls reuse the fetched statement
+        data = get_ticker_session(ticker).statement("cashflow", freq)
             
         if data.empty:
             return f"No cash flow data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Compact CSV without empty line items or periods
+        csv_string = format_table("get_cashflow", data, drop_empty_rows=True, downsample=False)
         
         # Add header information
         header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
@@ -360,18 +379,14 @@ def get_income_statement(
 ):
     """Get income statement data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
-        else:
-            data = ticker_obj.income_stmt
+        # Shared per-ticker session: repeated calls reuse the fetched statement
+        data = get_ticker_session(ticker).statement("income_stmt", freq)
             
         if data.empty:
             return f"No income statement data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Compact CSV without empty line items or periods
+        csv_string = format_table("get_income_statement", data, drop_empty_rows=True, downsample=False)
         
         # Add header information
         header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
@@ -388,14 +403,13 @@ def get_insider_transactions(
 ):
     """Get insider transactions data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
+        data = get_ticker_dataset(ticker, "insider_transactions")
         
         if data is None or data.empty:
             return f"No insider transactions data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Compact CSV; the newest transactions come first
+        csv_string = format_table("get_insider_transactions", data, newest_first=True)
         
         # Add header information
         header = f"# Insider Transactions data for {ticker.upper()}\n"
@@ -0,0 +1,110 @@
+"""Shared per-ticker yfinance sessions.
+
+Each ``yf.Ticker`` and the frames fetched through it (annual and quarterly
+statements, insider transactions, info) are kept in a bounded registry and
+expire after ``yfinance_session.ttl_seconds``. The yfinance tools and the
+backend services read through it. A fundamentals run that asks for the same
+statement several times, or a backend request that follows one, then costs a
+single round-trip per dataset. Concurrent first reads of a dataset wait for
+one fetch.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .utils import LRUCache
+
+# dataset name -> yf.Ticker attribute
+DATASETS = {
+    "balance_sheet": "balance_sheet",
+    "quarterly_balance_sheet": "quarterly_balance_sheet",
+    "cashflow": "cashflow",
+    "quarterly_cashflow": "quarterly_cashflow",
+    "income_stmt": "income_stmt",
+    "quarterly_income_stmt": "quarterly_income_stmt",
+    "insider_transactions": "insider_transactions",
+    "info": "info",
+}
+
+DEFAULT_SETTINGS = {
+    "max_tickers": 64,
+    "ttl_seconds": 3600,
+}
+
+
+def get_session_settings() -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(get_config().get("yfinance_session") or {})
+    return settings
+
+
+class TickerSession:
+    """One ``yf.Ticker`` plus the datasets already fetched through it."""
+
+    def __init__(self, symbol: str, ttl: float):
+        self.symbol = symbol
+        self.ttl = ttl
+        self.ticker = yf.Ticker(symbol)
+        self._frames = {}  # dataset -> (fetched_at, value)
+        self._locks = {dataset: threading.Lock() for dataset in DATASETS}
+
+    def get(self, dataset: str):
+        """Return ``dataset`` for this ticker, fetching it at most once per TTL.
+
+        DataFrames are returned as copies so callers cannot alter the shared one.
+        """
+        if dataset not in DATASETS:
+            raise ValueError(f"Unknown yfinance dataset '{dataset}'. Choose from: {list(DATASETS)}")
+
+        with self._locks[dataset]:
+            cached = self._frames.get(dataset)
+            if cached is None or time.monotonic() - cached[0] > self.ttl:
+                value = getattr(self.ticker, DATASETS[dataset])
+                cached = (time.monotonic(), value)
+                self._frames[dataset] = cached
+
+        value = cached[1]
+        if isinstance(value, pd.DataFrame):
+            return value.copy()
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
+    def statement(self, statement: str, freq: str = "quarterly"):
+        """``statement`` is one of balance_sheet, cashflow or income_stmt."""
+        prefix = "quarterly_" if freq.lower() == "quarterly" else ""
+        return self.get(prefix + statement)
+
+
+_sessions = None
+_sessions_lock = threading.Lock()
+
+
+def get_ticker_session(symbol: str) -> TickerSession:
+    """Registry entry for ``symbol``, created on first use and expired after the TTL."""
+    global _sessions
+    settings = get_session_settings()
+    symbol = symbol.upper()
+    with _sessions_lock:
+        if _sessions is None or _sessions.maxsize != settings["max_tickers"]:
+            _sessions = LRUCache(maxsize=settings["max_tickers"])
+        session = _sessions.get(symbol)
+        if session is None:
+            session = TickerSession(symbol, settings["ttl_seconds"])
+            _sessions.put(symbol, session, ttl=settings["ttl_seconds"])
+        return session
+
+
+def get_ticker_dataset(symbol: str, dataset: str):
+    """Shortcut for ``get_ticker_session(symbol).get(dataset)``."""
+    return get_ticker_session(symbol).get(dataset)
+
+
+def clear_ticker_sessions():
+    with _sessions_lock:
+        if _sessions is not None:
+            _sessions.clear()
@@ -8,6 +8,10 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # Columnar local price store (None means <data_dir>/market_data/price_store)
+    "price_store_dir": None,
+    "price_store_cache_size": 64,  # open price tables kept per process
+    "finnhub_cache_size": 128,  # parsed finnhub_data files kept per process
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",
@@ -21,6 +25,16 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts as concurrent graph branches instead of in sequence
+    "parallel_analysts": False,
+    # Concurrent data prefetch before the analyst team ("Data Prefetch" graph node)
+    "prefetch": {
+        "enabled": False,
+        "max_workers": 8,
+        "price_look_back_days": 30,
+        "indicator_look_back_days": 30,
+        "news_look_back_days": 7,
+    },
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -34,4 +48,112 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Shared yfinance Ticker objects and fetched statements, per symbol
+    "yfinance_session": {
+        "max_tickers": 64,
+        "ttl_seconds": 3600,
+    },
+    # Concurrent fan-out for multi-source vendor calls
+    "vendor_max_workers": 8,      # shared thread pool size
+    "vendor_call_timeout": 60,    # seconds; sources still running are dropped (None waits for all)
+    "vendor_max_abandoned": 8,    # extra threads for dropped sources still running; then fan-out runs inline
+    # Circuit breaking and latency tracking per (vendor, method)
+    "vendor_health": {
+        "enabled": True,
+        "window": 50,                        # recent calls kept for error rate / latency percentiles
+        "failure_threshold": 3,              # consecutive failures before a vendor is skipped
+        "cooldown_seconds": 60,              # how long a failing vendor is skipped before a trial call
+        "rate_limit_cooldown_seconds": 60,   # rate limits skip every method of that vendor
+        "reorder_by_latency": False,         # order fallback vendors by observed median latency
+    },
+    # Cache of route_to_vendor results keyed on (method, vendor, normalized args)
+    "result_cache": {
+        "enabled": True,
+        "tiers": ["memory", "disk"],  # fastest first; add "redis" to share across machines
+        "memory_size": 512,           # entries kept in the in-process LRU
+        "disk_dir": None,             # defaults to <data_cache_dir>/result_cache
+        "disk_max_mb": 512,           # least recently used pickles are evicted beyond this
+        "redis_url": None,            # defaults to $TRADINGAGENTS_REDIS_URL
+        "ttl_seconds": {              # per category; a method name overrides its category
+            "core_stock_apis": 6 * 3600,
+            "technical_indicators": 6 * 3600,
+            "fundamental_data": 24 * 3600,
+            "news_data": 3600,
+        },
+        "default_ttl_seconds": 3600,
+    },
+    "alpha_vantage_indicator_ttl": 900,  # seconds a fetched indicator payload is reused
+    # Google News scraping (news_data vendor "google")
+    "google_news": {
+        "base_url": "https://www.google.com",  # can point at a local stand-in serving recorded pages
+        "min_interval_seconds": 3.0,  # spacing between requests to one host, shared by all queries
+        "jitter_seconds": 2.0,        # random extra spacing per request
+        "max_results": 50,            # stop paginating once this many results are collected (None: all)
+        "max_pages": 10,
+        "cache_ttl_seconds": 6 * 3600,  # parsed result pages; 0 disables the cache
+        "cache_dir": None,            # defaults to <data_cache_dir>/google_news
+    },
+    # Record/replay of vendor responses ("off", "record" or "replay")
+    "cassette": {
+        "mode": os.getenv("TRADINGAGENTS_CASSETTE_MODE", "off"),
+        "path": os.getenv("TRADINGAGENTS_CASSETTE_PATH"),  # defaults to <data_cache_dir>/cassettes/default
+    },
+    # Persistent cache of LLM responses ("read_write", "read_only" or "bypass")
+    "llm_cache": {
+        "enabled": False,
+        "mode": os.getenv("TRADINGAGENTS_LLM_CACHE_MODE", "read_write"),
+        "path": None,                 # defaults to <data_cache_dir>/llm_cache.sqlite
+        "max_size_mb": 256,           # least recently used responses are evicted beyond this
+    },
+    # Durable LangGraph checkpoints; a failed run continues with resume(run_id)
+    "checkpoint": {
+        "enabled": False,
+        "backend": "sqlite",          # sqlite (langgraph-checkpoint-sqlite), postgres, memory
+        "path": None,                 # sqlite, defaults to <data_cache_dir>/checkpoints.sqlite
+        "postgres_url": None,         # postgres, defaults to $TRADINGAGENTS_CHECKPOINT_URL
+        "keep_completed": False,      # delete a run's checkpoints once it finishes
+    },
+    # Per-node LLM tokens/latency, tool calls and vendor time, on final_state["metrics"]
+    "instrumentation": {
+        "enabled": True,
+        "jsonl_path": None,           # append each run's metrics as one JSON line
+        "prometheus_path": None,      # process totals in Prometheus text format (textfile collector)
+    },
+    # Walk-forward backtests (tradingagents/backtest, `cli.main backtest run`)
+    "backtest": {
+        "max_concurrency": 4,         # (ticker, date) runs in flight at once
+        "holding_days": 5,            # trading days between a decision and its realized return
+        "step_days": 1,               # business days between trade dates
+        "walk_forward": True,         # only reflect on returns realized before the next trade date
+        "output_dir": None,           # defaults to <results_dir>/backtests/<tickers>_<start>_<end>
+    },
+    # Compact tool output for LLM prompts (see dataflows/output_formatter.py)
+    "output_format": {
+        "enabled": True,
+        "significant_digits": 6,
+        "drop_non_trading_days": True,  # indicator windows list trading days only
+        "drop_constant_columns": True,  # e.g. all-zero Dividends / Stock Splits
+        "chars_per_token": 4,
+        "token_budgets": {              # longer outputs are downsampled to fit
+            "get_stock_data": 4000,
+            "get_indicators": 1500,
+            "get_indicators_batch": 3000,
+            "get_balance_sheet": 3000,
+            "get_cashflow": 3000,
+            "get_income_statement": 3000,
+            "get_insider_transactions": 2000,
+        },
+        "default_token_budget": None,
+    },
+    # Client-side Alpha Vantage request budget, shared across threads/processes
+    "alpha_vantage_rate_limit": {
+        "enabled": True,
+        "backend": "file",            # local (threads only), file (lock file per machine), redis
+        "requests_per_minute": 5,     # free tier; raise for premium keys
+        "burst": None,                # bucket size, defaults to requests_per_minute
+        "max_wait_seconds": 60,       # queue this long before treating the call as rate limited
+        "redis_url": None,            # redis backend, defaults to $TRADINGAGENTS_REDIS_URL
+        "state_dir": None,            # file backend, defaults to <data_cache_dir>/rate_limits
+        "keys": {},                   # per-key overrides, by API key or its fingerprint
+    },
 }
@@ -0,0 +1,120 @@
+# TradingAgents/graph/checkpointing.py
+
+import asyncio
+import os
+import sqlite3
+from typing import Any, Dict, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "backend": "sqlite",  # sqlite, postgres or memory
+    "path": None,  # sqlite backend, defaults to <data_cache_dir>/checkpoints.sqlite
+    "postgres_url": None,  # postgres backend, defaults to $TRADINGAGENTS_CHECKPOINT_URL
+    "keep_completed": False,  # keep the checkpoints of runs that finished
+}
+
+
+class ThreadedSaver(BaseCheckpointSaver):
+    """Gives a sync-only saver (SqliteSaver, PostgresSaver) the async methods ``ainvoke`` needs.
+
+    Every call is delegated to the wrapped saver; the async ones run it on a
+    worker thread.
+    """
+
+    def __init__(self, saver: BaseCheckpointSaver):
+        super().__init__(serde=saver.serde)
+        self.saver = saver
+
+    def get_tuple(self, config):
+        return self.saver.get_tuple(config)
+
+    def list(self, config, **kwargs):
+        return self.saver.list(config, **kwargs)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        return self.saver.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        return self.saver.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id):
+        return self.saver.delete_thread(thread_id)
+
+    def get_next_version(self, current, channel):
+        return self.saver.get_next_version(current, channel)
+
+    async def aget_tuple(self, config):
+        return await asyncio.to_thread(self.saver.get_tuple, config)
+
+    async def alist(self, config, **kwargs):
+        items = await asyncio.to_thread(lambda: list(self.saver.list(config, **kwargs)))
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await asyncio.to_thread(self.saver.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        return await asyncio.to_thread(self.saver.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id):
+        return await asyncio.to_thread(self.saver.delete_thread, thread_id)
+
+
+def get_checkpoint_settings(config: Dict[str, Any]) -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(config.get("checkpoint") or {})
+    return settings
+
+
+def create_checkpointer(config: Dict[str, Any]) -> Optional[BaseCheckpointSaver]:
+    """Durable checkpointer for the graph, or None unless ``checkpoint.enabled`` is set.
+
+    The sqlite backend needs ``langgraph-checkpoint-sqlite`` and the postgres
+    backend ``langgraph-checkpoint-postgres``. A configured backend whose package
+    is missing raises rather than quietly keeping checkpoints in memory, where
+    they would not survive a restart; choose ``memory`` explicitly for that.
+
+    Raises:
+        ImportError: The configured backend's package is not installed
+    """
+    settings = get_checkpoint_settings(config)
+    if not settings["enabled"]:
+        return None
+
+    backend = settings["backend"]
+    try:
+        if backend == "sqlite":
+            from langgraph.checkpoint.sqlite import SqliteSaver
+
+            path = settings["path"] or os.path.join(config["data_cache_dir"], "checkpoints.sqlite")
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            saver = SqliteSaver(sqlite3.connect(path, check_same_thread=False, timeout=30))
+            saver.setup()
+            return ThreadedSaver(saver)
+
+        if backend == "postgres":
+            from psycopg import Connection
+            from psycopg.rows import dict_row
+            from langgraph.checkpoint.postgres import PostgresSaver
+
+            url = settings["postgres_url"] or os.getenv("TRADINGAGENTS_CHECKPOINT_URL")
+            if not url:
+                raise ValueError("checkpoint.postgres_url (or $TRADINGAGENTS_CHECKPOINT_URL) is required")
+            conn = Connection.connect(url, autocommit=True, prepare_threshold=0, row_factory=dict_row)
+            saver = PostgresSaver(conn)
+            saver.setup()
+            return ThreadedSaver(saver)
+    except ImportError as e:
+        package = "langgraph-checkpoint-sqlite" if backend == "sqlite" else "langgraph-checkpoint-postgres psycopg"
+        raise ImportError(
+            f"Checkpoint backend '{backend}' is unavailable ({e}). Install {package}, "
+            f"or set checkpoint.backend to 'memory' to keep checkpoints for this process only"
+        ) from e
+
+    if backend != "memory":
+        raise ValueError(f"Unknown checkpoint backend '{backend}'. Choose from: sqlite, postgres, memory")
+    return InMemorySaver()
@@ -0,0 +1,369 @@
+# TradingAgents/graph/instrumentation.py
+
+import contextlib
+import contextvars
+import copy
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.outputs import LLMResult
+
+from tradingagents.dataflows.interface import add_vendor_call_observer
+from tradingagents.dataflows.utils import atomic_write
+
+from .llm_cache import current_node
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "jsonl_path": None,  # append one line of metrics per run
+    "prometheus_path": None,  # process totals in Prometheus text format, e.g. for a textfile collector
+}
+
+# Counters kept per graph node; vendors and tools are broken down further
+NODE_COUNTERS = (
+    "llm_calls",
+    "llm_cache_hits",
+    "llm_errors",
+    "prompt_tokens",
+    "completion_tokens",
+    "llm_seconds",
+    "tool_calls",
+    "tool_errors",
+    "tool_seconds",
+    "vendor_calls",
+    "vendor_errors",
+    "vendor_seconds",
+    "data_cache_hits",
+)
+
+_metrics = contextvars.ContextVar("run_metrics", default=None)
+
+
+def _new_node() -> Dict[str, Any]:
+    node = {counter: 0 for counter in NODE_COUNTERS}
+    node["tools"] = {}
+    node["vendors"] = {}
+    return node
+
+
+def _merge(into: Dict[str, Any], node: Dict[str, Any]):
+    for counter in NODE_COUNTERS:
+        into[counter] += node.get(counter, 0)
+    for group in ("tools", "vendors"):
+        for name, counts in node.get(group, {}).items():
+            target = into[group].setdefault(name, {key: 0 for key in counts})
+            for key, value in counts.items():
+                target[key] = target.get(key, 0) + value
+
+
+class RunMetrics:
+    """Token, latency and call counts of one graph run, per graph node.
+
+    LLM and tool numbers come from ``InstrumentationHandler``. Vendor calls
+    and result-cache hits come from ``route_to_vendor``. Events are
+    attributed to the run whose ``collect`` block they happen in; LangGraph
+    carries that context into node threads and tasks.
+    """
+
+    def __init__(self, ticker: Optional[str] = None, trade_date: Optional[str] = None, run_id: Optional[str] = None):
+        self.ticker = ticker
+        self.trade_date = str(trade_date) if trade_date is not None else None
+        self.run_id = run_id
+        self.start = time.perf_counter()
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _node(self, name: str) -> Dict[str, Any]:
+        if name not in self.nodes:
+            self.nodes[name] = _new_node()
+        return self.nodes[name]
+
+    def record_llm(self, node: str, seconds: float, prompt_tokens: int, completion_tokens: int,
+                   cache_hit: bool = False, error: bool = False):
+        with self._lock:
+            counts = self._node(node)
+            counts["llm_calls"] += 1
+            counts["llm_seconds"] += seconds
+            counts["prompt_tokens"] += prompt_tokens
+            counts["completion_tokens"] += completion_tokens
+            counts["llm_cache_hits"] += int(cache_hit)
+            counts["llm_errors"] += int(error)
+
+    def record_tool(self, node: str, tool: str, seconds: float, error: bool = False):
+        with self._lock:
+            counts = self._node(node)
+            counts["tool_calls"] += 1
+            counts["tool_seconds"] += seconds
+            counts["tool_errors"] += int(error)
+            tool_counts = counts["tools"].setdefault(tool, {"calls": 0, "seconds": 0.0})
+            tool_counts["calls"] += 1
+            tool_counts["seconds"] += seconds
+
+    def record_vendor(self, node: str, vendor: str, seconds: float, status: str):
+        with self._lock:
+            counts = self._node(node)
+            if status == "hit":
+                counts["data_cache_hits"] += 1
+                return
+            failed = status != "ok"
+            counts["vendor_calls"] += 1
+            counts["vendor_seconds"] += seconds
+            counts["vendor_errors"] += int(failed)
+            vendor_counts = counts["vendors"].setdefault(vendor, {"calls": 0, "errors": 0, "seconds": 0.0})
+            vendor_counts["calls"] += 1
+            vendor_counts["errors"] += int(failed)
+            vendor_counts["seconds"] += seconds
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-node counters plus their totals, as a JSON-serializable dict."""
+        with self._lock:
+            nodes = copy.deepcopy(self.nodes)
+        totals = _new_node()
+        for node in nodes.values():
+            _merge(totals, node)
+        return {
+            "run_id": self.run_id,
+            "ticker": self.ticker,
+            "trade_date": self.trade_date,
+            "run_seconds": time.perf_counter() - self.start,
+            "nodes": nodes,
+            "totals": totals,
+        }
+
+
+@contextlib.contextmanager
+def collect(metrics: Optional[RunMetrics]):
+    """Attribute the LLM, tool and vendor calls made inside the block to ``metrics``."""
+    if metrics is None:
+        yield
+        return
+    token = _metrics.set(metrics)
+    try:
+        yield
+    finally:
+        _metrics.reset(token)
+
+
+def _token_usage(response: LLMResult):
+    prompt_tokens = completion_tokens = 0
+    reported = False
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                reported = True
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+    if not reported:
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+def _is_cache_hit(response: LLMResult) -> bool:
+    return any(
+        (generation.generation_info or {}).get("cache_hit")
+        for generations in response.generations
+        for generation in generations
+    )
+
+
+class InstrumentationHandler(BaseCallbackHandler):
+    """Times LLM and tool calls and records them on the current run's ``RunMetrics``.
+
+    One handler serves every run in the process; calls made outside a
+    ``collect`` block (e.g. reflections) are ignored. Answers from the LLM
+    cache count as cache hits, and their tokens, which were not billed, are
+    left out.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        self._pending: Dict[UUID, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: UUID, metadata: Optional[dict], name: Optional[str] = None):
+        metrics = _metrics.get()
+        if metrics is None:
+            return
+        node = (metadata or {}).get("langgraph_node") or current_node()
+        with self._lock:
+            self._pending[run_id] = (metrics, node, name, time.perf_counter())
+
+    def _finish(self, run_id: UUID):
+        with self._lock:
+            pending = self._pending.pop(run_id, None)
+        if pending is None:
+            return None
+        metrics, node, name, start = pending
+        return metrics, node, name, time.perf_counter() - start
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs):
+        finished = self._finish(run_id)
+        if finished is None:
+            return
+        metrics, node, _, seconds = finished
+        if _is_cache_hit(response):
+            metrics.record_llm(node, seconds, 0, 0, cache_hit=True)
+        else:
+            metrics.record_llm(node, seconds, *_token_usage(response))
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        finished = self._finish(run_id)
+        if finished is not None:
+            metrics, node, _, seconds = finished
+            metrics.record_llm(node, seconds, 0, 0, error=True)
+
+    def on_tool_start(self, serialized, input_str, *, run_id: UUID, metadata=None, **kwargs):
+        self._start(run_id, metadata, (serialized or {}).get("name") or kwargs.get("name"))
+
+    def on_tool_end(self, output, *, run_id: UUID, **kwargs):
+        finished = self._finish(run_id)
+        if finished is not None:
+            metrics, node, tool, seconds = finished
+            metrics.record_tool(node, tool or "tool", seconds)
+
+    def on_tool_error(self, error, *, run_id: UUID, **kwargs):
+        finished = self._finish(run_id)
+        if finished is not None:
+            metrics, node, tool, seconds = finished
+            metrics.record_tool(node, tool or "tool", seconds, error=True)
+
+
+handler = InstrumentationHandler()
+
+
+def _observe_vendor_call(method: str, vendor: str, seconds: float, status: str):
+    metrics = _metrics.get()
+    if metrics is not None:
+        metrics.record_vendor(current_node(), vendor, seconds, status)
+
+
+add_vendor_call_observer(_observe_vendor_call)
+
+
+def _add_handler(target):
+    callbacks = target.callbacks
+    if isinstance(callbacks, BaseCallbackManager):
+        if handler not in callbacks.handlers:
+            callbacks.add_handler(handler)
+    elif handler not in (callbacks or []):
+        target.callbacks = list(callbacks or []) + [handler]
+
+
+def instrument(llms: Iterable[Any], tool_nodes: Dict[str, Any]):
+    """Attach the shared handler to the chat models and to every tool of the tool nodes."""
+    for llm in llms:
+        _add_handler(llm)
+    for tool_node in tool_nodes.values():
+        for tool in tool_node.tools_by_name.values():
+            _add_handler(tool)
+
+
+def get_instrumentation_settings(config: Dict[str, Any]) -> dict:
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(config.get("instrumentation") or {})
+    return settings
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# (counter, Prometheus name, help); counters with a vendor/tool breakdown are written per label
+PROMETHEUS_COUNTERS = (
+    ("llm_calls", "tradingagents_llm_calls_total", "LLM calls, cache hits included"),
+    ("llm_cache_hits", "tradingagents_llm_cache_hits_total", "LLM calls answered from the LLM cache"),
+    ("llm_errors", "tradingagents_llm_errors_total", "LLM calls that raised"),
+    ("prompt_tokens", "tradingagents_llm_prompt_tokens_total", "Prompt tokens sent to the LLM"),
+    ("completion_tokens", "tradingagents_llm_completion_tokens_total", "Completion tokens returned by the LLM"),
+    ("llm_seconds", "tradingagents_llm_seconds_total", "Wall time spent in LLM calls"),
+    ("tool_calls", "tradingagents_tool_calls_total", "Tool calls"),
+    ("tool_errors", "tradingagents_tool_errors_total", "Tool calls that raised"),
+    ("tool_seconds", "tradingagents_tool_seconds_total", "Wall time spent in tool calls"),
+    ("data_cache_hits", "tradingagents_data_cache_hits_total", "Vendor calls answered from the result cache"),
+)
+
+
+class MetricsExporter:
+    """Exports the metrics of every finished run.
+
+    Each run is appended as one JSON line to ``jsonl_path``. The totals over
+    all runs of this process are rewritten to ``prometheus_path`` after each
+    run, in the Prometheus text exposition format.
+    """
+
+    def __init__(self, jsonl_path: Optional[str] = None, prometheus_path: Optional[str] = None):
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self._lock = threading.Lock()
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        self._runs = 0
+        self._run_seconds = 0.0
+
+    def export(self, summary: Dict[str, Any]):
+        with self._lock:
+            self._runs += 1
+            self._run_seconds += summary["run_seconds"]
+            for name, node in summary["nodes"].items():
+                _merge(self._nodes.setdefault(name, _new_node()), node)
+
+            if self.jsonl_path:
+                os.makedirs(os.path.dirname(os.path.abspath(self.jsonl_path)), exist_ok=True)
+                with open(self.jsonl_path, "a") as f:
+                    f.write(json.dumps(summary) + "\n")
+            if self.prometheus_path:
+                with atomic_write(self.prometheus_path) as f:
+                    f.write(self._prometheus_text())
+
+    def prometheus_text(self) -> str:
+        with self._lock:
+            return self._prometheus_text()
+
+    def _prometheus_text(self) -> str:
+        lines = [
+            "# HELP tradingagents_runs_total Finished graph runs",
+            "# TYPE tradingagents_runs_total counter",
+            f"tradingagents_runs_total {self._runs}",
+            "# HELP tradingagents_run_seconds_total Wall time of finished graph runs",
+            "# TYPE tradingagents_run_seconds_total counter",
+            f"tradingagents_run_seconds_total {self._run_seconds}",
+        ]
+        for counter, name, help_text in PROMETHEUS_COUNTERS:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for node, counts in sorted(self._nodes.items()):
+                lines.append(f'{name}{{node="{_escape(node)}"}} {counts[counter]}')
+
+        for key, name, help_text in (
+            ("calls", "tradingagents_vendor_calls_total", "Vendor calls"),
+            ("errors", "tradingagents_vendor_errors_total", "Vendor calls that failed, timed out or were rate limited"),
+            ("seconds", "tradingagents_vendor_seconds_total", "Wall time spent in vendor calls"),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for node, counts in sorted(self._nodes.items()):
+                for vendor, vendor_counts in sorted(counts["vendors"].items()):
+                    lines.append(
+                        f'{name}{{node="{_escape(node)}",vendor="{_escape(vendor)}"}} {vendor_counts[key]}'
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def create_metrics_exporter(config: Dict[str, Any]) -> Optional[MetricsExporter]:
+    """Exporter for the configured paths, or None when neither is set."""
+    settings = get_instrumentation_settings(config)
+    if not settings["enabled"] or not (settings["jsonl_path"] or settings["prometheus_path"]):
+        return None
+    return MetricsExporter(settings["jsonl_path"], settings["prometheus_path"])
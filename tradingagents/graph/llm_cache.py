@@ -0,0 +1,270 @@
+# TradingAgents/graph/llm_cache.py
+
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.runnables.config import var_child_runnable_config
+
+MODES = ("read_write", "read_only", "bypass")
+
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "mode": "read_write",
+    "path": None,  # defaults to <data_cache_dir>/llm_cache.sqlite
+    "max_size_mb": 256,
+}
+
+# Serialized message fields that change from run to run without changing the prompt
+VOLATILE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+# Lines of tool output that only record when the data was fetched
+# (e.g. the "# Data retrieved on: <now>" header of the yfinance tools)
+VOLATILE_LINES = re.compile(r"^# Data retrieved on: .*(?:\n|$)", re.MULTILINE)
+
+_label = contextvars.ContextVar("llm_cache_label", default=None)
+
+
+@contextlib.contextmanager
+def cache_label(name: str):
+    """Attribute LLM calls made outside a graph node (e.g. signal processing) to ``name``."""
+    token = _label.set(name)
+    try:
+        yield
+    finally:
+        _label.reset(token)
+
+
+def current_node() -> str:
+    """Graph node making the current LLM call, from the LangGraph run config."""
+    config = var_child_runnable_config.get() or {}
+    node = (config.get("metadata") or {}).get("langgraph_node")
+    return node or _label.get() or "(no node)"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Canonical form of a serialized message list.
+
+    Message ids and response/usage metadata are dropped, text content is
+    stripped of fetch timestamps and surrounding whitespace, and tool call ids are renumbered in order of appearance, so the
+    same conversation keys the same entry even when earlier turns were
+    generated live in one run and replayed in another.
+    """
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt.strip()
+
+    call_ids: Dict[str, str] = {}
+
+    def call_id(value):
+        if value not in call_ids:
+            call_ids[value] = f"call_{len(call_ids)}"
+        return call_ids[value]
+
+    def normalize(kwargs: dict) -> dict:
+        kwargs = {key: value for key, value in kwargs.items() if key not in VOLATILE_FIELDS}
+        if isinstance(kwargs.get("content"), str):
+            kwargs["content"] = VOLATILE_LINES.sub("", kwargs["content"]).strip()
+        if kwargs.get("tool_call_id"):
+            kwargs["tool_call_id"] = call_id(kwargs["tool_call_id"])
+        for field in ("tool_calls", "invalid_tool_calls"):
+            if kwargs.get(field):
+                kwargs[field] = [
+                    {**call, "id": call_id(call["id"])} if call.get("id") else call
+                    for call in kwargs[field]
+                ]
+        additional = kwargs.get("additional_kwargs") or {}
+        if additional.get("tool_calls"):
+            additional = dict(additional)
+            additional["tool_calls"] = [
+                {**call, "id": call_id(call["id"])} if call.get("id") else call
+                for call in additional["tool_calls"]
+            ]
+            kwargs["additional_kwargs"] = additional
+        return kwargs
+
+    if isinstance(messages, list):
+        messages = [
+            {**message, "kwargs": normalize(message.get("kwargs") or {})}
+            if isinstance(message, dict) else message
+            for message in messages
+        ]
+    return json.dumps(messages, sort_keys=True)
+
+
+def make_key(prompt: str, llm_string: str) -> str:
+    # llm_string carries the provider type, model, temperature and bound tool schemas
+    return hashlib.sha256(f"{llm_string}\n{normalize_prompt(prompt)}".encode()).hexdigest()
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    stored = []
+    for generation in generations:
+        if isinstance(generation, ChatGeneration):
+            stored.append({"message": message_to_dict(generation.message)})
+        else:
+            stored.append({"text": generation.text})
+    return json.dumps(stored)
+
+
+def _load_generations(payload: str) -> list:
+    # Marked so callbacks (graph/instrumentation.py) can tell cached answers apart
+    info = {"cache_hit": True}
+    generations = []
+    for stored in json.loads(payload):
+        if "message" in stored:
+            generations.append(
+                ChatGeneration(message=messages_from_dict([stored["message"]])[0], generation_info=info)
+            )
+        else:
+            generations.append(Generation(text=stored["text"], generation_info=info))
+    return generations
+
+
+class LLMCache(BaseCache):
+    """SQLite-backed LangChain cache for the chat models of a graph.
+
+    Entries are keyed on the model settings LangChain reports for a call
+    (provider, model, temperature, bound tools) and the normalized messages.
+    The least recently used entries are evicted once the file's entries
+    exceed ``max_size_mb``. Hits, misses and writes are counted per graph node.
+
+    Modes:
+        read_write: answer from the cache and store new responses
+        read_only: answer from the cache, never store
+        bypass: always call the model; the cache is neither read nor written
+    """
+
+    def __init__(self, path: str, mode: str = "read_write", max_size_mb: float = 256):
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cache mode '{mode}'. Choose from: {list(MODES)}")
+        self.path = path
+        self.mode = mode
+        self.max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "writes": 0, "bypassed": 0})
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            " key TEXT PRIMARY KEY, llm_string TEXT NOT NULL, node TEXT,"
+            " response TEXT NOT NULL, size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_last_used ON llm_cache (last_used)")
+        self._conn.commit()
+
+    def _count(self, node: str, field: str):
+        with self._lock:
+            self._stats[node][field] += 1
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        node = current_node()
+        if self.mode == "bypass":
+            self._count(node, "bypassed")
+            return None
+
+        key = make_key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.mode == "read_write":
+                self._conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._conn.commit()
+        self._count(node, "misses" if row is None else "hits")
+        return None if row is None else _load_generations(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if self.mode != "read_write":
+            return
+        node = current_node()
+        payload = _dump_generations(return_val)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache"
+                " (key, llm_string, node, response, size, created_at, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (make_key(prompt, llm_string), llm_string, node, payload, len(payload), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+        self._count(node, "writes")
+
+    def _evict(self):
+        """Drop least recently used entries until the stored responses fit the size limit."""
+        if not self.max_bytes:
+            return
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% so a full cache does not evict on every write
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM llm_cache ORDER BY last_used"):
+            stale.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", stale)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, dict]:
+        """Hits, misses, writes and hit rate per graph node since this cache was opened."""
+        with self._lock:
+            snapshot = {node: dict(counts) for node, counts in self._stats.items()}
+        for counts in snapshot.values():
+            lookups = counts["hits"] + counts["misses"]
+            counts["hit_rate"] = counts["hits"] / lookups if lookups else 0.0
+        return snapshot
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        """Stored entries and bytes, overall and per node that wrote them."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT COALESCE(node, ''), COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache GROUP BY node"
+            ).fetchall()
+        return {
+            "path": self.path,
+            "mode": self.mode,
+            "entries": sum(row[1] for row in rows),
+            "bytes": sum(row[2] for row in rows),
+            "max_bytes": self.max_bytes,
+            "by_node": {node: {"entries": count, "bytes": size} for node, count, size in rows},
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_llm_cache(config: Dict[str, Any]) -> Optional[LLMCache]:
+    """Cache for the graph's LLMs, or None unless ``llm_cache.enabled`` is set."""
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(config.get("llm_cache") or {})
+    if not settings["enabled"]:
+        return None
+    path = settings["path"] or os.path.join(config["data_cache_dir"], "llm_cache.sqlite")
+    return LLMCache(path, settings["mode"], settings["max_size_mb"])
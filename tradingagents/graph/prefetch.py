@@ -0,0 +1,166 @@
+# TradingAgents/graph/prefetch.py
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from tradingagents.dataflows.interface import add_cache_hit_observer, result_cache_key, route_to_vendor
+
+# Indicators offered to the market analyst
+PREFETCH_INDICATORS = [
+    "close_50_sma", "close_200_sma", "close_10_ema",
+    "macd", "macds", "macdh", "rsi",
+    "boll", "boll_ub", "boll_lb", "atr", "vwma",
+]
+
+DEFAULT_SETTINGS = {
+    "enabled": False,
+    "max_workers": 8,
+    "price_look_back_days": 30,
+    "indicator_look_back_days": 30,
+    "news_look_back_days": 7,
+}
+
+
+class Prefetcher:
+    """Warms the data caches for one ticker and date before the analysts run.
+
+    The calls the selected analysts are most likely to make are issued
+    concurrently through ``route_to_vendor``. They fill the result cache for
+    those exact arguments and the lower-level stores (OHLCV history, indicator
+    engine, indicator payloads) that serve any window. Later tool calls are then
+    answered from memory instead of paying network latency between LLM turns.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.settings = DEFAULT_SETTINGS.copy()
+        self.settings.update(config.get("prefetch") or {})
+        self.last_report: Optional[Dict[str, Any]] = None
+        # (ticker, trade_date) -> report, for runs that overlap
+        self.reports: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # (ticker, trade_date) -> {cache key: prefetch seconds}, and the keys later hit
+        self._warmed: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._served: Dict[Tuple[str, str], set] = {}
+        self._lock = threading.Lock()
+        add_cache_hit_observer(self._on_cache_hit)
+
+    def plan(self, ticker: str, trade_date: str, selected_analysts: List[str]) -> List[Tuple[str, tuple]]:
+        """``(method, args)`` calls to warm for the selected analysts.
+
+        Only tools bound to those analysts' LLMs are planned; anything else
+        would be fetched and never read.
+        """
+        curr_date = datetime.strptime(trade_date, "%Y-%m-%d")
+        news_start = (curr_date - timedelta(days=self.settings["news_look_back_days"])).strftime("%Y-%m-%d")
+        price_start = (curr_date - timedelta(days=self.settings["price_look_back_days"])).strftime("%Y-%m-%d")
+
+        calls = []
+        if "market" in selected_analysts:
+            calls.append(("get_stock_data", (ticker, price_start, trade_date)))
+            calls.append((
+                "get_indicators_batch",
+                (ticker, PREFETCH_INDICATORS, trade_date, self.settings["indicator_look_back_days"]),
+            ))
+        if "social" in selected_analysts or "news" in selected_analysts:
+            calls.append(("get_news", (ticker, news_start, trade_date)))
+        if "news" in selected_analysts:
+            calls.append(("get_global_news", (trade_date, self.settings["news_look_back_days"], 5)))
+        if "fundamentals" in selected_analysts:
+            calls.append(("get_fundamentals", (ticker, trade_date)))
+            for method in ("get_balance_sheet", "get_cashflow", "get_income_statement"):
+                calls.append((method, (ticker, "quarterly", trade_date)))
+        return calls
+
+    def _on_cache_hit(self, method: str, key: str):
+        with self._lock:
+            for run, warmed in self._warmed.items():
+                if key in warmed:
+                    self._served[run].add(key)
+
+    def _timed_call(self, method: str, args: tuple) -> Dict[str, Any]:
+        key = result_cache_key(method, *args)
+        start = time.perf_counter()
+        try:
+            route_to_vendor(method, *args)
+            ok, error = True, None
+        except Exception as e:
+            # A failed prefetch only means the analyst's own call goes live
+            ok, error = False, f"{type(e).__name__}: {e}"
+        return {"method": method, "ok": ok, "seconds": time.perf_counter() - start, "error": error, "key": key}
+
+    def run(self, ticker: str, trade_date: str, selected_analysts: List[str]) -> Dict[str, Any]:
+        """Issue every planned call concurrently and return timing information.
+
+        ``serial_seconds`` is what the same calls would have cost one after
+        another. What the run actually saved is only known once it finishes;
+        see ``settle``.
+        """
+        calls = self.plan(ticker, str(trade_date), selected_analysts)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.settings["max_workers"], len(calls))),
+            thread_name_prefix="prefetch",
+        ) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._timed_call, method, args)
+                for method, args in calls
+            ]
+            results = [future.result() for future in futures]
+        wall = time.perf_counter() - start
+
+        serial = sum(result["seconds"] for result in results)
+        self.last_report = {
+            "ticker": ticker,
+            "trade_date": str(trade_date),
+            "calls": results,
+            "failed": [result["method"] for result in results if not result["ok"]],
+            "wall_seconds": wall,
+            "serial_seconds": serial,
+        }
+        run = (ticker, str(trade_date))
+        with self._lock:
+            self.reports[run] = self.last_report
+            self._warmed[run] = {
+                result["key"]: result["seconds"] for result in results if result["ok"] and result["key"]
+            }
+            self._served[run] = set()
+        return self.last_report
+
+    def settle(self, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """Final report of a finished run's prefetch, or None if it had none.
+
+        Each prefetched call the analysts later got from the result cache saved
+        its prefetch latency once; repeat hits would have been cached anyway.
+        ``saved_seconds`` is that sum minus the prefetch's own wall time, so it is
+        negative when the prefetch cost more than it saved.
+        """
+        run = (ticker, str(trade_date))
+        with self._lock:
+            report = self.reports.pop(run, None)
+            warmed = self._warmed.pop(run, {})
+            served = self._served.pop(run, set())
+        if report is None:
+            return None
+        report = dict(report)
+        report["cache_hits"] = len(served)
+        report["served_seconds"] = sum(warmed[key] for key in served)
+        report["saved_seconds"] = report["served_seconds"] - report["wall_seconds"]
+        return report
+
+    def create_node(self, selected_analysts: List[str]):
+        """Graph node that runs the prefetch and leaves the state untouched."""
+
+        def data_prefetch_node(state) -> Dict[str, Any]:
+            report = self.run(state["company_of_interest"], state["trade_date"], selected_analysts)
+            print(
+                f"Prefetched {len(report['calls']) - len(report['failed'])}/{len(report['calls'])} "
+                f"data calls in {report['wall_seconds']:.1f}s "
+                f"({report['serial_seconds']:.1f}s if run serially)"
+            )
+            return {}
+
+        return data_prefetch_node
+
@@ -3,6 +3,8 @@
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 
+from .llm_cache import cache_label
+
 
 class Reflector:
     """Handles reflection on decisions and updating memory."""
@@ -67,7 +69,8 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
             ),
         ]
 
-        result = self.quick_thinking_llm.invoke(messages).content
+        with cache_label("Reflector"):
+            result = self.quick_thinking_llm.invoke(messages).content
         return result
 
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
@@ -3,6 +3,7 @@
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
@@ -10,6 +11,14 @@ from tradingagents.agents.utils.agent_states import AgentState
 
 from .conditional_logic import ConditionalLogic
 
+# State field holding each analyst's report
+REPORT_FIELDS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
 
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
@@ -25,6 +34,7 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        prefetcher=None,
     ):
         """Initialize with required components."""
         self.quick_thinking_llm = quick_thinking_llm
@@ -36,9 +46,69 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.prefetcher = prefetcher
+
+    def _create_analyst_branch(self, analyst_type, analyst_node, tool_node):
+        """Node running one analyst's tool loop on its own message channel.
+
+        The analyst and its tools run as a compiled subgraph that starts from the
+        company name alone, so concurrent branches never see each other's
+        messages. Only the report and the branch's message history are written
+        back to the shared state.
+        """
+        name = analyst_type.capitalize()
+        branch = StateGraph(AgentState)
+        branch.add_node(f"{name} Analyst", analyst_node)
+        branch.add_node(f"tools_{analyst_type}", tool_node)
+        branch.add_edge(START, f"{name} Analyst")
+        branch.add_conditional_edges(
+            f"{name} Analyst",
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {f"tools_{analyst_type}": f"tools_{analyst_type}", f"Msg Clear {name}": END},
+        )
+        branch.add_edge(f"tools_{analyst_type}", f"{name} Analyst")
+        branch_graph = branch.compile()
+        report_field = REPORT_FIELDS[analyst_type]
+
+        def branch_input(state):
+            branch_state = dict(state)
+            branch_state["messages"] = [("human", state["company_of_interest"])]
+            return branch_state
+
+        def branch_output(final_state):
+            return {
+                report_field: final_state[report_field],
+                f"{analyst_type}_messages": final_state["messages"],
+            }
+
+        def analyst_branch_node(state, config: RunnableConfig):
+            return branch_output(branch_graph.invoke(branch_input(state), config))
+
+        async def aanalyst_branch_node(state, config: RunnableConfig):
+            return branch_output(await branch_graph.ainvoke(branch_input(state), config))
+
+        return RunnableLambda(analyst_branch_node, afunc=aanalyst_branch_node)
+
+    def _create_analyst_join(self, analyst_types):
+        """Node after the parallel branches: clears the shared and per-branch message channels.
+
+        The reports already carry everything downstream nodes read, so the branch
+        histories would only grow the state that is checkpointed after every node.
+        """
+        delete_messages = create_msg_delete()
+
+        def analyst_join(state):
+            cleared = delete_messages(state)
+            cleared.update({f"{analyst_type}_messages": [] for analyst_type in analyst_types})
+            return cleared
+
+        return analyst_join
 
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        checkpointer=None,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +118,10 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the analysts as concurrent branches that
+                join before the research debate, instead of one after another
+            checkpointer: LangGraph checkpoint saver. State is saved after every
+                node, so a failed run can be resumed from its last completed node
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -109,12 +183,20 @@ class GraphSetup:
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
-            workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
-            )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+        if parallel_analysts:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(
+                    f"{analyst_type.capitalize()} Analyst",
+                    self._create_analyst_branch(analyst_type, node, tool_nodes[analyst_type]),
+                )
+            workflow.add_node("Analyst Join", self._create_analyst_join(list(analyst_nodes)))
+        else:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+                workflow.add_node(
+                    f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                )
+                workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
@@ -127,30 +209,45 @@ class GraphSetup:
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
-
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
-
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
+        # Start with the analysts, after warming the data caches if enabled
+        if self.prefetcher is not None:
+            workflow.add_node("Data Prefetch", self.prefetcher.create_node(selected_analysts))
+            workflow.add_edge(START, "Data Prefetch")
+            entry = "Data Prefetch"
+        else:
+            entry = START
+
+        if parallel_analysts:
+            # Fan out to every analyst; the join waits for all of them
+            analyst_names = [f"{analyst_type.capitalize()} Analyst" for analyst_type in selected_analysts]
+            for analyst_name in analyst_names:
+                workflow.add_edge(entry, analyst_name)
+            workflow.add_edge(analyst_names, "Analyst Join")
+            workflow.add_edge("Analyst Join", "Bull Researcher")
+        else:
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(entry, f"{first_analyst.capitalize()} Analyst")
+
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -199,4 +296,4 @@ class GraphSetup:
         workflow.add_edge("Risk Judge", END)
 
         # Compile and return
-        return workflow.compile()
+        return workflow.compile(checkpointer=checkpointer)
@@ -2,6 +2,8 @@
 
 from langchain_openai import ChatOpenAI
 
+from .llm_cache import cache_label
+
 
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
@@ -10,6 +12,15 @@ class SignalProcessor:
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
 
+    def _messages(self, full_signal: str) -> list:
+        return [
+            (
+                "system",
+                "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
+            ),
+            ("human", full_signal),
+        ]
+
     def process_signal(self, full_signal: str) -> str:
         """
         Process a full trading signal to extract the core decision.
@@ -20,12 +31,11 @@ class SignalProcessor:
         Returns:
             Extracted decision (BUY, SELL, or HOLD)
         """
-        messages = [
-            (
-                "system",
-                "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
-            ),
-            ("human", full_signal),
-        ]
-
-        return self.quick_thinking_llm.invoke(messages).content
+        with cache_label("Signal Processor"):
+            return self.quick_thinking_llm.invoke(self._messages(full_signal)).content
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async version of ``process_signal``."""
+        with cache_label("Signal Processor"):
+            response = await self.quick_thinking_llm.ainvoke(self._messages(full_signal))
+        return response.content
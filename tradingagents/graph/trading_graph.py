@@ -1,10 +1,13 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
+import uuid
 from pathlib import Path
 import json
+import time
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Tuple, List, Optional, Iterable, Iterator, AsyncIterator
 
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -26,6 +29,7 @@ from tradingagents.dataflows.config import set_config
 from tradingagents.agents.utils.agent_utils import (
     get_stock_data,
     get_indicators,
+    get_indicators_batch,
     get_fundamentals,
     get_balance_sheet,
     get_cashflow,
@@ -41,6 +45,16 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .prefetch import Prefetcher
+from .llm_cache import create_llm_cache
+from .checkpointing import create_checkpointer, get_checkpoint_settings
+from .instrumentation import (
+    RunMetrics,
+    collect,
+    create_metrics_exporter,
+    get_instrumentation_settings,
+    instrument,
+)
 
 
 class TradingAgentsGraph:
@@ -83,7 +97,13 @@ class TradingAgentsGraph:
             self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
-        
+
+        # Optional persistent cache of LLM responses
+        self.llm_cache = create_llm_cache(self.config)
+        if self.llm_cache is not None:
+            self.deep_thinking_llm.cache = self.llm_cache
+            self.quick_thinking_llm.cache = self.llm_cache
+
         # Initialize memories
         self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
         self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
@@ -94,8 +114,27 @@ class TradingAgentsGraph:
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
 
+        # Per-node token, latency and tool-time metrics for every run
+        self.instrumentation_settings = get_instrumentation_settings(self.config)
+        if self.instrumentation_settings["enabled"]:
+            instrument([self.deep_thinking_llm, self.quick_thinking_llm], self.tool_nodes)
+        self.metrics_exporter = create_metrics_exporter(self.config)
+        self.last_metrics = None
+
+        # Optional concurrent data prefetch before the analysts
+        self.selected_analysts = selected_analysts
+        self.prefetcher = (
+            Prefetcher(self.config)
+            if (self.config.get("prefetch") or {}).get("enabled")
+            else None
+        )
+        self.prefetch_report = None
+
         # Initialize components
-        self.conditional_logic = ConditionalLogic()
+        self.conditional_logic = ConditionalLogic(
+            max_debate_rounds=self.config.get("max_debate_rounds", 1),
+            max_risk_discuss_rounds=self.config.get("max_risk_discuss_rounds", 1),
+        )
         self.graph_setup = GraphSetup(
             self.quick_thinking_llm,
             self.deep_thinking_llm,
@@ -106,19 +145,29 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            self.prefetcher,
         )
 
-        self.propagator = Propagator()
+        self.propagator = Propagator(self.config.get("max_recur_limit", 100))
+
+        # Optional durable checkpoints so failed runs can be resumed
+        self.checkpoint_settings = get_checkpoint_settings(self.config)
+        self.checkpointer = create_checkpointer(self.config)
+        self.last_run_id = None
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
 
-        # State tracking
+        # State of the most recently finished run; concurrent runs keep their own
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            self.config.get("parallel_analysts", False),
+            self.checkpointer,
+        )
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
@@ -129,6 +178,7 @@ class TradingAgentsGraph:
                     get_stock_data,
                     # Technical indicators
                     get_indicators,
+                    get_indicators_batch,
                 ]
             ),
             "social": ToolNode(
@@ -157,44 +207,259 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def _start_run(self, company_name, trade_date, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Bookkeeping for one run, kept off the instance so overlapping runs stay apart."""
+        run = {
+            "ticker": company_name,
+            "trade_date": trade_date,
+            "run_id": run_id,
+            "start": time.perf_counter(),
+            "metrics": None,
+        }
+        if self.instrumentation_settings["enabled"]:
+            run["metrics"] = RunMetrics(company_name, trade_date, run_id)
+        return run
 
-        self.ticker = company_name
+    def _finish_run(self, run: Dict[str, Any], final_state):
+        # The most recently finished run is the one reflect_and_remember uses
+        self.ticker = run["ticker"]
+        self.curr_state = final_state
+        if self.prefetcher is not None:
+            self._report_prefetch(run, time.perf_counter() - run["start"])
+        if run["metrics"] is not None:
+            self._attach_metrics(run["metrics"], final_state)
 
-        # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
-        args = self.propagator.get_graph_args()
+        # Log state
+        self._log_state(run["trade_date"], final_state, run["ticker"])
 
+        if self.checkpointer is not None and not self.checkpoint_settings["keep_completed"]:
+            self.checkpointer.delete_thread(run["run_id"])
+
+    def _new_run_id(self, run_id: Optional[str]) -> Optional[str]:
+        """Checkpoint thread for a run; generated unless the caller picked one."""
+        if self.checkpointer is None:
+            return run_id
+        run_id = run_id or uuid.uuid4().hex
+        self.last_run_id = run_id
+        return run_id
+
+    def _checkpoint(self, run_id: str):
+        if self.checkpointer is None:
+            raise ValueError("Checkpointing is disabled; set config['checkpoint']['enabled'] to resume runs")
+        return self.graph.get_state({"configurable": {"thread_id": run_id}})
+
+    def has_checkpoint(self, run_id: str) -> bool:
+        """Whether run ``run_id`` has saved state that ``resume`` can continue from."""
+        return self.checkpointer is not None and bool(self._checkpoint(run_id).values)
+
+    def _run_graph(self, graph_input, args):
         if self.debug:
             # Debug mode with tracing
             trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
+            for chunk in self.graph.stream(graph_input, **args):
                 if len(chunk["messages"]) == 0:
                     pass
                 else:
                     chunk["messages"][-1].pretty_print()
                     trace.append(chunk)
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+            return trace[-1]
 
-        # Store current state for reflection
-        self.curr_state = final_state
+        # Standard mode without tracing
+        return self.graph.invoke(graph_input, **args)
 
-        # Log state
-        self._log_state(trade_date, final_state)
+    async def _arun_graph(self, graph_input, args):
+        if self.debug:
+            trace = []
+            async for chunk in self.graph.astream(graph_input, **args):
+                if len(chunk["messages"]) == 0:
+                    pass
+                else:
+                    chunk["messages"][-1].pretty_print()
+                    trace.append(chunk)
+
+            return trace[-1]
+
+        return await self.graph.ainvoke(graph_input, **args)
+
+    def propagate(self, company_name, trade_date, run_id: Optional[str] = None):
+        """Run the trading agents graph for a company on a specific date.
+
+        With checkpointing enabled, the state is saved after every node under
+        ``run_id`` (generated when omitted and kept in ``last_run_id``), so a
+        run that fails can be continued with ``resume(run_id)``.
+        """
+
+        run_id = self._new_run_id(run_id)
+        run = self._start_run(company_name, trade_date, run_id)
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args(run_id)
+
+        with collect(run["metrics"]):
+            final_state = self._run_graph(init_agent_state, args)
+            decision = self.process_signal(final_state["final_trade_decision"])
+
+        self._finish_run(run, final_state)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, decision
+
+    def resume(self, run_id: str):
+        """Continue a failed run from its last completed node.
+
+        Nodes that finished before the failure are not run again. Returns
+        ``(final_state, decision)`` like ``propagate``.
+
+        Raises:
+            ValueError: If checkpointing is disabled or ``run_id`` has no saved state
+        """
+        snapshot = self._checkpoint(run_id)
+        if not snapshot.values:
+            raise ValueError(f"No checkpoint saved for run '{run_id}'")
+
+        run = self._start_run(snapshot.values["company_of_interest"], snapshot.values["trade_date"], run_id)
+        with collect(run["metrics"]):
+            if snapshot.next:
+                final_state = self._run_graph(None, self.propagator.get_graph_args(run_id))
+            else:
+                # The run had finished; only its bookkeeping is left
+                final_state = snapshot.values
+            decision = self.process_signal(final_state["final_trade_decision"])
+
+        self._finish_run(run, final_state)
+        return final_state, decision
+
+    async def apropagate(self, company_name, trade_date, run_id: Optional[str] = None):
+        """Async version of ``propagate``, driven by ``ainvoke``.
+
+        Agents call their LLM clients through ``ainvoke``. Tools and memory
+        lookups, whose clients block, run on worker threads. Several runs may
+        await this concurrently on one instance; each keeps its own state.
+        """
+        run_id = self._new_run_id(run_id)
+        run = self._start_run(company_name, trade_date, run_id)
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args(run_id)
+
+        with collect(run["metrics"]):
+            final_state = await self._arun_graph(init_agent_state, args)
+            decision = await self.signal_processor.aprocess_signal(final_state["final_trade_decision"])
+
+        # Writes the state log
+        await asyncio.to_thread(self._finish_run, run, final_state)
+        return final_state, decision
+
+    async def aresume(self, run_id: str):
+        """Async version of ``resume``."""
+        snapshot = await asyncio.to_thread(self._checkpoint, run_id)
+        if not snapshot.values:
+            raise ValueError(f"No checkpoint saved for run '{run_id}'")
+
+        run = self._start_run(snapshot.values["company_of_interest"], snapshot.values["trade_date"], run_id)
+        with collect(run["metrics"]):
+            if snapshot.next:
+                final_state = await self._arun_graph(None, self.propagator.get_graph_args(run_id))
+            else:
+                final_state = snapshot.values
+            decision = await self.signal_processor.aprocess_signal(final_state["final_trade_decision"])
+
+        await asyncio.to_thread(self._finish_run, run, final_state)
+        return final_state, decision
+
+    async def apropagate_many(
+        self,
+        runs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Tuple[str, str, Any, Optional[str]]]:
+        """Run ``apropagate`` for each ``(ticker, trade_date)``, at most ``max_concurrency`` at once.
+
+        All runs share this instance's graph, LLM clients, memories and data
+        caches. Results are yielded as ``(ticker, trade_date, final_state,
+        decision)`` in completion order. With ``return_exceptions``, a failed
+        run yields ``(ticker, trade_date, exception, None)`` and the others go
+        on; otherwise the first failure cancels the runs still pending.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_one(ticker, trade_date):
+            async with semaphore:
+                try:
+                    final_state, decision = await self.apropagate(ticker, trade_date)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    return ticker, trade_date, e, None
+            return ticker, trade_date, final_state, decision
+
+        tasks = [asyncio.ensure_future(run_one(ticker, trade_date)) for ticker, trade_date in runs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def propagate_many(
+        self,
+        runs: Iterable[Tuple[str, str]],
+        max_concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[str, str, Any, Optional[str]]]:
+        """Blocking ``apropagate_many``: yields results as runs complete.
+
+        Runs on a private event loop, so it must not be called from a thread
+        that is already running one; use ``apropagate_many`` there.
+        """
+        loop = asyncio.new_event_loop()
+        results = self.apropagate_many(runs, max_concurrency, return_exceptions)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    def _report_prefetch(self, run: Dict[str, Any], run_seconds: float):
+        """Summarize how much wall time the prefetch stage took off this run."""
+        report = self.prefetcher.settle(run["ticker"], run["trade_date"])
+        if report is None:
+            return
+        report["run_seconds"] = run_seconds
+        # The run would have taken run_seconds + saved_seconds without the prefetch
+        without = run_seconds + report["saved_seconds"]
+        report["saved_fraction"] = report["saved_seconds"] / without if without > 0 else 0.0
+        self.prefetch_report = report
+        print(
+            f"Prefetch saved {report['saved_seconds']:+.1f}s of {without:.1f}s "
+            f"({report['saved_fraction']:.0%}): {report['cache_hits']} prefetched call(s) served from cache "
+            f"worth {report['served_seconds']:.1f}s, minus {report['wall_seconds']:.1f}s spent prefetching"
+        )
 
-    def _log_state(self, trade_date, final_state):
+    def _attach_metrics(self, metrics: RunMetrics, final_state):
+        """Put the run's per-node metrics on its final state (``final_state["metrics"]``) and export them."""
+        summary = metrics.summary()
+        final_state["metrics"] = summary
+        self.last_metrics = summary
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.export(summary)
+
+    def _log_state(self, trade_date, final_state, ticker=None):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        ticker = ticker or self.ticker
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -223,35 +488,48 @@ class TradingAgentsGraph:
             "investment_plan": final_state["investment_plan"],
             "final_trade_decision": final_state["final_trade_decision"],
         }
+        if "metrics" in final_state:
+            entry["metrics"] = final_state["metrics"]
+
+        self.log_states_dict[str(trade_date)] = entry
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        # Save to file; each run writes only its own entry
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump({str(trade_date): entry}, f, indent=4)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        ``final_state`` defaults to the most recently finished run; pass the
+        state returned by a specific run when several were started together.
+        """
+        final_state = final_state or self.curr_state
         self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
+            final_state, returns_losses, self.bull_memory
         )
         self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
+            final_state, returns_losses, self.bear_memory
         )
         self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
+            final_state, returns_losses, self.trader_memory
         )
         self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+            final_state, returns_losses, self.invest_judge_memory
         )
         self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+            final_state, returns_losses, self.risk_manager_memory
         )
 
+    def get_llm_cache_stats(self) -> Dict[str, dict]:
+        """LLM cache hits, misses and writes per graph node ({} when the cache is off)."""
+        return self.llm_cache.stats() if self.llm_cache is not None else {}
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)